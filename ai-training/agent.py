@@ -1,16 +1,82 @@
 import random
 from collections import defaultdict
-from typing import Optional
+from multiprocessing import shared_memory
+from typing import Optional, Union
+
+import numpy as np
+from environment import POSITION_COUNT, position_keys
+
+_key_indices: Optional[dict[int, int]] = None
+
+
+def key_indices() -> dict[int, int]:
+    """Position index of every Zobrist state key, built on first use."""
+    global _key_indices
+    if _key_indices is None:
+        _key_indices = {key: index for index, key in enumerate(position_keys())}
+    return _key_indices
+
+
+class SharedQValues:
+    """
+    Q-values in a zero-initialised float64 [3**9, 9] array in shared memory, looked up by
+    (state key, action) like the q_values defaultdict. Pass name to attach to a table
+    another process created; pickling attaches the same way. Processes read and update
+    entries without locks (Hogwild): two updates racing on one entry can lose one of them,
+    which tabular Q-learning shrugs off.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        self._owner = name is None
+        self._memory = shared_memory.SharedMemory(
+            name=name, create=self._owner, size=POSITION_COUNT * 9 * 8 if self._owner else 0
+        )
+        self._values = self._memory.buf.cast("d")
+        self._indices = key_indices()
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __getitem__(self, key: tuple[int, int]) -> float:
+        state, action = key
+        return self._values[self._indices[state] * 9 + action]
+
+    def __setitem__(self, key: tuple[int, int], value: float) -> None:
+        state, action = key
+        self._values[self._indices[state] * 9 + action] = value
+
+    def __reduce__(self):
+        return SharedQValues, (self.name,)
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the table as a [position index, action] array."""
+        return np.frombuffer(self._values, dtype=np.float64).reshape(POSITION_COUNT, 9).copy()
+
+    def close(self) -> None:
+        """Detach; the creating process also frees the shared block."""
+        self._values.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
 
 
 class QAgent:
-    def __init__(self, epsilon: float = 0.0, alpha: float = 0.0, gamma: float = 0.0):
-        self.q_values = defaultdict(float)
+    def __init__(
+        self,
+        epsilon: float = 0.0,
+        alpha: float = 0.0,
+        gamma: float = 0.0,
+        shared: Optional[SharedQValues] = None,
+    ):
+        self.q_values: Union[defaultdict, SharedQValues] = (
+            defaultdict(float) if shared is None else shared
+        )
         self.epsilon = epsilon
         self.learning_rate = alpha
         self.discount_factor = gamma
 
-    def select_action(self, state: str, legal_actions: list[int]) -> Optional[int]:
+    def select_action(self, state: int, legal_actions: list[int]) -> Optional[int]:
         if not legal_actions:
             return None
 
@@ -24,7 +90,7 @@ class QAgent:
 
         return random.choice(best_actions)
 
-    def greedy_action(self, state: str, legal_actions: list[int]) -> Optional[int]:
+    def greedy_action(self, state: int, legal_actions: list[int]) -> Optional[int]:
         if not legal_actions:
             return None
 
@@ -39,10 +105,10 @@ class QAgent:
 
     def update_q_values(
         self,
-        state: str,
+        state: int,
         action: int,
         reward: float,
-        next_state: str,
+        next_state: int,
         legal_next_actions: list[int],
         terminal: bool,
     ) -> None:
@@ -57,3 +123,17 @@ class QAgent:
         self.q_values[(state, action)] += self.learning_rate * (
             target_value - self.q_values[(state, action)]
         )
+
+    def load_table(self, table: np.ndarray) -> None:
+        """Replace q_values with the non-zero entries of a [position index, action] table."""
+        keys = position_keys()
+        indices, actions = np.nonzero(table)
+        self.q_values = defaultdict(
+            float,
+            {
+                (keys[index], action): value
+                for index, action, value in zip(
+                    indices.tolist(), actions.tolist(), table[indices, actions].tolist()
+                )
+            },
+        )
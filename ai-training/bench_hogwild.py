@@ -0,0 +1,55 @@
+"""Hogwild shared-memory training versus the single-process scalar loop.
+
+Prints episodes per second, final greedy win rate against random, and a convergence
+curve: the mean training reward in each tenth of the run.
+
+Run from the repo root: python ai-training/bench_hogwild.py [MAX_WORKERS]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+from bench_training import HYPERPARAMETERS, win_rate
+from environment import TicTacToeEnvironment
+from hogwild import run_hogwild_q_learning
+from train import run_q_learning_loop
+
+SLICES = 10
+
+
+def curve(rewards: list) -> str:
+    size = len(rewards) // SLICES
+    return " ".join(f"{sum(rewards[i * size : (i + 1) * size]) / size:+.2f}" for i in range(SLICES))
+
+
+def report(label: str, train, episodes: int) -> None:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        agent, rewards = train()
+    rate = episodes / (time.perf_counter() - start)
+    print(f"{label:>16}: {rate:8,.0f} episodes/s  win rate {win_rate(agent):.3f}")
+    print(f"{'':>16}  reward by tenth: {curve(rewards)}")
+
+
+def run(max_workers: int, episodes: int = 80_000) -> None:
+    print(f"{os.cpu_count()} CPUs, {episodes:,} episodes per run")
+    random.seed(0)
+    report(
+        "single process",
+        lambda: run_q_learning_loop(TicTacToeEnvironment(), episodes, **HYPERPARAMETERS),
+        episodes,
+    )
+    for workers in range(1, max_workers + 1):
+        report(
+            f"hogwild x{workers}",
+            lambda: run_hogwild_q_learning(episodes, workers, seed=0, **HYPERPARAMETERS),
+            episodes,
+        )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else max(4, os.cpu_count() or 1))
@@ -0,0 +1,32 @@
+"""Parallel training scaling: episodes per second and final win rate for 1..N workers.
+
+Run from the repo root: python ai-training/bench_parallel.py [MAX_WORKERS]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from bench_training import HYPERPARAMETERS, win_rate
+from parallel import run_parallel_q_learning
+
+
+def run(max_workers: int, episodes: int = 400_000) -> None:
+    print(f"{os.cpu_count()} CPUs, {episodes:,} episodes per run")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            agent, _ = run_parallel_q_learning(episodes, workers, seed=0, **HYPERPARAMETERS)
+        rate = episodes / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(
+            f"{workers:2d} workers: {rate:10,.0f} episodes/s ({rate / baseline:.2f}x)"
+            f"  win rate {win_rate(agent):.3f}"
+        )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else max(4, os.cpu_count() or 1))
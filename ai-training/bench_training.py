@@ -0,0 +1,48 @@
+"""Training episodes per second: scalar environment versus the vectorized one.
+
+Run from the repo root: python ai-training/bench_training.py
+"""
+
+import contextlib
+import io
+import random
+import time
+
+from environment import TicTacToeEnvironment, VectorTicTacToeEnvironment
+from evaluation import play_greedy_episode
+from train import run_q_learning_loop
+
+HYPERPARAMETERS = dict(alpha=0.2, gamma=0.9, epsilon=0.3, epsilon_min=0.2, epsilon_decay=0.999)
+NUM_ENVS = (64, 1024, 4096)
+
+
+def win_rate(agent, games: int = 2000, seed: int = 0) -> float:
+    """Share of greedy games won against the random opponent."""
+    random.seed(seed)
+    agent.epsilon = 0.0
+    environment = TicTacToeEnvironment()
+    return sum(play_greedy_episode(environment, agent) == 1 for _ in range(games)) / games
+
+
+def train(environment, episodes: int) -> tuple[float, float]:
+    """(episodes per second, final win rate) for one training run."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        agent, _ = run_q_learning_loop(environment, episodes=episodes, **HYPERPARAMETERS)
+    return episodes / (time.perf_counter() - start), win_rate(agent)
+
+
+def run(episodes: int = 80_000) -> None:
+    random.seed(0)
+    baseline, wins = train(TicTacToeEnvironment(), episodes)
+    print(f"{'scalar':>12}: {baseline:10,.0f} episodes/s  win rate {wins:.3f}")
+    for num_envs in NUM_ENVS:
+        rate, wins = train(VectorTicTacToeEnvironment(num_envs, seed=0), episodes)
+        print(
+            f"{f'vector {num_envs}':>12}: {rate:10,.0f} episodes/s  win rate {wins:.3f}"
+            f"  ({rate / baseline:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    run()
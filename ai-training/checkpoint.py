@@ -0,0 +1,178 @@
+"""Incremental, crash-safe checkpoints for the vectorized training loop.
+
+A run's directory holds numbered checkpoint-NNNNNN.npz files. Each one stores only the
+Q-table entries that changed since the previous file and the rewards of episodes finished
+since then, plus everything needed to continue exactly where it was taken: epsilon, the
+in-progress boards and the environment's RNG state. Files are written on a background
+thread to a temporary name and renamed into place, so a crash can lose at most the
+checkpoint being written, never corrupt an earlier one. Loading replays every file in
+order.
+"""
+
+import json
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from environment import POSITION_COUNT, VectorTicTacToeEnvironment
+
+PREFIX = "checkpoint-"
+SUFFIX = ".npz"
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class TrainingState:
+    q_table: np.ndarray
+    epsilon: float
+    rewards: list
+    environment: VectorTicTacToeEnvironment
+    settings: dict
+
+
+def checkpoint_files(directory: PathLike) -> list[Path]:
+    return sorted(Path(directory).glob(f"{PREFIX}*{SUFFIX}"))
+
+
+def load_checkpoint(directory: PathLike) -> TrainingState:
+    """Rebuild the training state from every checkpoint in directory."""
+    files = checkpoint_files(directory)
+    if not files:
+        raise FileNotFoundError(f"No checkpoints in {directory}")
+
+    q_table = np.zeros(POSITION_COUNT * 9)
+    rewards: list[float] = []
+    for path in files:
+        with np.load(path) as data:
+            q_table[data["entries"]] = data["values"]
+            # Stored as int8; training appends float rewards, so read them back as floats.
+            rewards.extend(data["rewards"].astype(np.float64).tolist())
+            meta = json.loads(str(data["meta"]))
+            boards, states = data["boards"], data["states"]
+
+    environment = VectorTicTacToeEnvironment(len(boards))
+    environment.boards[:] = boards
+    environment.states[:] = states
+    environment.rng.bit_generator.state = meta["rng_state"]
+    return TrainingState(
+        q_table.reshape(POSITION_COUNT, 9), meta["epsilon"], rewards, environment, meta["settings"]
+    )
+
+
+class Checkpointer:
+    """
+    Writes a checkpoint every `every` finished episodes from a background thread.
+    A fresh run (no resume_from) refuses a directory that already holds checkpoints,
+    since loading would replay them under its own; fresh deletes them instead.
+    """
+
+    def __init__(
+        self,
+        directory: PathLike,
+        settings: dict,
+        every: int = 10_000,
+        resume_from: Optional[TrainingState] = None,
+        fresh: bool = False,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.settings = settings
+        self.every = every
+        self.written = 0
+
+        if resume_from is None:
+            existing = checkpoint_files(self.directory)
+            if existing and not fresh:
+                raise FileExistsError(f"{self.directory} already holds {len(existing)} checkpoints")
+            for path in existing:
+                path.unlink()
+            self._previous = np.zeros(POSITION_COUNT * 9)
+            self._saved_rewards = 0
+            self._sequence = 0
+        else:
+            self._previous = resume_from.q_table.reshape(-1).copy()
+            self._saved_rewards = len(resume_from.rewards)
+            self._sequence = len(checkpoint_files(self.directory))
+        self._next_due = (self._saved_rewards // every + 1) * every
+
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._writer = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._writer.start()
+
+    def maybe_save(
+        self,
+        q_table: np.ndarray,
+        epsilon: float,
+        rewards: list,
+        environment: VectorTicTacToeEnvironment,
+    ) -> None:
+        """Checkpoint if another `every` episodes have finished since the last one."""
+        if len(rewards) >= self._next_due:
+            self.save(q_table, epsilon, rewards, environment)
+
+    def save(
+        self,
+        q_table: np.ndarray,
+        epsilon: float,
+        rewards: list,
+        environment: VectorTicTacToeEnvironment,
+    ) -> None:
+        """Snapshot what changed since the last checkpoint and queue it for writing."""
+        if self._error is not None:
+            raise RuntimeError("Writing a checkpoint failed") from self._error
+
+        flat = q_table.reshape(-1)
+        entries = np.flatnonzero(flat != self._previous)
+        values = flat[entries]
+        self._previous[entries] = values
+        meta = {
+            "epsilon": epsilon,
+            "episodes": len(rewards),
+            "rng_state": environment.rng.bit_generator.state,
+            "settings": self.settings,
+        }
+        self._queue.put(
+            {
+                "entries": entries,
+                "values": values,
+                "rewards": np.array(rewards[self._saved_rewards :], dtype=np.int8),
+                "boards": environment.boards.copy(),
+                "states": environment.states.copy(),
+                "meta": np.array(json.dumps(meta)),
+            }
+        )
+        self._saved_rewards = len(rewards)
+        self._next_due = (len(rewards) // self.every + 1) * self.every
+
+    def close(self) -> None:
+        """Wait for queued checkpoints to reach disk and stop the writer."""
+        self._queue.put(None)
+        self._writer.join()
+        if self._error is not None:
+            raise RuntimeError("Writing a checkpoint failed") from self._error
+
+    def _run(self) -> None:
+        while True:
+            arrays = self._queue.get()
+            if arrays is None:
+                return
+            if self._error is not None:
+                continue
+            self._sequence += 1
+            path = self.directory / f"{PREFIX}{self._sequence:06d}{SUFFIX}"
+            scratch = path.with_name(path.name + ".tmp")
+            try:
+                with open(scratch, "wb") as file:
+                    np.savez_compressed(file, **arrays)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(scratch, path)
+                self.written += 1
+            except OSError as error:
+                self._error = error
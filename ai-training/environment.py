@@ -1,24 +1,59 @@
+import random
 from typing import Optional
 
+import numpy as np
+
+# Must match ttt_core.domain.zobrist so saved Q-tables line up with the game's board keys.
+ZOBRIST_SEED = 0x7A0B15
+_ZOBRIST_RNG = random.Random(ZOBRIST_SEED)
+ZOBRIST_TABLE = tuple(
+    {"X": _ZOBRIST_RNG.getrandbits(64), "O": _ZOBRIST_RNG.getrandbits(64)} for _ in range(9)
+)
+
+# Dense tables index positions in base 3: cell i adds 3**i times 0 (empty), 1 (X) or 2 (O).
+POSITION_COUNT = 3**9
+CELL_POWERS = 3 ** np.arange(9, dtype=np.int64)
+WIN_LINES = np.array(
+    [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+)
+EMPTY, X_CODE, O_CODE = 0, 1, 2
+
+_position_keys: Optional[list[int]] = None
+
+
+def position_keys() -> list[int]:
+    """Zobrist key of every base-3 position index, built on first use."""
+    global _position_keys
+    if _position_keys is None:
+        digits = np.arange(POSITION_COUNT)[:, None] // CELL_POWERS % 3
+        keys = np.zeros(POSITION_COUNT, dtype=np.uint64)
+        for cell, pair in enumerate(ZOBRIST_TABLE):
+            keys[digits[:, cell] == X_CODE] ^= np.uint64(pair["X"])
+            keys[digits[:, cell] == O_CODE] ^= np.uint64(pair["O"])
+        _position_keys = keys.tolist()
+    return _position_keys
+
 
 class TicTacToeEnvironment:
     def __init__(self):
         self.reset()
 
-    def reset(self) -> str:
+    def reset(self) -> int:
         self.board = [" "] * 9
+        self.state_key = 0
         self.current_player = "X"
         self.is_done = False
         self.winner = None
         return self.get_state()
 
-    def get_state(self) -> str:
-        return "".join(self.board)
+    def get_state(self) -> int:
+        """Zobrist key of the board, XOR-updated by step() instead of re-joining cells."""
+        return self.state_key
 
     def legal_actions(self) -> list[int]:
         return [index for index, cell in enumerate(self.board) if cell == " "]
 
-    def step(self, action: int) -> tuple[str, float, bool]:
+    def step(self, action: int) -> tuple[int, float, bool]:
         """
         Apply 'action' for the current player, return (next_state, reward_for_X, done)
         """
@@ -27,6 +62,7 @@ class TicTacToeEnvironment:
             raise ValueError("Invalid action")
 
         self.board[action] = self.current_player
+        self.state_key ^= ZOBRIST_TABLE[action][self.current_player]
 
         self.winner = self._check_winner()
 
@@ -78,3 +114,80 @@ class TicTacToeEnvironment:
         print(f"{cell(3)} | {cell(4)} | {cell(5)}")
         print("--+---+--")
         print(f"{cell(6)} | {cell(7)} | {cell(8)}")
+
+
+class VectorTicTacToeEnvironment:
+    """N games in lockstep on an (N, 9) int8 array, stepped from the agent's (O) side.
+
+    X is the random opponent, as in train.play_one_training_episode: reset() plays X's
+    opening in every game, and step() plays O's action in every game followed by a
+    random X reply wherever the game goes on. Finished games are reset (with a fresh X
+    opening) before step() returns, so get_states() and legal_mask() always describe
+    positions where O is to move. States are base-3 position indices.
+    """
+
+    def __init__(self, num_envs: int = 256, seed: Optional[int] = None):
+        self.num_envs = num_envs
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.zeros((num_envs, 9), dtype=np.int8)
+        self.states = np.zeros(num_envs, dtype=np.int64)
+        self.reset()
+
+    def reset(self) -> np.ndarray:
+        self.boards[:] = EMPTY
+        self.states[:] = 0
+        self._play_random(np.arange(self.num_envs), X_CODE)
+        return self.get_states()
+
+    def get_states(self) -> np.ndarray:
+        return self.states.copy()
+
+    def legal_mask(self) -> np.ndarray:
+        return self.boards == EMPTY
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Apply O's actions, then X's random replies; return (next_states, rewards, dones).
+
+        next_states are the positions each game reached, before any auto-reset.
+        Rewards follow TicTacToeEnvironment: +1 O wins, -1 X wins, 0 otherwise.
+        """
+
+        games = np.arange(self.num_envs)
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_envs,) or (self.boards[games, actions] != EMPTY).any():
+            raise ValueError("Invalid action")
+
+        self._place(games, actions, O_CODE)
+        o_won = self._has_line(games, O_CODE)
+        dones = o_won | ~(self.boards == EMPTY).any(axis=1)
+        rewards = o_won.astype(np.float64)
+
+        live = games[~dones]
+        self._play_random(live, X_CODE)
+        x_won = self._has_line(live, X_CODE)
+        x_done = x_won | ~(self.boards[live] == EMPTY).any(axis=1)
+        rewards[live[x_won]] = -1.0
+        dones[live[x_done]] = True
+
+        next_states = self.states.copy()
+        finished = games[dones]
+        if finished.size:
+            self.boards[finished] = EMPTY
+            self.states[finished] = 0
+            self._play_random(finished, X_CODE)
+        return next_states, rewards, dones
+
+    def _place(self, games: np.ndarray, cells: np.ndarray, code: int) -> None:
+        self.boards[games, cells] = code
+        self.states[games] += code * CELL_POWERS[cells]
+
+    def _play_random(self, games: np.ndarray, code: int) -> None:
+        if games.size == 0:
+            return
+        keys = self.rng.random((games.size, 9))
+        keys[self.boards[games] != EMPTY] = -1.0
+        self._place(games, keys.argmax(axis=1), code)
+
+    def _has_line(self, games: np.ndarray, code: int) -> np.ndarray:
+        return (self.boards[games][:, WIN_LINES] == code).all(axis=2).any(axis=1)
@@ -1,7 +1,10 @@
 import random
+from typing import Optional
 
+import numpy as np
 from agent import QAgent
-from environment import TicTacToeEnvironment
+from environment import TicTacToeEnvironment, VectorTicTacToeEnvironment
+from train import select_actions
 
 
 def play_greedy_episode(
@@ -37,6 +40,25 @@ def play_greedy_episode(
     return reward
 
 
+def greedy_outcome_rates(
+    q_table: np.ndarray, games: int = 2000, num_envs: int = 1024, seed: Optional[int] = None
+) -> tuple[float, float, float]:
+    """(win, draw, loss) rates of greedy play from a [position index, action] table vs random."""
+    environment = VectorTicTacToeEnvironment(min(num_envs, games), seed=seed)
+    outcomes: list[float] = []
+    while len(outcomes) < games:
+        states = environment.get_states()
+        actions = select_actions(q_table, states, environment.legal_mask(), 0.0, environment.rng)
+        _, rewards, dones = environment.step(actions)
+        outcomes.extend(rewards[dones].tolist())
+    outcomes = outcomes[:games]
+    return (
+        outcomes.count(1.0) / games,
+        outcomes.count(0.0) / games,
+        outcomes.count(-1.0) / games,
+    )
+
+
 def human_vs_agent(environment: TicTacToeEnvironment, agent: QAgent) -> None:
     """
     Human plays O and moves first.
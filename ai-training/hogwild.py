@@ -0,0 +1,110 @@
+"""Hogwild training: several processes run the scalar Q-learning loop on one shared table.
+
+Every worker plays its own games against the random opponent with a QAgent whose
+q_values live in a SharedQValues block, and applies update_q_values straight to that
+block with no locks and no copying between processes. Updates that race on the same
+entry may overwrite each other, and the interleaving depends on scheduling, so runs with
+more than one worker are not reproducible even with a fixed seed.
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from agent import QAgent, SharedQValues
+from environment import TicTacToeEnvironment
+from train import play_one_training_episode, x_vals, y_vals
+
+
+def worker_seed(seed: int, worker: int) -> int:
+    return int(np.random.SeedSequence([seed, worker]).generate_state(1)[0])
+
+
+def run_worker(
+    table: SharedQValues,
+    episodes: int,
+    seed: int,
+    alpha: float,
+    gamma: float,
+    epsilon: float,
+    epsilon_min: float,
+    epsilon_decay: float,
+) -> tuple[list, list]:
+    """Train on the shared table; returns (finish time, reward) of each episode."""
+    random.seed(seed)
+    environment = TicTacToeEnvironment()
+    agent = QAgent(epsilon=epsilon, alpha=alpha, gamma=gamma, shared=table)
+    finished, rewards = [], []
+    try:
+        for _ in range(episodes):
+            rewards.append(play_one_training_episode(environment, agent, opponent="random"))
+            finished.append(time.perf_counter())
+            agent.epsilon = max(epsilon_min, agent.epsilon * epsilon_decay)
+    finally:
+        table.close()
+    return finished, rewards
+
+
+def run_hogwild_q_learning(
+    episodes: int = 80_000,
+    workers: int = 2,
+    seed: int = 0,
+    alpha: float = 0.1,
+    gamma: float = 0.95,
+    epsilon: float = 0.2,
+    epsilon_min: float = 0.01,
+    epsilon_decay: float = 0.995,
+    log_slices: int = 20,
+    avg_window_frac: float = 0.2,
+) -> tuple[QAgent, list]:
+    """
+    Train with `workers` processes sharing one table (in-process for a single worker).
+    Each worker decays epsilon by epsilon_decay**workers per episode, so the schedule
+    follows the total episode count as in the serial loop. Rewards come back in the
+    order episodes finished across all workers.
+    """
+
+    table = SharedQValues()
+    shares = [episodes // workers + (worker < episodes % workers) for worker in range(workers)]
+    jobs = [
+        (
+            table,
+            share,
+            worker_seed(seed, worker),
+            alpha,
+            gamma,
+            epsilon,
+            epsilon_min,
+            epsilon_decay**workers,
+        )
+        for worker, share in enumerate(shares)
+    ]
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as executor:
+                results = list(executor.map(run_worker, *zip(*jobs)))
+        else:
+            results = [run_worker(SharedQValues(table.name), *jobs[0][1:])]
+        q_table = table.snapshot()
+    finally:
+        table.close()
+
+    finished = np.concatenate([result[0] for result in results])
+    played = np.concatenate([result[1] for result in results])
+    rewards = played[np.argsort(finished, kind="stable")].tolist()
+
+    averaging_window = max(5, int(episodes * avg_window_frac))
+    log_every = max(1, episodes // log_slices)
+    for episode_index in range(log_every, episodes + 1, log_every):
+        window = rewards[max(0, episode_index - averaging_window) : episode_index]
+        average_reward = sum(window) / len(window)
+        print(f"Episode {episode_index:5d} | avg_reward({averaging_window})={average_reward:.3f}")
+        x_vals.append(episode_index)
+        y_vals.append(average_reward)
+
+    agent = QAgent(
+        epsilon=max(epsilon_min, epsilon * epsilon_decay**episodes), alpha=alpha, gamma=gamma
+    )
+    agent.load_table(q_table)
+    return agent, rewards
@@ -1,22 +1,105 @@
+import argparse
+import os
 import pickle
 from pathlib import Path
 
-from environment import TicTacToeEnvironment
+from checkpoint import Checkpointer, load_checkpoint
+from environment import TicTacToeEnvironment, VectorTicTacToeEnvironment
 from evaluation import play_greedy_episode
+from hogwild import run_hogwild_q_learning
+from parallel import run_parallel_q_learning
 from plotting import av_reward_plotter
-from train import run_q_learning_loop, x_vals, y_vals
+from search import load_best_params
+from train import run_vector_q_learning_loop, x_vals, y_vals
+
+HYPERPARAMETERS = dict(
+    alpha=0.2,
+    gamma=0.9,
+    epsilon=0.3,
+    epsilon_min=0.2,
+    epsilon_decay=0.999,
+)
 
 if __name__ == "__main__":
-    environment = TicTacToeEnvironment()
-    agent, rewards = run_q_learning_loop(
-        environment,
-        episodes=80000,
-        alpha=0.2,
-        gamma=0.9,
-        epsilon=0.3,
-        epsilon_min=0.2,
-        epsilon_decay=0.999,
+    parser = argparse.ArgumentParser(description="Train the Q-learning agent.")
+    parser.add_argument("--episodes", type=int, default=80000)
+    parser.add_argument(
+        "--workers", type=int, default=1, help="actor processes; above 1 trains in parallel"
+    )
+    parser.add_argument(
+        "--hogwild", action="store_true", help="workers update one shared-memory table"
+    )
+    parser.add_argument(
+        "--params-from", help="train with the best hyperparameters of a search results.jsonl"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed for a reproducible run")
+    parser.add_argument(
+        "--checkpoint-dir", help="checkpoint single-process training to this directory"
+    )
+    parser.add_argument(
+        "--checkpoint-every", type=int, default=10000, help="episodes between checkpoints"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="continue the run saved in --checkpoint-dir"
     )
+    parser.add_argument(
+        "--fresh", action="store_true", help="delete the checkpoints already in --checkpoint-dir"
+    )
+    parser.add_argument("--save", metavar="NAME", help="save the model as models/NAME.pkl")
+    parser.add_argument(
+        "--overwrite-model", action="store_true", help="replace an existing --save model"
+    )
+    args = parser.parse_args()
+    if (args.resume or args.fresh) and not args.checkpoint_dir:
+        parser.error("--resume and --fresh need --checkpoint-dir")
+    if args.resume and args.fresh:
+        parser.error("--resume and --fresh exclude each other")
+    if args.checkpoint_dir and (args.workers > 1 or args.hogwild):
+        parser.error("checkpoints cover single-process runs only")
+    if args.params_from:
+        HYPERPARAMETERS = load_best_params(args.params_from)
+
+    environment = TicTacToeEnvironment()
+    if args.hogwild:
+        agent, rewards = run_hogwild_q_learning(
+            args.episodes, args.workers, seed=args.seed or 0, **HYPERPARAMETERS
+        )
+    elif args.workers > 1:
+        agent, rewards = run_parallel_q_learning(
+            args.episodes, args.workers, seed=args.seed or 0, **HYPERPARAMETERS
+        )
+    else:
+        if args.resume:
+            state = load_checkpoint(args.checkpoint_dir)
+            settings, training_environment = state.settings, state.environment
+            print(f"Resuming at episode {len(state.rewards)} of {settings['episodes']}")
+        else:
+            state = None
+            settings = {"episodes": args.episodes, **HYPERPARAMETERS}
+            training_environment = VectorTicTacToeEnvironment(num_envs=1024, seed=args.seed)
+        checkpointer = None
+        if args.checkpoint_dir:
+            try:
+                checkpointer = Checkpointer(
+                    args.checkpoint_dir,
+                    settings,
+                    every=args.checkpoint_every,
+                    resume_from=state,
+                    fresh=args.fresh,
+                )
+            except FileExistsError as error:
+                parser.error(f"{error}; pass --resume, --fresh or another --checkpoint-dir")
+        try:
+            agent, rewards = run_vector_q_learning_loop(
+                training_environment, checkpointer=checkpointer, resume=state, **settings
+            )
+        except KeyboardInterrupt:
+            if checkpointer is None:
+                raise
+            raise SystemExit("Interrupted; continue with --resume")
+        finally:
+            if checkpointer is not None:
+                checkpointer.close()
 
     agent.epsilon = 0.0
 
@@ -24,14 +107,14 @@ if __name__ == "__main__":
 
     av_reward_plotter(x_vals, y_vals)
 
-    save_results = input("Save Results (Y/N): ")
-    if save_results == "Y":
-        model_name = "another_agent"
-        model_path = Path(f"ai-training/models/{model_name}.pkl")
-
-        if model_path.exists():
+    if args.save:
+        model_path = Path(f"ai-training/models/{args.save}.pkl")
+        if model_path.exists() and not args.overwrite_model:
             print("Name already exists, Save Aborted!")
         else:
-            with open(f"{model_path}", "wb") as file:
+            # Write aside and rename, so a running game never reloads a half-written model.
+            scratch = model_path.with_name(model_path.name + ".tmp")
+            with open(scratch, "wb") as file:
                 pickle.dump(agent.q_values, file)
-            print("Saved!")
+            os.replace(scratch, model_path)
+            print(f"Saved {model_path}")
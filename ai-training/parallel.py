@@ -0,0 +1,135 @@
+"""Parallel Q-learning: actor processes play games, one learner merges what they learned.
+
+Training runs in synchronous rounds. Every actor starts a round from the learner's
+current table and trains its own copy for episodes_per_round games, on a vectorized
+environment seeded from (seed, actor, round). It then sends back the entries it changed,
+as sparse deltas. The learner adds the deltas in actor order, averaging an entry that
+several actors changed, and broadcasts the merged table with the next round. Nothing
+depends on which process finishes first, so a seed and worker count always reproduce
+the same table and reward history.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from agent import QAgent
+from environment import POSITION_COUNT, VectorTicTacToeEnvironment
+from train import vector_training_step, x_vals, y_vals
+
+
+@dataclass
+class ActorTask:
+    table: np.ndarray
+    actor: int
+    round_index: int
+    seed: int
+    episodes: int
+    num_envs: int
+    alpha: float
+    gamma: float
+    epsilon: float
+    epsilon_min: float
+    epsilon_decay: float
+
+
+@dataclass
+class ActorResult:
+    entries: np.ndarray
+    deltas: np.ndarray
+    rewards: np.ndarray
+
+
+def actor_seed(seed: int, actor: int, round_index: int) -> int:
+    return int(np.random.SeedSequence([seed, actor, round_index]).generate_state(1)[0])
+
+
+def run_actor(task: ActorTask) -> ActorResult:
+    """Train a private copy of the table for one round; return what changed and the rewards."""
+    q_table = task.table.copy()
+    environment = VectorTicTacToeEnvironment(
+        task.num_envs, seed=actor_seed(task.seed, task.actor, task.round_index)
+    )
+    epsilon = task.epsilon
+    rewards: list[float] = []
+    while len(rewards) < task.episodes:
+        finished = vector_training_step(q_table, environment, task.alpha, task.gamma, epsilon)
+        rewards.extend(finished.tolist())
+        epsilon = max(task.epsilon_min, epsilon * task.epsilon_decay ** len(finished))
+
+    changed = q_table.reshape(-1) - task.table.reshape(-1)
+    entries = np.flatnonzero(changed)
+    return ActorResult(entries, changed[entries], np.array(rewards[: task.episodes], np.int8))
+
+
+def merge_deltas(q_table: np.ndarray, results: list[ActorResult]) -> None:
+    """Apply every actor's deltas, averaged over the actors that touched each entry."""
+    entries = np.concatenate([result.entries for result in results])
+    deltas = np.concatenate([result.deltas for result in results])
+    counts = np.bincount(entries, minlength=q_table.size)
+    sums = np.bincount(entries, weights=deltas, minlength=q_table.size)
+    touched = np.flatnonzero(counts)
+    q_table.reshape(-1)[touched] += sums[touched] / counts[touched]
+
+
+def run_parallel_q_learning(
+    episodes: int = 80_000,
+    workers: int = 2,
+    seed: int = 0,
+    episodes_per_round: int = 8192,
+    num_envs: int = 1024,
+    alpha: float = 0.1,
+    gamma: float = 0.95,
+    epsilon: float = 0.2,
+    epsilon_min: float = 0.01,
+    epsilon_decay: float = 0.995,
+) -> tuple[QAgent, list]:
+    """
+    Train with `workers` actor processes (in-process for a single worker).
+    Epsilon follows the serial schedule: it decays once per episode played by any actor.
+    """
+
+    q_table = np.zeros((POSITION_COUNT, 9))
+    rewards: list[float] = []
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        round_index = 0
+        while len(rewards) < episodes:
+            share = min(episodes_per_round, -(-(episodes - len(rewards)) // workers))
+            tasks = [
+                ActorTask(
+                    q_table,
+                    actor,
+                    round_index,
+                    seed,
+                    share,
+                    num_envs,
+                    alpha,
+                    gamma,
+                    epsilon,
+                    epsilon_min,
+                    epsilon_decay,
+                )
+                for actor in range(workers)
+            ]
+            results = list(executor.map(run_actor, tasks) if executor else map(run_actor, tasks))
+            merge_deltas(q_table, results)
+
+            played = [reward for result in results for reward in result.rewards.tolist()]
+            rewards.extend(played)
+            epsilon = max(epsilon_min, epsilon * epsilon_decay ** len(played))
+            average_reward = sum(played) / len(played)
+            print(
+                f"Round {round_index:4d} | episodes={len(rewards):7d} | eps={epsilon:.3f} | "
+                f"avg_reward({len(played)})={average_reward:.3f}"
+            )
+            x_vals.append(len(rewards))
+            y_vals.append(average_reward)
+            round_index += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    agent = QAgent(epsilon=epsilon, alpha=alpha, gamma=gamma)
+    agent.load_table(q_table)
+    return agent, rewards[:episodes]
@@ -0,0 +1,224 @@
+"""Hyperparameter search with successive halving, trials run in a process pool.
+
+Every sampled configuration trains for min_episodes on the vectorized environment and
+is scored by greedy play against the random opponent (win rate, then average reward).
+The best 1/eta go on to the next rung, resuming their own table with eta times the
+episodes of the last rung, until one configuration is left. Seeds derive from
+(seed, config, rung), so a search is reproducible for any worker count.
+
+Run from the repo root: python ai-training/search.py [--configs 81] [--workers 4]
+Writes results.jsonl and results.csv (ranked) and best_agent.pkl to --out-dir.
+"""
+
+import argparse
+import csv
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from agent import QAgent
+from environment import POSITION_COUNT, VectorTicTacToeEnvironment
+from evaluation import greedy_outcome_rates
+from train import vector_training_step
+
+SEARCH_SPACE = {
+    "alpha": [0.05, 0.1, 0.2, 0.3, 0.4, 0.5],
+    "gamma": [0.8, 0.9, 0.95, 0.97, 0.99],
+    "epsilon": [0.1, 0.2, 0.3, 0.4, 0.6],
+    "epsilon_min": [0.01, 0.02, 0.05, 0.1, 0.2],
+    "epsilon_decay": [0.99, 0.995, 0.999, 0.9995, 0.9999],
+}
+
+
+@dataclass
+class Trial:
+    config_id: int
+    params: dict
+    rung: int = 0
+    episodes: int = 0
+    win_rate: float = 0.0
+    draw_rate: float = 0.0
+    loss_rate: float = 0.0
+    epsilon: Optional[float] = None
+    q_table: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def score(self) -> tuple[float, float, int]:
+        """Higher is better: win rate, then average reward, then the earlier config."""
+        return self.win_rate, self.win_rate - self.loss_rate, -self.config_id
+
+    def row(self) -> dict:
+        return {
+            "config_id": self.config_id,
+            "rung": self.rung,
+            "episodes": self.episodes,
+            **self.params,
+            "win_rate": self.win_rate,
+            "draw_rate": self.draw_rate,
+            "loss_rate": self.loss_rate,
+            "avg_reward": round(self.win_rate - self.loss_rate, 4),
+        }
+
+
+def sample_configs(count: int, seed: int) -> list[dict]:
+    """count distinct configurations drawn uniformly from SEARCH_SPACE."""
+    rng = np.random.default_rng(seed)
+    total = int(np.prod([len(values) for values in SEARCH_SPACE.values()]))
+    configs = []
+    for flat in rng.choice(total, size=min(count, total), replace=False).tolist():
+        params = {}
+        for name, values in SEARCH_SPACE.items():
+            flat, position = divmod(flat, len(values))
+            params[name] = values[position]
+        configs.append(params)
+    return configs
+
+
+def rung_seed(seed: int, config_id: int, rung: int) -> int:
+    return int(np.random.SeedSequence([seed, config_id, rung]).generate_state(1)[0])
+
+
+def run_trial(
+    trial: Trial, episodes: int, seed: int, eval_games: int, num_envs: int = 1024
+) -> Trial:
+    """Train trial's table for `episodes` more games, then score it."""
+    params = trial.params
+    q_table = trial.q_table if trial.q_table is not None else np.zeros((POSITION_COUNT, 9))
+    epsilon = params["epsilon"] if trial.epsilon is None else trial.epsilon
+    environment = VectorTicTacToeEnvironment(
+        num_envs, seed=rung_seed(seed, trial.config_id, trial.rung)
+    )
+
+    played = 0
+    while played < episodes:
+        finished = vector_training_step(
+            q_table, environment, params["alpha"], params["gamma"], epsilon
+        )
+        played += len(finished)
+        epsilon = max(params["epsilon_min"], epsilon * params["epsilon_decay"] ** len(finished))
+
+    win, draw, loss = greedy_outcome_rates(
+        q_table, eval_games, seed=rung_seed(seed + 1, trial.config_id, trial.rung)
+    )
+    return Trial(
+        trial.config_id,
+        params,
+        trial.rung,
+        trial.episodes + played,
+        win,
+        draw,
+        loss,
+        epsilon,
+        q_table,
+    )
+
+
+def successive_halving(
+    configs: list[dict],
+    min_episodes: int = 5000,
+    eta: int = 3,
+    eval_games: int = 2000,
+    workers: int = 1,
+    seed: int = 0,
+) -> list[Trial]:
+    """Run the search; returns every configuration's last result, best first.
+
+    Only the winner keeps its table; eliminated trials drop theirs to bound memory.
+    """
+    trials = [Trial(config_id, params) for config_id, params in enumerate(configs)]
+    results: list[Trial] = []
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        rung, budget = 0, min_episodes
+        while True:
+            start = time.perf_counter()
+            jobs = (
+                trials,
+                [budget] * len(trials),
+                [seed] * len(trials),
+                [eval_games] * len(trials),
+            )
+            scored = executor.map(run_trial, *jobs) if executor else map(run_trial, *jobs)
+            ranked = sorted(scored, key=lambda trial: trial.score, reverse=True)
+            print(
+                f"Rung {rung} | {len(ranked):3d} configs x {budget:,} episodes | "
+                f"best win rate {ranked[0].win_rate:.3f} | {time.perf_counter() - start:.1f}s"
+            )
+
+            keep = len(ranked) // eta
+            if keep == 0:
+                results.extend(ranked)
+                break
+            results.extend(replace(trial, q_table=None) for trial in ranked[keep:])
+            trials = [replace(trial, rung=rung + 1) for trial in ranked[:keep]]
+            rung, budget = rung + 1, budget * eta
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return sorted(results, key=lambda trial: (trial.rung, trial.score), reverse=True)
+
+
+def write_results(trials: list[Trial], out_dir: Path) -> None:
+    """Ranked results.jsonl and results.csv, one row per configuration."""
+    rows = [{"rank": rank, **trial.row()} for rank, trial in enumerate(trials, 1)]
+    with open(out_dir / "results.jsonl", "w") as file:
+        for row in rows:
+            file.write(json.dumps(row) + "\n")
+    with open(out_dir / "results.csv", "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def save_best(trial: Trial, path: Path) -> None:
+    """Pickle the winner's q_values, in the same form ai-training/main.py saves."""
+    agent = QAgent(alpha=trial.params["alpha"], gamma=trial.params["gamma"])
+    agent.load_table(trial.q_table)
+    with open(path, "wb") as file:
+        pickle.dump(agent.q_values, file)
+
+
+def load_best_params(results_path: str) -> dict:
+    """Hyperparameters of the top-ranked row of a results.jsonl file."""
+    with open(results_path) as file:
+        best = json.loads(file.readline())
+    return {name: best[name] for name in SEARCH_SPACE}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Successive-halving hyperparameter search.")
+    parser.add_argument("--configs", type=int, default=81, help="configurations to sample")
+    parser.add_argument("--min-episodes", type=int, default=5000, help="episodes in rung 0")
+    parser.add_argument("--eta", type=int, default=3, help="keep 1/eta of each rung")
+    parser.add_argument("--eval-games", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out-dir", default="ai-training/search")
+    args = parser.parse_args()
+    if args.eta < 2:
+        parser.error("--eta must be at least 2")
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    trials = successive_halving(
+        sample_configs(args.configs, args.seed),
+        args.min_episodes,
+        args.eta,
+        args.eval_games,
+        args.workers,
+        args.seed,
+    )
+    write_results(trials, out_dir)
+    save_best(trials[0], out_dir / "best_agent.pkl")
+
+    best = trials[0]
+    print(f"\nBest after {best.episodes:,} episodes: {best.params}")
+    print(f"win={best.win_rate:.3f} draw={best.draw_rate:.3f} loss={best.loss_rate:.3f}")
+    print(f"Results and best_agent.pkl in {out_dir} ({time.perf_counter() - start:.1f}s)")
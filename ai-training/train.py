@@ -1,7 +1,10 @@
 import random
+from typing import Optional, Union
 
+import numpy as np
 from agent import QAgent
-from environment import TicTacToeEnvironment
+from checkpoint import Checkpointer, TrainingState
+from environment import POSITION_COUNT, TicTacToeEnvironment, VectorTicTacToeEnvironment
 
 x_vals, y_vals = [], []
 
@@ -57,7 +60,7 @@ def play_one_training_episode(
 
 
 def run_q_learning_loop(
-    environment: TicTacToeEnvironment,
+    environment: Union[TicTacToeEnvironment, VectorTicTacToeEnvironment],
     episodes: int = 500,
     alpha: int = 0.1,
     gamma: int = 0.95,
@@ -67,6 +70,19 @@ def run_q_learning_loop(
     log_slices: int = 20,
     avg_window_frac: int = 0.2,
 ) -> tuple[QAgent, list]:
+    if isinstance(environment, VectorTicTacToeEnvironment):
+        return run_vector_q_learning_loop(
+            environment,
+            episodes,
+            alpha,
+            gamma,
+            epsilon,
+            epsilon_min,
+            epsilon_decay,
+            log_slices,
+            avg_window_frac,
+        )
+
     agent = QAgent(epsilon=epsilon, alpha=alpha, gamma=gamma)
     rewards = []
     averaging_window = max(5, int(episodes * avg_window_frac))
@@ -87,3 +103,112 @@ def run_q_learning_loop(
             y_vals.append(average_reward)
 
     return agent, rewards
+
+
+def select_actions(
+    q_table: np.ndarray,
+    states: np.ndarray,
+    legal: np.ndarray,
+    epsilon: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Batched epsilon-greedy: ties and exploration pick uniformly among the candidates."""
+    values = np.where(legal, q_table[states], -np.inf)
+    candidates = values == values.max(axis=1, keepdims=True)
+    explore = rng.random(len(states)) < epsilon
+    candidates[explore] = legal[explore]
+    return np.where(candidates, rng.random(legal.shape), -1.0).argmax(axis=1)
+
+
+def update_q_table(
+    q_table: np.ndarray,
+    states: np.ndarray,
+    actions: np.ndarray,
+    targets: np.ndarray,
+    alpha: float,
+) -> None:
+    """One Q update per distinct (state, action) in the batch, towards its mean target."""
+    flat, slots = np.unique(states * 9 + actions, return_inverse=True)
+    mean_targets = np.bincount(slots, weights=targets) / np.bincount(slots)
+    values = q_table.reshape(-1)
+    values[flat] += alpha * (mean_targets - values[flat])
+
+
+def vector_training_step(
+    q_table: np.ndarray,
+    environment: VectorTicTacToeEnvironment,
+    alpha: float,
+    gamma: float,
+    epsilon: float,
+) -> np.ndarray:
+    """Play and learn from one move in every game; returns the rewards of games that ended."""
+    states = environment.get_states()
+    actions = select_actions(q_table, states, environment.legal_mask(), epsilon, environment.rng)
+    next_states, step_rewards, dones = environment.step(actions)
+
+    targets = step_rewards.copy()
+    live = ~dones
+    if live.any():
+        next_values = np.where(environment.legal_mask()[live], q_table[next_states[live]], -np.inf)
+        targets[live] += gamma * next_values.max(axis=1)
+    update_q_table(q_table, states, actions, targets, alpha)
+    return step_rewards[dones]
+
+
+def run_vector_q_learning_loop(
+    environment: VectorTicTacToeEnvironment,
+    episodes: int = 500,
+    alpha: float = 0.1,
+    gamma: float = 0.95,
+    epsilon: float = 0.2,
+    epsilon_min: float = 0.01,
+    epsilon_decay: float = 0.995,
+    log_slices: int = 20,
+    avg_window_frac: float = 0.2,
+    checkpointer: Optional[Checkpointer] = None,
+    resume: Optional[TrainingState] = None,
+) -> tuple[QAgent, list]:
+    """
+    Same training as the scalar loop, one batched step for all games at a time.
+    Epsilon decays once per finished episode; the last step may finish a few extra
+    episodes, which are dropped from the reward history.
+
+    With a checkpointer, state is saved between steps as episodes finish and once at
+    the end; passing the loaded state as resume (with its environment) continues the
+    run exactly as if it had never stopped.
+    """
+
+    q_table = np.zeros((POSITION_COUNT, 9))
+    rewards: list[float] = []
+    if resume is None:
+        environment.reset()
+    else:
+        q_table, epsilon, rewards = resume.q_table, resume.epsilon, resume.rewards
+    averaging_window = max(5, int(episodes * avg_window_frac))
+    log_every = max(1, episodes // log_slices)
+    next_log = log_every
+
+    while len(rewards) < episodes:
+        finished = vector_training_step(q_table, environment, alpha, gamma, epsilon)
+        rewards.extend(finished.tolist())
+        epsilon = max(epsilon_min, epsilon * epsilon_decay ** len(finished))
+        if checkpointer is not None:
+            checkpointer.maybe_save(q_table, epsilon, rewards, environment)
+
+        while next_log <= min(len(rewards), episodes):
+            window = rewards[max(0, next_log - averaging_window) : next_log]
+            average_reward = sum(window) / len(window)
+            print(
+                f"Episode {next_log:5d} | eps={epsilon:.3f} | "
+                f"avg_reward({averaging_window})={average_reward:.3f}"
+            )
+            x_vals.append(next_log)
+            y_vals.append(average_reward)
+            next_log += log_every
+
+    if checkpointer is not None:
+        checkpointer.save(q_table, epsilon, rewards, environment)
+
+    agent = QAgent(epsilon=epsilon, alpha=alpha, gamma=gamma)
+    agent.load_table(q_table)
+    return agent, rewards[:episodes]
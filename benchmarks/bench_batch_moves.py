@@ -0,0 +1,62 @@
+"""Moves per second for QAgent: scalar choose_move versus batched choose_moves.
+
+Run from the repo root: python -m benchmarks.bench_batch_moves
+"""
+
+import random
+import time
+
+import numpy as np
+
+from ttt_core.ai import perfect_play, qtable
+from ttt_core.ai.agents import QAgent
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+MODEL = "ai-training/models/hard_agent.pkl"
+BATCH_SIZES = (1, 64, 4096)
+
+
+def playable_boards(count: int, seed: int = 0) -> list[Board]:
+    rng = random.Random(seed)
+    table = perfect_play.load_table()
+    playable = [index for index, entry in enumerate(table) if entry & perfect_play.MOVE_MASK]
+    boards = []
+    for index in rng.choices(playable, k=count):
+        board = Board()
+        board.cells = rules.index_cells(index)
+        boards.append(board)
+    return boards
+
+
+def moves_per_second(choose, batches: list, total: int) -> float:
+    start = time.perf_counter()
+    for item in batches:
+        choose(item)
+    return total / (time.perf_counter() - start)
+
+
+def run(total: int = 65_536) -> None:
+    agent = QAgent(str(qtable.ensure_export(MODEL)))
+    rng = np.random.default_rng(0)
+    boards = playable_boards(total)
+    codes = np.array(
+        [[1 if c == "X" else 2 if c == "O" else 0 for c in b.cells] for b in boards],
+        dtype=np.int8,
+    )
+
+    scalar = moves_per_second(agent.choose_move, boards, total)
+    print(f"scalar choose_move:  {scalar:>12,.0f} moves/s")
+    for size in BATCH_SIZES:
+        board_batches = [boards[i : i + size] for i in range(0, total, size)]
+        code_batches = [codes[i : i + size] for i in range(0, total, size)]
+        from_boards = moves_per_second(lambda b: agent.choose_moves(b, rng), board_batches, total)
+        from_codes = moves_per_second(lambda b: agent.choose_moves(b, rng), code_batches, total)
+        print(
+            f"batch {size:>5}: {from_boards:>12,.0f} moves/s from Boards, "
+            f"{from_codes:>12,.0f} from cell-code arrays"
+        )
+
+
+if __name__ == "__main__":
+    run()
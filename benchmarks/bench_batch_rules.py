@@ -0,0 +1,58 @@
+"""rules.evaluate_batch vs the scalar rules API on 10**6 random positions.
+
+Run from the repo root: python -m benchmarks.bench_batch_rules
+"""
+
+import time
+
+import numpy as np
+
+from ttt_core.domain import rules
+
+
+def random_boards(count: int, seed: int = 0) -> np.ndarray:
+    """Random alternating-move positions: cells ranked by a random order, first plies filled."""
+    rng = np.random.default_rng(seed)
+    ranks = rng.random((count, 9)).argsort(axis=1).argsort(axis=1)
+    plies = rng.integers(0, 10, size=(count, 1))
+    return np.where(ranks < plies, 1 + ranks % 2, 0).astype(np.int8)
+
+
+def scalar_evaluate(positions: list[list[str]]) -> list[tuple]:
+    results = []
+    for cells in positions:
+        _, winner, line = rules.has_winner(cells)
+        legal = sum(1 << idx for idx, cell in enumerate(cells) if not cell)
+        results.append((winner, line, rules.is_draw(cells), legal))
+    return results
+
+
+def run(count: int = 1_000_000) -> None:
+    boards = random_boards(count)
+    positions = [[("", "X", "O")[value] for value in row] for row in boards.tolist()]
+    rules.outcome_table()
+
+    start = time.perf_counter()
+    batch = rules.evaluate_batch(boards)
+    batch_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = scalar_evaluate(positions)
+    scalar_elapsed = time.perf_counter() - start
+
+    line_ids = {line: line_id for line_id, line in enumerate(rules.WIN_LINES)}
+    mismatches = sum(
+        (("", "X", "O")[batch.winner[i]] or None, batch.win_line[i], batch.is_draw[i])
+        != (winner, line_ids.get(line, -1), draw)
+        or batch.legal_mask[i] != legal
+        for i, (winner, line, draw, legal) in enumerate(scalar)
+    )
+
+    print(f"{count:,} positions, {mismatches} mismatches")
+    print(f"scalar: {scalar_elapsed:.3f} s ({count / scalar_elapsed:,.0f} boards/s)")
+    print(f"batch:  {batch_elapsed:.3f} s ({count / batch_elapsed:,.0f} boards/s)")
+    print(f"speedup x{scalar_elapsed / batch_elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    run()
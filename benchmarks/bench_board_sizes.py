@@ -0,0 +1,51 @@
+"""Per-move cost of Game.apply_move, which detects wins with per-line counters, 3x3 to 19x19.
+
+Run from the repo root: python -m benchmarks.bench_board_sizes
+"""
+
+import random
+import time
+from typing import List
+
+from ttt_core.domain.board import Board
+from ttt_core.engine.game import Game
+from ttt_core.engine.stats import Stats
+
+SHAPES = [(3, 3), (4, 4), (7, 5), (15, 5), (19, 5)]
+
+
+def random_orders(cell_count: int, games: int, seed: int = 0) -> List[List[int]]:
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(games):
+        order = list(range(cell_count))
+        rng.shuffle(order)
+        orders.append(order)
+    return orders
+
+
+def time_apply_move(size: int, win_length: int, games: int) -> tuple[float, float]:
+    """Return (ns per apply_move, average moves per game) over random games."""
+    game = Game(board=Board(size=size, win_length=win_length), stats=Stats())
+    moves = 0
+    elapsed = 0.0
+    for order in random_orders(size * size, games):
+        game.reset_game()
+        start = time.perf_counter()
+        for move in order:
+            if game.apply_move(move).is_over:
+                break
+        elapsed += time.perf_counter() - start
+        moves += game.move_count
+    return elapsed / moves * 1e9, moves / games
+
+
+def run(games: int = 2_000) -> None:
+    print(f"{'board':>8} {'k':>3} {'moves/game':>11} {'apply_move':>14}")
+    for size, win_length in SHAPES:
+        per_move, moves = time_apply_move(size, win_length, games)
+        print(f"{size:>3}x{size:<4} {win_length:>3} {moves:>11.1f} {per_move:>11.0f} ns")
+
+
+if __name__ == "__main__":
+    run()
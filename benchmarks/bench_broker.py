@@ -0,0 +1,81 @@
+"""Throughput and latency of many concurrent sessions: direct agent calls versus the broker.
+
+Each session is a thread (or coroutine) asking for moves back to back.
+
+Run from the repo root: python -m benchmarks.bench_broker
+"""
+
+import asyncio
+import threading
+import time
+
+from benchmarks.bench_batch_moves import MODEL, playable_boards
+from ttt_core.ai.agents import QAgent
+from ttt_core.ai.broker import InferenceBroker
+
+
+def threaded(choose, sessions: int, requests: int, boards: list) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+
+    def session(offset: int) -> None:
+        mine = []
+        for n in range(requests):
+            start = time.perf_counter()
+            choose(boards[(offset + n) % len(boards)])
+            mine.append(time.perf_counter() - start)
+        latencies.extend(mine)
+
+    threads = [threading.Thread(target=session, args=(n,)) for n in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sessions * requests / (time.perf_counter() - start), sorted(latencies)
+
+
+async def coroutines(choose, sessions: int, requests: int, boards: list) -> float:
+    async def session(offset: int) -> None:
+        for n in range(requests):
+            await choose(boards[(offset + n) % len(boards)])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session(n) for n in range(sessions)))
+    return sessions * requests / (time.perf_counter() - start)
+
+
+def report(label: str, rate: float, latencies: list[float]) -> None:
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f"{label:<34}{rate:>10,.0f} moves/s   p50 {p50:.2f} ms   p99 {p99:.2f} ms")
+
+
+def run(sessions: int = 64, requests: int = 200) -> None:
+    agent = QAgent(MODEL)
+    boards = playable_boards(4096)
+
+    report(f"direct, {sessions} threads", *threaded(agent.choose_move, sessions, requests, boards))
+    for wait_ms in (0.5, 2.0):
+        with InferenceBroker(agent, max_wait_ms=wait_ms) as broker:
+            rate, latencies = threaded(broker.choose_move, sessions, requests, boards)
+            report(f"broker {wait_ms} ms, {sessions} threads", rate, latencies)
+            metrics = broker.metrics()
+            print(
+                f"{'':<34}mean batch {metrics.mean_batch_size:.1f}, "
+                f"max queue depth {metrics.max_queue_depth}"
+            )
+
+    async def direct(board: object) -> int:
+        await asyncio.sleep(0)
+        return agent.choose_move(board)
+
+    rate = asyncio.run(coroutines(direct, 1024, 50, boards))
+    print(f"{'direct, 1024 coroutines':<34}{rate:>10,.0f} moves/s")
+    with InferenceBroker(agent, max_wait_ms=0.5) as broker:
+        rate = asyncio.run(coroutines(broker.choose_move_async, 1024, 50, boards))
+        print(f"{'broker 0.5 ms, 1024 coroutines':<34}{rate:>10,.0f} moves/s", end="   ")
+        print(f"mean batch {broker.metrics().mean_batch_size:.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,46 @@
+"""Moves per second through GameController.register_click_and_move.
+
+Run from the repo root: python -m benchmarks.bench_controller
+"""
+
+import random
+import time
+
+from ttt_ui.controllers.game_controller import GameController
+from ttt_ui.services.layout import CELLS
+
+
+def click_sequences(games: int, seed: int = 0) -> list[list[tuple[float, float]]]:
+    rng = random.Random(seed)
+    sequences = []
+    for _ in range(games):
+        order = list(range(9))
+        rng.shuffle(order)
+        sequences.append([CELLS[idx] for idx in order])
+    return sequences
+
+
+def play(controller: GameController, sequences: list[list[tuple[float, float]]]) -> int:
+    moves = 0
+    for clicks in sequences:
+        controller.reset_game_engine()
+        for x, y in clicks:
+            moves += 1
+            if controller.register_click_and_move(x, y).game_over:
+                break
+    return moves
+
+
+def run(games: int = 20_000) -> None:
+    controller = GameController()
+    controller.set_mode_multi()
+    sequences = click_sequences(games)
+
+    start = time.perf_counter()
+    moves = play(controller, sequences)
+    elapsed = time.perf_counter() - start
+    print(f"{moves} moves in {elapsed:.3f} s -> {moves / elapsed:,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,54 @@
+"""MCTSAgent playouts per second and move quality at fixed time budgets.
+
+Quality is the share of moves that the solved perfect-play table rates optimal, over
+positions sampled from reachable, unfinished games.
+
+Run from the repo root: python -m benchmarks.bench_mcts
+"""
+
+import random
+
+from ttt_core.ai import perfect_play
+from ttt_core.ai.mcts import MCTSAgent
+from ttt_core.ai.perfect_play import PerfectPlayAgent
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+BUDGETS_MS = (1, 10, 100)
+
+
+def sample_boards(count: int, seed: int = 0) -> list[Board]:
+    rng = random.Random(seed)
+    table = perfect_play.load_table()
+    playable = [index for index, entry in enumerate(table) if entry & perfect_play.MOVE_MASK]
+    boards = []
+    for index in rng.choices(playable, k=count):
+        board = Board()
+        board.cells = rules.index_cells(index)
+        boards.append(board)
+    return boards
+
+
+def run(positions: int = 100) -> None:
+    oracle = PerfectPlayAgent()
+    boards = sample_boards(positions)
+    for budget in BUDGETS_MS:
+        opening = MCTSAgent(time_limit_ms=budget, seed=0)
+        opening.choose_move(Board())
+        opening_rate = opening.last_playouts / (budget / 1000)
+
+        playouts = optimal = 0
+        for seed, board in enumerate(boards):
+            agent = MCTSAgent(time_limit_ms=budget, seed=seed)
+            move = agent.choose_move(board)
+            playouts += agent.last_playouts
+            optimal += oracle.optimal_moves(board) >> move & 1
+        rate = playouts / (positions * budget / 1000)
+        print(
+            f"{budget:>4} ms: {opening_rate:,.0f} playouts/s from the empty board, "
+            f"{rate:,.0f} over sampled positions, {optimal / positions:.0%} optimal"
+        )
+
+
+if __name__ == "__main__":
+    run()
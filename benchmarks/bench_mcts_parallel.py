@@ -0,0 +1,40 @@
+"""Root-parallel MCTS throughput from 1 to N worker processes.
+
+Each move gets a fixed time budget; pools are warmed before timing, so the numbers
+exclude process start-up. Scaling is bounded by the cores actually available.
+
+Run from the repo root: python -m benchmarks.bench_mcts_parallel [max_workers]
+"""
+
+import os
+import sys
+import time
+
+from ttt_core.ai import mcts
+from ttt_core.ai.mcts import MCTSAgent
+from ttt_core.domain.board import Board
+
+
+def playouts_per_second(workers: int, budget_ms: float, moves: int) -> float:
+    agent = MCTSAgent(time_limit_ms=budget_ms, seed=0, workers=workers)
+    agent.choose_move(Board())
+    total = 0
+    start = time.perf_counter()
+    for _ in range(moves):
+        agent.choose_move(Board())
+        total += agent.last_playouts
+    return total / (time.perf_counter() - start)
+
+
+def run(max_workers: int, budget_ms: float = 50, moves: int = 20) -> None:
+    print(f"{os.cpu_count()} CPUs, {budget_ms:g} ms per move from the empty board")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        rate = playouts_per_second(workers, budget_ms, moves)
+        baseline = baseline or rate
+        print(f"{workers:>3} workers: {rate:>10,.0f} playouts/s ({rate / baseline:.2f}x)")
+    mcts.shutdown_pools()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1)
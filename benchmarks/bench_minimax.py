@@ -0,0 +1,59 @@
+"""Nodes searched and reply latency for MinimaxAgent, cold versus warm.
+
+Run from the repo root: python -m benchmarks.bench_minimax
+"""
+
+import random
+import time
+
+from ttt_core.ai.minimax import MinimaxAgent
+from ttt_core.domain.board import Board
+from ttt_core.domain.types import Mark
+from ttt_core.engine.game import Game
+from ttt_core.engine.stats import Stats
+
+
+def timed_move(agent: MinimaxAgent, board: Board) -> tuple[int, float]:
+    nodes = agent.nodes
+    start = time.perf_counter()
+    agent.choose_move(board)
+    return agent.nodes - nodes, time.perf_counter() - start
+
+
+def play_against_random(agent: MinimaxAgent, games: int, seed: int = 0) -> list[float]:
+    """Agent plays O; returns the latency of every agent reply."""
+    rng = random.Random(seed)
+    latencies = []
+    for _ in range(games):
+        game = Game(board=Board(), stats=Stats())
+        while not game.game_over:
+            if game.current_move_mark is Mark.O_MARK:
+                start = time.perf_counter()
+                move = agent.choose_move(game.board)
+                latencies.append(time.perf_counter() - start)
+            else:
+                move = rng.choice(game.board.legal_moves())
+            game.apply_move(move)
+    return latencies
+
+
+def run(games: int = 2_000) -> None:
+    agent = MinimaxAgent()
+    nodes, elapsed = timed_move(agent, Board())
+    print(f"first move (cold table): {nodes} nodes, {elapsed * 1e3:.2f} ms")
+
+    cold = play_against_random(MinimaxAgent(), 1)
+    print(f"first O reply on a cold table: {cold[0] * 1e3:.2f} ms")
+
+    nodes = agent.nodes
+    latencies = sorted(play_against_random(agent, games))
+    mean = sum(latencies) / len(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(
+        f"{len(latencies)} warm replies: {agent.nodes - nodes} nodes, "
+        f"mean {mean * 1e6:.1f} us, p99 {p99 * 1e6:.1f} us, max {latencies[-1] * 1e6:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""Startup and reply cost: solved perfect-play table versus an unpickled Q-table.
+
+Run from the repo root: python -m benchmarks.bench_perfect_play
+"""
+
+import os
+import pickle
+import random
+import timeit
+
+from ttt_core.ai import perfect_play
+from ttt_core.ai.agents import QAgent
+from ttt_core.ai.perfect_play import PerfectPlayAgent
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+Q_MODEL = "ai-training/models/imp_agent.pkl"
+
+
+def unpickle(path: str) -> object:
+    with open(path, "rb") as handle:
+        return pickle.load(handle)
+
+
+def sample_boards(count: int, seed: int = 0) -> list[Board]:
+    rng = random.Random(seed)
+    table = perfect_play.load_table()
+    playable = [index for index, entry in enumerate(table) if entry & perfect_play.MOVE_MASK]
+    boards = []
+    for index in rng.choices(playable, k=count):
+        board = Board()
+        board.cells = rules.index_cells(index)
+        boards.append(board)
+    return boards
+
+
+def per_call_us(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def run() -> None:
+    table_size = os.path.getsize(perfect_play.DEFAULT_TABLE_PATH)
+    model_size = os.path.getsize(Q_MODEL)
+    print(f"table file {table_size:,} bytes vs {Q_MODEL} {model_size:,} bytes")
+    print(f"load table:      {per_call_us(perfect_play.load_table, 200):9.1f} us")
+    print(f"unpickle model:  {per_call_us(lambda: unpickle(Q_MODEL), 20):9.1f} us")
+    print(f"construct QAgent:{per_call_us(lambda: QAgent(Q_MODEL), 5):9.1f} us")
+
+    boards = sample_boards(10_000)
+    table_agent = PerfectPlayAgent()
+    q_agent = QAgent(Q_MODEL)
+
+    def replies(choose) -> None:
+        for board in boards:
+            choose(board)
+
+    table_us = per_call_us(lambda: replies(table_agent.choose_move), 1) / len(boards)
+    q_us = per_call_us(lambda: replies(q_agent.choose_move), 1) / len(boards)
+    print(f"choose_move: table {table_us:.2f} us, Q-table {q_us:.2f} us")
+
+
+if __name__ == "__main__":
+    run()
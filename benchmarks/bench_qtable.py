@@ -0,0 +1,74 @@
+"""Load time and resident memory: pickled Q-table models versus dense memory-mapped files.
+
+Each measurement runs in a fresh interpreter so RSS deltas are not polluted by earlier
+loads. After loading, the agent answers a move for every reachable position so all
+of the model it needs is resident. RssAnon is private memory; mapped model pages are
+file-backed and shared with every other process using the same file. Linux only.
+
+Run from the repo root: python -m benchmarks.bench_qtable
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from ttt_core.ai import qtable
+
+MODELS = ("hard_agent", "imp_agent", "another_agent")
+
+_PROBE = """
+import json, sys, time
+from ttt_core.ai import perfect_play
+from ttt_core.ai.agents import QAgent
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+def status(field):
+    with open("/proc/self/status") as handle:
+        for line in handle:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+
+boards = []
+for index, entry in enumerate(perfect_play.load_table()):
+    if entry & perfect_play.MOVE_MASK:
+        board = Board()
+        board.cells = rules.index_cells(index)
+        boards.append(board)
+
+rss, anon = status("VmRSS"), status("RssAnon")
+start = time.perf_counter()
+agent = QAgent(sys.argv[1])
+load_ms = (time.perf_counter() - start) * 1e3
+for board in boards:
+    agent.choose_move(board)
+print(json.dumps({
+    "load_ms": load_ms,
+    "rss_kb": status("VmRSS") - rss,
+    "anon_kb": status("RssAnon") - anon,
+}))
+"""
+
+
+def probe(path: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, path], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def run() -> None:
+    print(f"{'model':<28}{'load ms':>10}{'RSS KB':>10}{'RssAnon KB':>12}")
+    for name in MODELS:
+        pickled = f"ai-training/models/{name}.pkl"
+        for path in (pickled, str(qtable.ensure_export(pickled))):
+            result = min((probe(path) for _ in range(3)), key=lambda row: row["load_ms"])
+            print(
+                f"{Path(path).name:<28}{result['load_ms']:>10.2f}"
+                f"{result['rss_kb']:>10}{result['anon_kb']:>12}"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,82 @@
+"""Outcome evaluation: WIN_LINES loop vs the 3**9 outcome table.
+
+Run from the repo root: python -m benchmarks.bench_rules
+"""
+
+import random
+import timeit
+from typing import List, Optional, Sequence
+
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+
+def legacy_has_winner(
+    cells: Sequence[str],
+) -> tuple[bool, Optional[str], Optional[tuple[int, int, int]]]:
+    """The per-call line scan rules.has_winner used before the outcome table."""
+    for a, b, c in rules.WIN_LINES:
+        if cells[a] and cells[a] == cells[b] == cells[c]:
+            return True, cells[a], (a, b, c)
+    return False, None, None
+
+
+def legacy_is_draw(cells: Sequence[str]) -> bool:
+    """The line scan plus full-board check that is_draw needs without the table."""
+    return not legacy_has_winner(cells)[0] and all(cells)
+
+
+def random_positions(count: int, seed: int = 0) -> List[List[str]]:
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        cells = [""] * 9
+        for ply, idx in enumerate(rng.sample(range(9), rng.randint(0, 9))):
+            cells[idx] = "X" if ply % 2 == 0 else "O"
+        positions.append(cells)
+    return positions
+
+
+def run(count: int = 10_000, repeat: int = 5) -> None:
+    positions = random_positions(count)
+    boards = []
+    for cells in positions:
+        board = Board()
+        board.cells = cells
+        boards.append(board)
+
+    build = timeit.timeit(rules.outcome_table, number=1)
+    print(f"one-off table build: {build * 1e3:.1f} ms")
+
+    for cells in positions:
+        assert legacy_has_winner(cells) == rules.has_winner(cells)
+        assert legacy_is_draw(cells) == rules.is_draw(cells)
+
+    # (label, function, label of the loop it replaces)
+    timings = [
+        ("loop has_winner(cells)", lambda: [legacy_has_winner(c) for c in positions], None),
+        (
+            "table has_winner(cells)",
+            lambda: [rules.has_winner(c) for c in positions],
+            "loop has_winner(cells)",
+        ),
+        ("table Board.outcome()", lambda: [b.outcome() for b in boards], "loop has_winner(cells)"),
+        ("loop is_draw(cells)", lambda: [legacy_is_draw(c) for c in positions], None),
+        (
+            "table is_draw(cells)",
+            lambda: [rules.is_draw(c) for c in positions],
+            "loop is_draw(cells)",
+        ),
+    ]
+
+    per_call: dict = {}
+    print(f"{count} random positions, best of {repeat}")
+    for label, func, baseline in timings:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        per_call[label] = best / count * 1e9
+        speedup = per_call[baseline] / per_call[label] if baseline else 1.0
+        print(f"{label:<26} {per_call[label]:8.1f} ns/call  x{speedup:.2f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,46 @@
+"""EngineManager with 10k concurrent sessions: memory per session and creation throughput.
+
+Run from the repo root: python -m benchmarks.bench_sessions
+"""
+
+import time
+import tracemalloc
+
+from ttt_core.engine.sessions import EngineManager
+
+
+def create_all(manager: EngineManager, count: int) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    ids = [manager.create_session() for _ in range(count)]
+    return ids, time.perf_counter() - start
+
+
+def run(count: int = 10_000) -> None:
+    manager = EngineManager(idle_timeout=300.0)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    create_all(manager, count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{count:,} sessions: {(after - before) / count:,.0f} bytes per session")
+
+    cold_manager = EngineManager(idle_timeout=300.0)
+    cold_ids, cold = create_all(cold_manager, count)
+
+    for session_id in cold_ids:
+        cold_manager.close_session(session_id)
+    warm_ids, warm = create_all(cold_manager, count)
+
+    print(f"cold create (new Game/Board): {count / cold:,.0f} sessions/s")
+    print(f"warm create (pooled Game/Board): {count / warm:,.0f} sessions/s")
+
+    start = time.perf_counter()
+    for session_id in warm_ids:
+        cold_manager.get(session_id).index_move_and_update_status(4)
+    elapsed = time.perf_counter() - start
+    print(f"lookup + move across all sessions: {count / elapsed:,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    run()
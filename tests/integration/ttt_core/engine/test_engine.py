@@ -1,5 +1,6 @@
 import pytest
 
+from ttt_core.domain.board import Board
 from ttt_core.engine.engine import Engine
 from ttt_core.engine.stats import Stats
 
@@ -28,8 +29,8 @@ def test_attempts_increment_with_each_move(engine: Engine) -> None:
     first = engine.index_move_and_update_status(0)
     second = engine.index_move_and_update_status(1)
 
-    assert first["attempts"] == 1
-    assert second["attempts"] == 2
+    assert first.attempts == 1
+    assert second.attempts == 2
 
 
 def test_reset_clears_board_and_attempts(engine: Engine) -> None:
@@ -49,13 +50,13 @@ def test_game_over_and_winner_detected(engine: Engine) -> None:
     result = None
     for move in moves:
         result = engine.index_move_and_update_status(move)
-        if result["game_over"]:
+        if result.game_over:
             break
 
     assert result is not None
-    assert result["game_over"] is True
-    assert result["winner"] == "X"
-    assert result["win_line"] == (0, 1, 2)
+    assert result.game_over is True
+    assert result.winner == "X"
+    assert result.win_line == (0, 1, 2)
 
 
 def test_stats_increment_after_completed_game(engine: Engine, stats: Stats) -> None:
@@ -65,11 +66,11 @@ def test_stats_increment_after_completed_game(engine: Engine, stats: Stats) -> N
     result = None
     for move in moves:
         result = engine.index_move_and_update_status(move)
-        if result["game_over"]:
+        if result.game_over:
             break
 
     assert result is not None
-    assert result["game_over"] is True
+    assert result.game_over is True
 
     assert stats.total_games == 1
     assert stats.player_wins in (0, 1)
@@ -86,5 +87,21 @@ def test_lock_selection_after_first_attempt(engine: Engine) -> None:
 def test_win_line_none_when_no_winner(engine: Engine) -> None:
     result = engine.index_move_and_update_status(0)
 
-    assert result["game_over"] is False
-    assert result["win_line"] is None
+    assert result.game_over is False
+    assert result.win_line is None
+
+
+def test_engine_plays_on_generalized_board(stats: Stats) -> None:
+    engine = Engine(stats=stats, board=Board(size=7, win_length=5))
+
+    result = None
+    for move in [0, 7, 1, 8, 2, 9, 3, 10, 4]:
+        result = engine.index_move_and_update_status(move)
+
+    assert result.game_over is True
+    assert result.winner == "X"
+    assert result.win_line == (0, 1, 2, 3, 4)
+
+    engine.reset_game()
+
+    assert engine.expose_board.legal_moves() == list(range(49))
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The training scripts import one another as top-level modules, as they do when run.
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "ai-training"))
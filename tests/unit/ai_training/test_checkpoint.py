@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from checkpoint import Checkpointer, checkpoint_files, load_checkpoint
+from environment import POSITION_COUNT, VectorTicTacToeEnvironment
+from train import run_vector_q_learning_loop
+
+SETTINGS = dict(
+    episodes=3000, alpha=0.2, gamma=0.9, epsilon=0.3, epsilon_min=0.05, epsilon_decay=0.999
+)
+
+
+class InterruptingCheckpointer(Checkpointer):
+    """Raises KeyboardInterrupt, like Ctrl-C, once `stop_after` episodes have finished."""
+
+    def __init__(self, directory: Path, stop_after: int) -> None:
+        super().__init__(directory, SETTINGS, every=500)
+        self.stop_after = stop_after
+
+    def maybe_save(self, q_table, epsilon, rewards, environment) -> None:
+        super().maybe_save(q_table, epsilon, rewards, environment)
+        if len(rewards) >= self.stop_after:
+            raise KeyboardInterrupt
+
+
+def test_resumed_run_matches_an_uninterrupted_one(tmp_path: Path) -> None:
+    expected, expected_rewards = run_vector_q_learning_loop(
+        VectorTicTacToeEnvironment(64, seed=3), **SETTINGS
+    )
+
+    checkpointer = InterruptingCheckpointer(tmp_path, stop_after=1700)
+    with pytest.raises(KeyboardInterrupt):
+        run_vector_q_learning_loop(
+            VectorTicTacToeEnvironment(64, seed=3), checkpointer=checkpointer, **SETTINGS
+        )
+    checkpointer.close()
+
+    state = load_checkpoint(tmp_path)
+    assert 1500 <= len(state.rewards) < 1700
+    assert all(type(reward) is float for reward in state.rewards)
+    checkpointer = Checkpointer(tmp_path, state.settings, every=500, resume_from=state)
+    agent, rewards = run_vector_q_learning_loop(
+        state.environment, checkpointer=checkpointer, resume=state, **state.settings
+    )
+    checkpointer.close()
+
+    assert rewards == expected_rewards
+    assert {type(reward) for reward in rewards} == {type(reward) for reward in expected_rewards}
+    assert agent.epsilon == expected.epsilon
+    assert agent.q_values == expected.q_values
+
+
+def test_fresh_run_refuses_existing_checkpoints(tmp_path: Path) -> None:
+    environment = VectorTicTacToeEnvironment(4, seed=0)
+    environment.reset()
+    checkpointer = Checkpointer(tmp_path, SETTINGS)
+    checkpointer.save(np.zeros((POSITION_COUNT, 9)), 0.3, [1.0], environment)
+    checkpointer.close()
+
+    with pytest.raises(FileExistsError):
+        Checkpointer(tmp_path, SETTINGS)
+    assert len(checkpoint_files(tmp_path)) == 1
+
+    Checkpointer(tmp_path, SETTINGS, fresh=True).close()
+    assert checkpoint_files(tmp_path) == []
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from environment import CELL_POWERS, EMPTY, O_CODE, X_CODE, VectorTicTacToeEnvironment
+
+CODES = {".": EMPTY, "X": X_CODE, "O": O_CODE}
+
+
+def codes(rows: list[str]) -> np.ndarray:
+    """Boards written as nine characters of X, O and '.'."""
+    return np.array([[CODES[cell] for cell in row] for row in rows], dtype=np.int8)
+
+
+def set_boards(environment: VectorTicTacToeEnvironment, rows: list[str]) -> None:
+    environment.boards[:] = codes(rows)
+    environment.states[:] = environment.boards.astype(np.int64) @ CELL_POWERS
+
+
+def assert_fresh_opening(environment: VectorTicTacToeEnvironment, games: list[int]) -> None:
+    boards = environment.boards[games]
+    assert ((boards == X_CODE).sum(axis=1) == 1).all()
+    assert not (boards == O_CODE).any()
+
+
+def test_reset_plays_x_opening_and_tracks_position_indices() -> None:
+    environment = VectorTicTacToeEnvironment(32, seed=0)
+
+    states = environment.reset()
+
+    assert_fresh_opening(environment, list(range(32)))
+    np.testing.assert_array_equal(states, environment.boards.astype(np.int64) @ CELL_POWERS)
+    np.testing.assert_array_equal(environment.legal_mask(), environment.boards == EMPTY)
+
+
+def test_step_rewards_and_auto_reset() -> None:
+    environment = VectorTicTacToeEnvironment(4, seed=0)
+    # O wins on 5; X completes the top row; X's forced reply draws; the opening goes on.
+    set_boards(environment, ["XX.OO.X..", "XX.OOXXO.", "XOXXO.OX.", "....X...."])
+
+    next_states, rewards, dones = environment.step(np.array([5, 8, 5, 0]))
+
+    assert rewards.tolist() == [1.0, -1.0, 0.0, 0.0]
+    assert dones.tolist() == [True, True, True, False]
+    finished = codes(["XX.OOOX..", "XXXOOXXOO", "XOXXOOOXX"])
+    np.testing.assert_array_equal(next_states[:3], finished.astype(np.int64) @ CELL_POWERS)
+    assert_fresh_opening(environment, [0, 1, 2])
+    assert (environment.boards[3] == X_CODE).sum() == 2
+    assert (environment.boards[3] == O_CODE).sum() == 1
+    assert next_states[3] == environment.states[3]
+
+
+def test_states_stay_in_step_with_boards_over_many_steps() -> None:
+    environment = VectorTicTacToeEnvironment(64, seed=1)
+
+    for _ in range(50):
+        legal = environment.legal_mask()
+        actions = np.where(legal, environment.rng.random(legal.shape), -1.0).argmax(axis=1)
+        environment.step(actions)
+        boards = environment.boards
+        np.testing.assert_array_equal(environment.states, boards.astype(np.int64) @ CELL_POWERS)
+        assert ((boards == X_CODE).sum(axis=1) == (boards == O_CODE).sum(axis=1) + 1).all()
+
+
+@pytest.mark.parametrize("actions", [[0, 1], [4, 4, 4]])
+def test_step_rejects_invalid_actions(actions: list[int]) -> None:
+    environment = VectorTicTacToeEnvironment(3, seed=0)
+    set_boards(environment, ["X........", "X........", "....X...."])
+
+    with pytest.raises(ValueError):
+        environment.step(np.array(actions))
@@ -0,0 +1,70 @@
+import pickle
+
+import hogwild
+import numpy as np
+import pytest
+from agent import QAgent, SharedQValues
+from environment import position_keys
+
+
+@pytest.fixture
+def table():
+    shared = SharedQValues()
+    yield shared
+    shared.close()
+
+
+def test_entries_are_indexed_by_position_and_action(table: SharedQValues) -> None:
+    keys = position_keys()
+    table[(keys[0], 4)] = 0.5
+    table[(keys[1234], 8)] = -1.0
+
+    snapshot = table.snapshot()
+
+    assert table[(keys[0], 4)] == 0.5
+    assert table[(keys[0], 3)] == 0.0
+    assert snapshot[0, 4] == 0.5
+    assert snapshot[1234, 8] == -1.0
+    assert np.count_nonzero(snapshot) == 2
+
+
+def test_pickled_copies_attach_to_the_same_block(table: SharedQValues) -> None:
+    state = position_keys()[10]
+    attached = pickle.loads(pickle.dumps(table))
+    agent = QAgent(alpha=0.5, shared=attached)
+
+    agent.update_q_values(state, 2, 1.0, 0, [], terminal=True)
+    attached.close()
+
+    assert table[(state, 2)] == 0.5
+    assert table.snapshot()[10, 2] == 0.5
+
+
+def test_owner_close_frees_the_block() -> None:
+    table = SharedQValues()
+    name = table.name
+
+    table.close()
+
+    with pytest.raises(FileNotFoundError):
+        SharedQValues(name)
+
+
+def test_training_frees_the_shared_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    created = []
+
+    class RecordingTable(SharedQValues):
+        def __init__(self, name=None):
+            super().__init__(name)
+            created.append(self.name)
+
+    monkeypatch.setattr(hogwild, "SharedQValues", RecordingTable)
+
+    agent, rewards = hogwild.run_hogwild_q_learning(600, workers=2, seed=1)
+
+    assert len(rewards) == 600
+    assert set(rewards) <= {-1.0, 0.0, 1.0}
+    assert agent.q_values
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            SharedQValues(name)
@@ -0,0 +1,49 @@
+import numpy as np
+from environment import POSITION_COUNT
+from parallel import ActorResult, ActorTask, merge_deltas, run_actor, run_parallel_q_learning
+
+
+def test_merge_averages_entries_touched_by_several_actors() -> None:
+    q_table = np.zeros((POSITION_COUNT, 9))
+    q_table[0, 1] = 1.0
+    no_rewards = np.zeros(0, np.int8)
+    results = [
+        ActorResult(np.array([1, 20]), np.array([0.5, 3.0]), no_rewards),
+        ActorResult(np.array([1, 30]), np.array([-0.25, 2.0]), no_rewards),
+    ]
+
+    merge_deltas(q_table, results)
+
+    flat = q_table.reshape(-1)
+    assert flat[1] == 1.125
+    assert flat[20] == 3.0
+    assert flat[30] == 2.0
+    assert np.count_nonzero(flat) == 3
+
+
+def test_actor_reports_the_entries_it_changed_reproducibly() -> None:
+    table = np.zeros((POSITION_COUNT, 9))
+    task = ActorTask(table, 0, 0, 7, 500, 64, 0.1, 0.9, 0.2, 0.01, 0.999)
+
+    result = run_actor(task)
+
+    assert len(result.rewards) == 500
+    assert (result.deltas != 0).all()
+    assert not table.any()
+    again = run_actor(task)
+    np.testing.assert_array_equal(again.entries, result.entries)
+    np.testing.assert_array_equal(again.deltas, result.deltas)
+
+
+def test_same_seed_and_workers_reproduce_the_run() -> None:
+    settings = dict(episodes=3000, workers=2, episodes_per_round=500, num_envs=64)
+
+    first, first_rewards = run_parallel_q_learning(seed=5, **settings)
+    second, second_rewards = run_parallel_q_learning(seed=5, **settings)
+    other, _ = run_parallel_q_learning(seed=6, **settings)
+
+    assert len(first_rewards) == 3000
+    assert first_rewards == second_rewards
+    assert first.q_values == second.q_values
+    assert first.epsilon == second.epsilon
+    assert other.q_values != first.q_values
@@ -0,0 +1,49 @@
+import csv
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from search import load_best_params, sample_configs, successive_halving, write_results
+
+
+@pytest.fixture(scope="module")
+def results() -> list:
+    return successive_halving(sample_configs(10, seed=0), min_episodes=200, eval_games=200)
+
+
+def test_each_rung_keeps_the_best_third(results: list) -> None:
+    assert Counter(trial.rung for trial in results) == {0: 7, 1: 2, 2: 1}
+    # Budgets of 200, 600 and 1800 episodes add up; a batched step may overshoot them.
+    minimum = {0: 200, 1: 800, 2: 2600}
+    assert all(trial.episodes >= minimum[trial.rung] for trial in results)
+    assert sorted(trial.config_id for trial in results) == list(range(10))
+
+
+def test_results_are_ranked_by_rung_then_score(results: list) -> None:
+    ranking = [(trial.rung, trial.score) for trial in results]
+
+    assert ranking == sorted(ranking, reverse=True)
+    assert results[0].q_table is not None
+    assert all(trial.q_table is None for trial in results[1:])
+
+
+def test_same_seed_gives_the_same_ranking_with_workers(results: list) -> None:
+    parallel = successive_halving(
+        sample_configs(10, seed=0), min_episodes=200, eval_games=200, workers=2
+    )
+
+    assert [trial.row() for trial in parallel] == [trial.row() for trial in results]
+
+
+def test_written_results_are_ranked(results: list, tmp_path: Path) -> None:
+    write_results(results, tmp_path)
+
+    rows = [json.loads(line) for line in (tmp_path / "results.jsonl").read_text().splitlines()]
+    with open(tmp_path / "results.csv", newline="") as file:
+        table = list(csv.DictReader(file))
+
+    assert [row["rank"] for row in rows] == list(range(1, 11))
+    assert [row["config_id"] for row in rows] == [trial.config_id for trial in results]
+    assert [int(row["config_id"]) for row in table] == [row["config_id"] for row in rows]
+    assert load_best_params(str(tmp_path / "results.jsonl")) == results[0].params
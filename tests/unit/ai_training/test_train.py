@@ -0,0 +1,48 @@
+import numpy as np
+from environment import POSITION_COUNT, VectorTicTacToeEnvironment
+from train import select_actions, update_q_table, vector_training_step
+
+
+def test_duplicate_pairs_get_one_update_towards_their_mean_target() -> None:
+    q_table = np.zeros((POSITION_COUNT, 9))
+    q_table[7, 2] = 1.0
+
+    update_q_table(
+        q_table,
+        states=np.array([5, 5, 5, 7]),
+        actions=np.array([1, 1, 1, 2]),
+        targets=np.array([1.0, 0.0, 2.0, -1.0]),
+        alpha=0.5,
+    )
+
+    assert q_table[5, 1] == 0.5
+    assert q_table[7, 2] == 0.0
+    assert np.count_nonzero(q_table) == 1
+
+
+def test_select_actions_is_greedy_over_legal_moves_only() -> None:
+    q_table = np.zeros((POSITION_COUNT, 9))
+    q_table[3] = [9.0, 1.0, 2.0, 0, 0, 0, 0, 0, 0]
+    legal = np.ones((64, 9), dtype=bool)
+    legal[:, 0] = False
+    rng = np.random.default_rng(0)
+
+    greedy = select_actions(q_table, np.full(64, 3), legal, 0.0, rng)
+    exploring = select_actions(q_table, np.full(64, 3), legal, 1.0, rng)
+
+    assert (greedy == 2).all()
+    assert legal[np.arange(64), exploring].all()
+    assert len(set(exploring.tolist())) > 1
+
+
+def test_training_step_returns_rewards_of_finished_games_only() -> None:
+    environment = VectorTicTacToeEnvironment(256, seed=0)
+    q_table = np.zeros((POSITION_COUNT, 9))
+
+    rewards = [vector_training_step(q_table, environment, 0.1, 0.9, 0.2) for _ in range(5)]
+
+    # Nobody can complete a line in the first step after the opening.
+    assert len(rewards[0]) == 0
+    assert sum(len(step) for step in rewards) > 0
+    assert set(np.concatenate(rewards).tolist()) <= {-1.0, 0.0, 1.0}
+    assert np.count_nonzero(q_table) > 0
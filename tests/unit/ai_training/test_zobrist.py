@@ -0,0 +1,20 @@
+from environment import ZOBRIST_TABLE, TicTacToeEnvironment, position_keys
+
+from ttt_core.domain import zobrist
+from ttt_core.domain.board import Board
+from ttt_core.domain.types import Mark
+
+
+def test_keys_match_the_game_so_trained_tables_line_up() -> None:
+    assert [(cell["X"], cell["O"]) for cell in ZOBRIST_TABLE] == list(zobrist.zobrist_table(9))
+    assert position_keys() == zobrist.position_keys().tolist()
+
+
+def test_environment_and_board_agree_after_the_same_moves() -> None:
+    environment, board = TicTacToeEnvironment(), Board()
+
+    for move, mark in ((4, Mark.X_MARK), (0, Mark.O_MARK), (8, Mark.X_MARK)):
+        environment.step(move)
+        board.place_mark(move, mark)
+
+    assert environment.get_state() == board.zobrist_key
@@ -4,10 +4,13 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Tuple
 
+import numpy as np
 import pytest
 
+from ttt_core.ai import qtable
 from ttt_core.ai.agents import QAgent, RandomAgent
 from ttt_core.domain.board import Board
+from ttt_core.domain.zobrist import state_key
 
 
 @pytest.fixture
@@ -60,8 +63,19 @@ def test_qagent_loads_missing_key_with_zero(agent: QAgent) -> None:
 def test_board_state_representation(agent: QAgent, partial_board: Board) -> None:
     state = agent._board_state(partial_board)
 
-    assert state == "X O      "
-    assert len(state) == 9
+    assert state == partial_board.zobrist_key
+    assert state == state_key("X O      ")
+
+
+def test_legacy_string_keys_are_rekeyed_on_load(
+    agent: QAgent,
+    partial_board: Board,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(random, "choice", lambda moves: moves)
+
+    assert agent.q_values_load[(state_key("X O      "), 5)] == -1.0
+    assert agent.choose_best_move(partial_board) == [3, 4]
 
 
 def test_choose_best_move_with_all_zero_qvalues(
@@ -91,3 +105,81 @@ def test_random_agent_returns_legal_move(
     move = random_agent.choose_random_move(partial_board)
 
     assert move in partial_board.legal_moves()
+
+
+def test_random_agent_accepts_generalized_board(random_agent: RandomAgent) -> None:
+    board = Board(size=7, win_length=5)
+    board.cells = ["X"] * 48 + [""]
+
+    assert random_agent.choose_random_move(board) == 48
+
+
+def test_agents_share_choose_move_entry_point(
+    agent: QAgent,
+    random_agent: RandomAgent,
+    partial_board: Board,
+) -> None:
+    assert agent.choose_move(partial_board) in (3, 4)
+    assert random_agent.choose_move(partial_board) in partial_board.legal_moves()
+
+
+@pytest.mark.parametrize("value_type", ["float32", "float16", "int8"])
+def test_qagent_loads_dense_qtable(
+    tmp_path: Path,
+    q_table_sample: dict,
+    partial_board: Board,
+    monkeypatch: pytest.MonkeyPatch,
+    value_type: str,
+) -> None:
+    path = qtable.write_qtable(
+        tmp_path / "q.qtab", qtable.dense_from_dict(q_table_sample), value_type
+    )
+    agent = QAgent(q_path=str(path))
+
+    monkeypatch.setattr(random, "choice", lambda moves: moves)
+
+    assert agent.q_values_load is None
+    assert agent.choose_best_move(partial_board) == [3, 4]
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_choose_moves_matches_scalar_distribution(
+    tmp_path: Path,
+    q_pickle: Path,
+    q_table_sample: dict,
+    partial_board: Board,
+    dense: bool,
+) -> None:
+    path = q_pickle
+    if dense:
+        path = qtable.write_qtable(tmp_path / "q.qtab", qtable.dense_from_dict(q_table_sample))
+    agent = QAgent(q_path=str(path))
+
+    moves = agent.choose_moves([partial_board] * 20_000, np.random.default_rng(0))
+    counts = np.bincount(moves, minlength=9)
+
+    # Scalar path: random.choice over the tied best moves 3 and 4.
+    assert set(np.flatnonzero(counts)) == {3, 4}
+    assert abs(counts[3] / 20_000 - 0.5) < 0.02
+
+
+def test_choose_moves_accepts_cell_code_arrays(agent: QAgent) -> None:
+    codes = np.zeros((2, 9), dtype=np.int8)
+    codes[:, 0], codes[:, 2] = 1, 2
+    codes[1, 3] = 1
+    codes[1, 4] = 2
+
+    moves = agent.choose_moves(codes, np.random.default_rng(0))
+
+    assert moves[0] in (3, 4)
+    assert codes[1, moves[1]] == 0
+
+
+def test_random_agent_choose_moves_is_uniform_over_legal_moves(
+    random_agent: RandomAgent, partial_board: Board
+) -> None:
+    moves = random_agent.choose_moves([partial_board] * 35_000, np.random.default_rng(0))
+    counts = np.bincount(moves, minlength=9)
+
+    assert counts[0] == counts[2] == 0
+    assert np.all(np.abs(counts[partial_board.legal_moves()] / 35_000 - 1 / 7) < 0.01)
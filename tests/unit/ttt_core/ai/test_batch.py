@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from ttt_core.ai import batch
+from ttt_core.domain.board import Board
+
+
+def test_position_arrays_from_boards_and_codes_agree() -> None:
+    board = Board()
+    board.cells = ["X", "", "O", "", "", "", "", "", "X"]
+    codes = np.array([[1, 0, 2, 0, 0, 0, 0, 0, 1]], dtype=np.int8)
+
+    from_boards = batch.position_arrays([board])
+    from_codes = batch.position_arrays(codes)
+
+    assert from_boards[0].tolist() == [board.position_index()] == from_codes[0].tolist()
+    np.testing.assert_array_equal(from_boards[1], from_codes[1])
+    assert from_codes[1][0].tolist() == [c == 0 for c in codes[0]]
+
+
+def test_position_arrays_rejects_bad_shape() -> None:
+    with pytest.raises(ValueError):
+        batch.position_arrays(np.zeros((4, 16), dtype=np.int8))
+
+
+def test_masked_argmax_never_picks_illegal_moves() -> None:
+    values = np.array([[9.0, 1.0, 2.0], [0.0, 0.0, 5.0]])
+    legal = np.array([[False, True, True], [True, True, False]])
+
+    moves = batch.masked_argmax(values, legal, np.random.default_rng(0))
+
+    assert moves[0] == 2
+    assert moves[1] in (0, 1)
+
+
+def test_ties_are_broken_uniformly() -> None:
+    legal = np.ones((30_000, 4), dtype=bool)
+    values = np.tile([1.0, 3.0, 3.0, 3.0], (30_000, 1))
+
+    counts = np.bincount(batch.masked_argmax(values, legal, np.random.default_rng(1)), minlength=4)
+
+    assert counts[0] == 0
+    assert np.all(np.abs(counts[1:] / 30_000 - 1 / 3) < 0.02)
+
+
+def test_choose_among_rejects_row_without_candidates() -> None:
+    with pytest.raises(ValueError):
+        batch.choose_among(np.array([[True, False], [False, False]]))
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from ttt_core.ai.broker import InferenceBroker
+from ttt_core.ai.perfect_play import PerfectPlayAgent
+from ttt_core.domain.board import Board
+
+
+class RecordingAgent:
+    """Plays the first empty cell and records the size of every batch it sees."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def choose_moves(self, codes: np.ndarray) -> np.ndarray:
+        self.release.wait(5)
+        self.batch_sizes.append(len(codes))
+        if not (codes == 0).any(axis=1).all():
+            raise ValueError("No legal moves left on a board in the batch")
+        return (codes == 0).argmax(axis=1)
+
+
+def board_from(cells: str) -> Board:
+    board = Board()
+    board.cells = [value if value != "." else "" for value in cells]
+    return board
+
+
+@pytest.fixture
+def agent() -> RecordingAgent:
+    return RecordingAgent()
+
+
+@pytest.fixture
+def broker(agent: RecordingAgent) -> Iterator[InferenceBroker]:
+    with InferenceBroker(agent, max_batch_size=8, max_wait_ms=20) as running:
+        yield running
+
+
+def test_choose_move_resolves_through_the_agent(broker: InferenceBroker) -> None:
+    assert broker.choose_move(board_from("XO.......")) == 2
+
+
+def test_concurrent_requests_share_a_batch(broker: InferenceBroker, agent: RecordingAgent) -> None:
+    agent.release.clear()
+    broker.submit(Board())
+    futures = [broker.submit(board_from("X" * n + "." * (9 - n))) for n in range(1, 9)]
+    agent.release.set()
+
+    assert [future.result(5) for future in futures] == list(range(1, 9))
+    assert max(agent.batch_sizes) == 8
+    assert all(size <= 8 for size in agent.batch_sizes)
+
+
+def test_position_is_copied_at_submit(broker: InferenceBroker, agent: RecordingAgent) -> None:
+    agent.release.clear()
+    board = Board()
+    future = broker.submit(board)
+    board.place_mark(0, "X")
+    agent.release.set()
+
+    assert future.result(5) == 0
+
+
+def test_bad_position_fails_only_its_own_request(
+    broker: InferenceBroker, agent: RecordingAgent
+) -> None:
+    agent.release.clear()
+    good = broker.submit(board_from("X........"))
+    bad = broker.submit(board_from("XOXOXOXOX"))
+    agent.release.set()
+
+    assert good.result(5) == 1
+    with pytest.raises(ValueError):
+        bad.result(5)
+
+
+def test_asyncio_front_end(broker: InferenceBroker) -> None:
+    async def play() -> list[int]:
+        boards = [board_from("." * n + "X" + "." * (8 - n)) for n in range(3)]
+        return await asyncio.gather(*(broker.choose_move_async(board) for board in boards))
+
+    assert asyncio.run(play()) == [1, 0, 0]
+
+
+def test_metrics_count_requests_and_batches(broker: InferenceBroker, agent: RecordingAgent) -> None:
+    agent.release.clear()
+    futures = [broker.submit(Board()) for _ in range(5)]
+    depth = broker.metrics().queue_depth
+    agent.release.set()
+    for future in futures:
+        future.result(5)
+
+    metrics = broker.metrics()
+
+    assert 0 <= depth <= 5
+    assert metrics.requests == 5
+    assert metrics.batches == len(agent.batch_sizes)
+    assert metrics.largest_batch == max(agent.batch_sizes)
+    assert metrics.max_queue_depth >= metrics.largest_batch
+    assert metrics.mean_batch_size == 5 / metrics.batches
+
+
+def test_requests_are_counted_when_their_batch_runs(
+    broker: InferenceBroker, agent: RecordingAgent
+) -> None:
+    agent.release.clear()
+    first = broker.submit(Board())
+    while broker.metrics().batches == 0:
+        time.sleep(0.001)
+    queued = [broker.submit(Board()) for _ in range(4)]
+
+    assert broker.metrics().requests == 1
+
+    agent.release.set()
+    for future in [first, *queued]:
+        future.result(5)
+
+    metrics = broker.metrics()
+    assert metrics.requests == 5
+    assert metrics.mean_batch_size == 5 / metrics.batches
+
+
+def test_rejects_boards_other_than_three_by_three(broker: InferenceBroker) -> None:
+    with pytest.raises(ValueError):
+        broker.submit(Board(size=4, win_length=4))
+    with pytest.raises(ValueError):
+        broker.submit(Board(win_length=2))
+
+
+def test_closed_event_loop_does_not_stop_the_worker(
+    broker: InferenceBroker, agent: RecordingAgent
+) -> None:
+    agent.release.clear()
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(broker.choose_move_async(Board()))
+    loop.run_until_complete(asyncio.sleep(0))
+    task.cancel()
+    loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+    loop.close()
+    while broker.metrics().batches == 0:
+        time.sleep(0.001)
+    agent.release.set()
+
+    assert broker.choose_move(board_from("X........"), timeout=2) == 1
+
+
+def test_close_drains_queue_and_rejects_new_requests(agent: RecordingAgent) -> None:
+    broker = InferenceBroker(agent, max_wait_ms=50)
+    futures = [broker.submit(Board()) for _ in range(3)]
+    broker.close()
+
+    assert all(future.done() for future in futures)
+    with pytest.raises(RuntimeError):
+        broker.submit(Board())
+
+
+def test_rejects_empty_batches(agent: RecordingAgent) -> None:
+    with pytest.raises(ValueError):
+        InferenceBroker(agent, max_batch_size=0)
+
+
+def test_serves_a_real_agent() -> None:
+    with InferenceBroker(PerfectPlayAgent()) as broker:
+        assert broker.choose_move(board_from("XX.OO.X..")) == 5
@@ -0,0 +1,140 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from ttt_core.ai import perfect_play, qtable
+from ttt_core.ai.agents import QAgent
+from ttt_core.ai.cache import AgentCache, load_agent, model_key, shared_agent_cache
+from ttt_core.ai.perfect_play import PerfectPlayAgent
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, path: str) -> object:
+        self.calls.append(path)
+        return object()
+
+
+@pytest.fixture
+def loader() -> CountingLoader:
+    return CountingLoader()
+
+
+@pytest.fixture
+def models(tmp_path: Path) -> list[str]:
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.model"
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+    return paths
+
+
+def test_second_get_is_a_hit(loader: CountingLoader, models: list[str]) -> None:
+    cache = AgentCache(loader=loader)
+
+    first = cache.get(models[0])
+
+    assert cache.get(models[0]) is first
+    assert loader.calls == [models[0]]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted(loader: CountingLoader, models: list[str]) -> None:
+    cache = AgentCache(max_entries=2, loader=loader)
+    cache.get(models[0])
+    cache.get(models[1])
+    cache.get(models[0])
+    cache.get(models[2])
+
+    assert models[0] in cache
+    assert models[1] not in cache
+    assert len(cache) == 2
+
+
+def test_changed_file_is_reloaded_and_replaces_stale_entry(
+    loader: CountingLoader, models: list[str]
+) -> None:
+    cache = AgentCache(loader=loader)
+    first = cache.get(models[0])
+    stat = os.stat(models[0])
+    Path(models[0]).write_bytes(b"retrained")
+    os.utime(models[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get(models[0]) is not first
+    assert len(cache) == 1
+    assert cache.misses == 2
+
+
+def test_key_is_path_mtime_and_size(models: list[str]) -> None:
+    path, mtime, size = model_key(models[0])
+
+    assert path == os.path.abspath(models[0])
+    assert mtime == os.stat(models[0]).st_mtime_ns
+    assert size == 1
+
+
+def test_preload_warms_cache_without_counting(loader: CountingLoader, models: list[str]) -> None:
+    cache = AgentCache(loader=loader)
+
+    cache.preload([*models[:2], "missing.model"]).join()
+
+    assert models[0] in cache and models[1] in cache
+    assert (cache.hits, cache.misses) == (0, 0)
+    cache.get(models[0])
+    assert cache.hits == 1
+
+
+def test_concurrent_requests_load_once(models: list[str]) -> None:
+    release = threading.Event()
+    calls = []
+
+    def slow_loader(path: str) -> object:
+        calls.append(path)
+        release.wait(5)
+        return object()
+
+    cache = AgentCache(loader=slow_loader)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get(models[0]))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(agent) for agent in results}) == 1
+
+
+def test_failed_load_is_not_cached(models: list[str]) -> None:
+    def failing(path: str) -> object:
+        raise ValueError("bad model")
+
+    cache = AgentCache(loader=failing)
+
+    with pytest.raises(ValueError):
+        cache.get(models[0])
+    assert models[0] not in cache
+
+
+def test_missing_file_raises(loader: CountingLoader) -> None:
+    with pytest.raises(OSError):
+        AgentCache(loader=loader).get("missing.model")
+
+
+def test_load_agent_picks_agent_by_file_type(tmp_path: Path) -> None:
+    dense = qtable.write_qtable(tmp_path / "q.qtab", qtable.dense_from_dict({}))
+
+    assert isinstance(load_agent(str(perfect_play.DEFAULT_TABLE_PATH)), PerfectPlayAgent)
+    assert isinstance(load_agent(str(dense)), QAgent)
+
+
+def test_shared_cache_is_a_singleton() -> None:
+    assert shared_agent_cache() is shared_agent_cache()
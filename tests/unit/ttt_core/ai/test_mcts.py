@@ -0,0 +1,139 @@
+import random
+from typing import Iterator
+
+import pytest
+
+from ttt_core.ai import mcts
+from ttt_core.ai.mcts import DEFAULT_PLAYOUTS, MCTSAgent
+from ttt_core.domain.board import Board
+from ttt_core.domain.types import Mark
+from ttt_core.engine.game import Game
+from ttt_core.engine.stats import Stats
+
+
+def board_from(cells: str) -> Board:
+    board = Board()
+    board.cells = [value if value != "." else "" for value in cells]
+    return board
+
+
+def test_defaults_to_a_playout_budget() -> None:
+    agent = MCTSAgent()
+
+    assert agent.playouts == DEFAULT_PLAYOUTS
+    assert agent.time_limit_ms is None
+
+
+def test_playout_budget_is_respected() -> None:
+    agent = MCTSAgent(playouts=250, seed=0)
+    root = agent.search(Board())
+
+    assert agent.last_playouts == 250
+    assert root.visits == 250
+
+
+def test_deadline_stops_search() -> None:
+    agent = MCTSAgent(time_limit_ms=5, seed=0)
+    move = agent.choose_move(Board())
+
+    assert move in range(9)
+    assert agent.last_playouts > 0
+
+
+def test_zero_budget_still_returns_a_legal_move() -> None:
+    board = board_from("XO.......")
+
+    assert MCTSAgent(playouts=0, seed=0).choose_move(board) in board.legal_moves()
+
+
+def test_same_seed_gives_same_move() -> None:
+    board = board_from("X...O....")
+
+    first = MCTSAgent(playouts=300, seed=7).choose_move(board)
+
+    assert MCTSAgent(playouts=300, seed=7).choose_move(board) == first
+
+
+def test_takes_immediate_win() -> None:
+    assert MCTSAgent(playouts=500, seed=0).choose_move(board_from("XX.OO.X..")) == 5
+
+
+def test_blocks_opponent_win() -> None:
+    assert MCTSAgent(playouts=2_000, seed=0).choose_move(board_from("XX..O....")) == 2
+
+
+def test_subtree_is_reused_across_moves() -> None:
+    agent = MCTSAgent(playouts=500, seed=0)
+    game = Game(board=Board(), stats=Stats())
+    game.apply_move(0)
+    root = agent.search(game.board)
+    reply = max(root.children, key=lambda child: child.visits)
+    game.apply_move(reply.move)
+    game.apply_move(next(child.move for child in reply.children))
+
+    visited = reply.children[0].visits
+    next_root = agent.search(game.board)
+
+    assert next_root is reply.children[0]
+    assert next_root.parent is None
+    assert next_root.visits == visited + 500
+
+
+def test_raises_when_game_is_over() -> None:
+    with pytest.raises(ValueError):
+        MCTSAgent(playouts=10).choose_move(board_from("XXXOO...."))
+
+
+def test_plays_generalized_board() -> None:
+    board = Board(size=4, win_length=4)
+    board.cells = ["X", "X", "X", ""] + ["O", "O", "O", ""] + [""] * 8
+
+    assert MCTSAgent(playouts=500, seed=0).choose_move(board) == 3
+
+
+def test_does_not_lose_to_random_play() -> None:
+    agent = MCTSAgent(playouts=500, seed=0)
+    rng = random.Random(0)
+    for _ in range(10):
+        game = Game(board=Board(), stats=Stats())
+        while not game.game_over:
+            if game.current_move_mark is Mark.O_MARK:
+                move = agent.choose_move(game.board)
+            else:
+                move = rng.choice(game.board.legal_moves())
+            status = game.apply_move(move)
+        assert status.winner is not Mark.X_MARK
+
+
+@pytest.fixture
+def pooled() -> Iterator[None]:
+    yield
+    mcts.shutdown_pools()
+
+
+def test_root_parallel_search_merges_worker_visits(pooled: None) -> None:
+    agent = MCTSAgent(playouts=601, seed=0, workers=2)
+
+    assert agent.choose_move(board_from("XX.OO.X..")) == 5
+    assert agent.last_playouts == 601
+
+
+def test_worker_pool_is_shared_across_agents_and_games(pooled: None) -> None:
+    first = MCTSAgent(playouts=50, seed=0, workers=2)
+    first.choose_move(Board())
+    pool = mcts.shared_pool(2)
+    MCTSAgent(playouts=50, seed=1, workers=2).choose_move(board_from("X........"))
+
+    assert mcts.shared_pool(2) is pool
+
+
+def test_root_parallel_search_is_reproducible(pooled: None) -> None:
+    board = board_from("X...O....")
+    first = MCTSAgent(playouts=200, seed=3, workers=2).choose_move(board)
+
+    assert MCTSAgent(playouts=200, seed=3, workers=2).choose_move(board) == first
+
+
+def test_root_parallel_search_raises_when_game_is_over(pooled: None) -> None:
+    with pytest.raises(ValueError):
+        MCTSAgent(playouts=10, workers=2).choose_move(board_from("XXXOO...."))
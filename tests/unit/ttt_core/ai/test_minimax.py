@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from ttt_core.ai.minimax import MinimaxAgent
+from ttt_core.domain.board import Board
+from ttt_core.domain.types import Mark
+from ttt_core.engine.game import Game
+from ttt_core.engine.stats import Stats
+
+
+def board_from(cells: str) -> Board:
+    board = Board()
+    board.cells = [value if value != "." else "" for value in cells]
+    return board
+
+
+@pytest.fixture
+def agent() -> MinimaxAgent:
+    return MinimaxAgent()
+
+
+def test_takes_immediate_win(agent: MinimaxAgent) -> None:
+    # O to move, can win on 5 or must otherwise block X on 2.
+    assert agent.choose_move(board_from("XX.OO.X..")) == 5
+
+
+def test_blocks_opponent_win(agent: MinimaxAgent) -> None:
+    assert agent.choose_move(board_from("XX..O....")) == 2
+
+
+def test_prefers_faster_win(agent: MinimaxAgent) -> None:
+    # X wins at once on 2; 8 would also win later but slower.
+    assert agent.choose_move(board_from("XX.OO....")) == 2
+
+
+def test_raises_on_full_board(agent: MinimaxAgent) -> None:
+    with pytest.raises(ValueError):
+        agent.choose_move(board_from("XOXXOOOXX"))
+
+
+def test_repeat_query_is_a_table_lookup(agent: MinimaxAgent) -> None:
+    board = Board()
+    first = agent.choose_move(board)
+    nodes = agent.nodes
+
+    assert agent.choose_move(board) == first
+    assert agent.nodes == nodes
+
+
+@pytest.mark.parametrize("agent_mark", [Mark.X_MARK, Mark.O_MARK])
+def test_never_loses_to_random_play(agent: MinimaxAgent, agent_mark: Mark) -> None:
+    rng = random.Random(0)
+    for _ in range(100):
+        game = Game(board=Board(), stats=Stats())
+        while not game.game_over:
+            if game.current_move_mark is agent_mark:
+                move = agent.choose_move(game.board)
+            else:
+                move = rng.choice(game.board.legal_moves())
+            status = game.apply_move(move)
+        assert status.winner in (None, agent_mark)
+
+
+def test_self_play_is_a_draw(agent: MinimaxAgent) -> None:
+    game = Game(board=Board(), stats=Stats())
+    while not game.game_over:
+        status = game.apply_move(agent.choose_move(game.board))
+
+    assert status.is_draw
+
+
+def test_switching_board_shape_resets_tables(agent: MinimaxAgent) -> None:
+    agent.choose_move(Board())
+    board = Board(size=4, win_length=4)
+    board.cells = ["X", "X", "X", ""] + ["O", "O", "O", ""] + [""] * 8
+
+    assert agent.choose_move(board) == 3
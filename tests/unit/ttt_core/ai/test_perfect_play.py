@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from ttt_core.ai import perfect_play
+from ttt_core.ai.minimax import MinimaxAgent
+from ttt_core.ai.perfect_play import PerfectPlayAgent
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+
+def board_from(cells: str) -> Board:
+    board = Board()
+    board.cells = [value if value != "." else "" for value in cells]
+    return board
+
+
+@pytest.fixture(scope="module")
+def agent() -> PerfectPlayAgent:
+    return PerfectPlayAgent()
+
+
+def test_shipped_table_matches_a_fresh_solve() -> None:
+    assert list(perfect_play.load_table()) == perfect_play.solve()
+
+
+def test_empty_board_is_a_draw_with_every_move_optimal(agent: PerfectPlayAgent) -> None:
+    entry = agent.table[0]
+
+    assert perfect_play.entry_value(entry) == perfect_play.DRAW
+    assert perfect_play.entry_plies(entry) == 9
+    assert agent.optimal_moves(Board()) == rules.FULL_MASK
+
+
+def test_reachable_position_count(agent: PerfectPlayAgent) -> None:
+    assert sum(1 for entry in agent.table if entry) == 5478
+
+
+def test_takes_immediate_win(agent: PerfectPlayAgent) -> None:
+    board = board_from("XX.OO.X..")
+
+    assert agent.choose_move(board) == 5
+    assert perfect_play.entry_value(agent.table[board.position_index()]) == perfect_play.WIN
+
+
+def test_optimal_moves_agree_with_minimax(agent: PerfectPlayAgent) -> None:
+    minimax = MinimaxAgent()
+    for index, entry in enumerate(agent.table):
+        if entry & perfect_play.MOVE_MASK:
+            board = Board()
+            board.cells = rules.index_cells(index)
+            assert entry >> minimax.choose_move(board) & 1
+
+
+def test_raises_when_game_is_over(agent: PerfectPlayAgent) -> None:
+    with pytest.raises(ValueError):
+        agent.choose_move(board_from("XXXOO...."))
+
+
+def test_round_trip_through_file(tmp_path: Path) -> None:
+    path = perfect_play.write_table(tmp_path / "table.bin")
+
+    assert list(perfect_play.load_table(path)) == list(perfect_play.load_table())
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:4],
+        lambda data: b"NOPE" + data[4:],
+        lambda data: data[:4] + b"\x63\x00" + data[6:],
+        lambda data: data[:6] + b"\x01\x00" + data[8:],
+    ],
+)
+def test_rejects_bad_files(corrupt) -> None:
+    data = perfect_play.DEFAULT_TABLE_PATH.read_bytes()
+
+    with pytest.raises(ValueError):
+        perfect_play.decode_table(corrupt(data))
+
+
+def test_choose_moves_matches_choose_move(agent: PerfectPlayAgent) -> None:
+    boards = []
+    for index, entry in enumerate(agent.table):
+        if entry & perfect_play.MOVE_MASK:
+            board = Board()
+            board.cells = rules.index_cells(index)
+            boards.append(board)
+
+    assert agent.choose_moves(boards).tolist() == [agent.choose_move(b) for b in boards]
+
+
+def test_choose_moves_raises_when_a_game_is_over(agent: PerfectPlayAgent) -> None:
+    with pytest.raises(ValueError):
+        agent.choose_moves([Board(), board_from("XXXOO....")])
@@ -0,0 +1,214 @@
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ttt_core.ai import qtable
+from ttt_core.ai.agents import QAgent, rekey_q_table
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+
+@pytest.fixture
+def legacy_table() -> dict:
+    return {
+        ("X O      ", 1): 0.5,
+        ("X O      ", 3): 1.0,
+        ("        X", 0): -0.25,
+    }
+
+
+@pytest.fixture
+def qtable_file(tmp_path: Path, legacy_table: dict) -> Path:
+    return qtable.write_qtable(tmp_path / "model.qtab", qtable.dense_from_dict(legacy_table))
+
+
+def test_dense_rows_are_indexed_by_position(legacy_table: dict) -> None:
+    values = qtable.dense_from_dict(legacy_table)
+    board = Board()
+    board.cells = ["X", "", "O", "", "", "", "", "", ""]
+
+    assert values.shape == (rules.POSITION_COUNT, 9)
+    assert values.dtype == np.float32
+    assert values[board.position_index(), 3] == 1.0
+    assert values[board.position_index(), 1] == 0.5
+    assert np.count_nonzero(values) == 3
+
+
+def test_round_trip_is_memory_mapped(qtable_file: Path, legacy_table: dict) -> None:
+    values = qtable.load_qtable(qtable_file)
+
+    assert isinstance(values, np.memmap)
+    assert not values.flags.writeable
+    np.testing.assert_array_equal(values, qtable.dense_from_dict(legacy_table))
+
+
+def test_is_qtable_checks_magic(qtable_file: Path, tmp_path: Path) -> None:
+    other = tmp_path / "model.pkl"
+    other.write_bytes(b"\x80\x04not a table")
+
+    assert qtable.is_qtable(qtable_file)
+    assert not qtable.is_qtable(other)
+
+
+def test_write_rejects_wrong_shape(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        qtable.write_qtable(tmp_path / "bad.qtab", np.zeros((10, 9)))
+
+
+@pytest.mark.parametrize(
+    "offset, patch",
+    [
+        (0, b"NOPE"),
+        (4, b"\x09\x00"),
+        (6, b"\x07\x00"),
+        (qtable.HEADER_SIZE + 40, b"\x01\x02\x03\x04"),
+    ],
+)
+def test_load_rejects_corrupt_files(qtable_file: Path, offset: int, patch: bytes) -> None:
+    data = bytearray(qtable_file.read_bytes())
+    data[offset : offset + len(patch)] = patch
+    qtable_file.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        qtable.load_qtable(qtable_file)
+
+
+def test_load_rejects_truncated_file(qtable_file: Path) -> None:
+    qtable_file.write_bytes(qtable_file.read_bytes()[:-4])
+
+    with pytest.raises(ValueError):
+        qtable.load_qtable(qtable_file)
+
+
+def test_convert_pickle_writes_sibling_file(tmp_path: Path, legacy_table: dict) -> None:
+    source = tmp_path / "agent.pkl"
+    with open(source, "wb") as handle:
+        pickle.dump(legacy_table, handle)
+
+    target = qtable.convert_pickle(source)
+
+    assert target == tmp_path / "agent.qtab"
+    np.testing.assert_array_equal(qtable.load_qtable(target), qtable.dense_from_dict(legacy_table))
+
+
+def test_convert_pickle_accepts_zobrist_keys(tmp_path: Path, legacy_table: dict) -> None:
+    source = tmp_path / "trained.pkl"
+    with open(source, "wb") as handle:
+        pickle.dump(dict(rekey_q_table(legacy_table)), handle)
+
+    target = qtable.convert_pickle(source)
+
+    np.testing.assert_array_equal(
+        qtable.load_qtable(target), QAgent(str(source))._rows().astype(np.float32)
+    )
+    assert np.count_nonzero(qtable.load_qtable(target)) == 3
+
+
+def test_dense_from_dict_skips_keys_of_no_position() -> None:
+    assert not qtable.dense_from_dict({(12345, 0): 1.0}).any()
+
+
+@pytest.mark.parametrize("value_type, itemsize", [("float16", 2), ("int8", 1)])
+def test_quantized_round_trip(
+    tmp_path: Path, legacy_table: dict, value_type: str, itemsize: int
+) -> None:
+    values = qtable.dense_from_dict(legacy_table)
+    path = qtable.write_qtable(tmp_path / "q.qtab", values, value_type)
+
+    header = qtable.read_header(path)
+    stored = qtable.load_qtable(path)
+
+    assert header.value_type == value_type
+    assert stored.dtype.itemsize == itemsize
+    assert path.stat().st_size == qtable.HEADER_SIZE + values.size * itemsize
+    np.testing.assert_allclose(qtable.dequantize(stored, header.scale), values, atol=0.01)
+
+
+def test_int8_scale_maps_peak_to_127() -> None:
+    stored, scale = qtable.quantize(np.array([[0.0, -0.5, 2.0]]), "int8")
+
+    assert stored.tolist() == [[0, -32, 127]]
+    assert scale == pytest.approx(2.0 / 127)
+
+
+def test_unknown_value_type_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        qtable.write_qtable(tmp_path / "q.qtab", np.zeros((rules.POSITION_COUNT, 9)), "int4")
+
+
+def test_version_1_files_still_load(tmp_path: Path, legacy_table: dict) -> None:
+    body = qtable.dense_from_dict(legacy_table).astype("<f4").tobytes()
+    header = struct.pack("<4sHHIII", qtable.MAGIC, 1, 1, rules.POSITION_COUNT, 9, zlib.crc32(body))
+    path = tmp_path / "v1.qtab"
+    path.write_bytes(header.ljust(qtable.HEADER_SIZE, b"\0") + body)
+
+    assert qtable.read_header(path).value_type == "float32"
+    np.testing.assert_array_equal(qtable.load_qtable(path), qtable.dense_from_dict(legacy_table))
+
+
+def test_verifier_reports_positions_whose_greedy_moves_change() -> None:
+    board = Board()
+    board.cells = ["X", "", "O", "", "", "", "", "", ""]
+    reference = np.zeros((rules.POSITION_COUNT, 9))
+    reference[board.position_index(), [1, 3]] = [1.0, 1.001]
+    reference[0, 4] = 100.0
+
+    stored, scale = qtable.quantize(reference, "int8")
+
+    assert qtable.policy_mismatches(reference, reference).tolist() == []
+    assert qtable.policy_mismatches(reference, stored).tolist() == [board.position_index()]
+
+
+def test_verifier_ignores_unreachable_positions() -> None:
+    reference = np.zeros((rules.POSITION_COUNT, 9))
+    candidate = reference.copy()
+    candidate[rules.POSITION_COUNT - 1, 0] = 1.0
+
+    assert qtable.policy_mismatches(reference, candidate).size == 0
+
+
+def test_cli_exports_and_verifies(
+    tmp_path: Path, legacy_table: dict, capsys: pytest.CaptureFixture
+) -> None:
+    source = tmp_path / "agent.pkl"
+    with open(source, "wb") as handle:
+        pickle.dump(legacy_table, handle)
+
+    assert qtable.main(["--dtype", "int8", str(source)]) == 0
+    assert (tmp_path / "agent.int8.qtab").exists()
+    assert "0 reachable positions differ" in capsys.readouterr().out
+
+
+def test_cli_reports_float32_rounding_that_changes_a_greedy_move(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    source = tmp_path / "agent.pkl"
+    with open(source, "wb") as handle:
+        pickle.dump({("X        ", 1): 0.1, ("X        ", 2): 0.1 + 1e-12}, handle)
+
+    assert qtable.main([str(source)]) == 1
+    assert "1 reachable positions differ" in capsys.readouterr().out
+    assert qtable.main(["--no-verify", str(source)]) == 0
+
+
+def test_ensure_export_regenerates_stale_copies(tmp_path: Path, legacy_table: dict) -> None:
+    source = tmp_path / "agent.pkl"
+    with open(source, "wb") as handle:
+        pickle.dump(legacy_table, handle)
+
+    target = qtable.ensure_export(source)
+    written = target.stat().st_mtime_ns
+    assert qtable.ensure_export(source) == target
+    assert target.stat().st_mtime_ns == written
+
+    with open(source, "wb") as handle:
+        pickle.dump({("X O      ", 1): 2.0}, handle)
+    os.utime(source, ns=(written + 1_000_000, written + 1_000_000))
+
+    refreshed = qtable.load_qtable(qtable.ensure_export(source))
+    assert refreshed[rules.position_index("X O      "), 1] == 2.0
@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from ttt_core.ai import qtable
+from ttt_core.ai.agents import QAgent
+from ttt_core.ai.reload import ReloadingAgent, answers_empty_board
+from ttt_core.domain.board import Board
+
+
+class StubAgent:
+    def __init__(self, move: int) -> None:
+        self.move = move
+
+    def choose_move(self, board: Board) -> int:
+        return self.move
+
+
+def load_stub(path: str) -> StubAgent:
+    text = Path(path).read_text()
+    if not text.isdigit():
+        raise ValueError(f"corrupt model {text!r}")
+    return StubAgent(int(text))
+
+
+def rewrite(path: Path, text: str) -> None:
+    """Write new content and bump mtime so the change is visible on coarse clocks."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def model(tmp_path: Path) -> Path:
+    path = tmp_path / "model.txt"
+    path.write_text("4")
+    return path
+
+
+@pytest.fixture
+def reloading(model: Path) -> Iterator[ReloadingAgent]:
+    agent = ReloadingAgent(str(model), loader=load_stub, watch=False)
+    yield agent
+    agent.close()
+
+
+def test_serves_initial_model(reloading: ReloadingAgent) -> None:
+    assert reloading.choose_move(Board()) == 4
+
+
+def test_unchanged_file_is_not_reloaded(reloading: ReloadingAgent) -> None:
+    assert reloading.check_now() is False
+    assert reloading.metrics().reloads == 0
+
+
+def test_changed_file_is_swapped_in(reloading: ReloadingAgent, model: Path) -> None:
+    before = reloading.agent
+    rewrite(model, "7")
+
+    assert reloading.check_now() is True
+    assert reloading.agent is not before
+    assert reloading.choose_move(Board()) == 7
+    metrics = reloading.metrics()
+    assert metrics.reloads == 1
+    assert metrics.last_latency_ms >= 0
+    assert metrics.max_latency_ms >= metrics.last_latency_ms
+
+
+def test_failed_load_keeps_serving_old_model(reloading: ReloadingAgent, model: Path) -> None:
+    rewrite(model, "half-written")
+
+    assert reloading.check_now() is False
+    assert reloading.choose_move(Board()) == 4
+    metrics = reloading.metrics()
+    assert metrics.failures == 1
+    assert "corrupt model" in metrics.last_error
+
+    rewrite(model, "2")
+    assert reloading.check_now() is True
+    assert reloading.metrics().last_error is None
+
+
+def test_failed_file_is_retried_only_once_it_changes(model: Path) -> None:
+    attempts = []
+
+    def counting_loader(path: str) -> StubAgent:
+        attempts.append(path)
+        return load_stub(path)
+
+    reloading = ReloadingAgent(str(model), loader=counting_loader, watch=False)
+    rewrite(model, "broken")
+
+    assert reloading.check_now() is False
+    assert reloading.check_now() is False
+    assert len(attempts) == 2
+    assert reloading.metrics().failures == 1
+
+    rewrite(model, "6")
+    assert reloading.check_now() is True
+    assert reloading.choose_move(Board()) == 6
+    assert len(attempts) == 3
+
+
+def test_model_failing_validation_is_not_published(reloading: ReloadingAgent, model: Path) -> None:
+    reloading._validate = answers_empty_board
+    rewrite(model, "9")
+
+    assert reloading.check_now() is False
+    assert reloading.choose_move(Board()) == 4
+    assert reloading.metrics().failures == 1
+
+
+def test_missing_file_is_ignored_until_it_returns(reloading: ReloadingAgent, model: Path) -> None:
+    model.unlink()
+
+    assert reloading.check_now() is False
+    assert reloading.metrics().failures == 0
+
+
+def test_watcher_thread_picks_up_changes(model: Path) -> None:
+    reloaded = threading.Event()
+
+    def validate(agent: StubAgent) -> None:
+        if agent.move == 1:
+            reloaded.set()
+
+    agent = ReloadingAgent(str(model), loader=load_stub, validate=validate, poll_interval=0.01)
+    try:
+        rewrite(model, "1")
+        assert reloaded.wait(5)
+        deadline = time.monotonic() + 5
+        while agent.choose_move(Board()) != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert agent.choose_move(Board()) == 1
+    finally:
+        agent.close()
+
+
+def test_reloads_real_q_table(tmp_path: Path) -> None:
+    path = tmp_path / "q.qtab"
+    values = qtable.dense_from_dict({("         ", 4): 1.0})
+    qtable.write_qtable(path, values)
+    agent = ReloadingAgent(str(path), watch=False)
+    assert isinstance(agent.agent, QAgent)
+    assert agent.choose_move(Board()) == 4
+
+    values = qtable.dense_from_dict({("         ", 8): 1.0})
+    qtable.write_qtable(path, values)
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+    assert agent.check_now() is True
+    assert agent.choose_move(Board()) == 8
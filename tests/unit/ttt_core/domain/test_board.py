@@ -47,3 +47,88 @@ def test_winner_mark_returns_mark_when_winner_exists() -> None:
     winner = board.winner_mark()
 
     assert winner == Mark.X_MARK
+
+
+def test_place_mark_sets_bitboard_bits() -> None:
+    board = Board()
+
+    board.place_mark(0, Mark.X_MARK)
+    board.place_mark(8, Mark.O_MARK)
+
+    assert board.x_bits == 0b000000001
+    assert board.o_bits == 0b100000000
+
+
+def test_cells_is_derived_copy_of_bitboards() -> None:
+    board = Board()
+    board.place_mark(2, Mark.O_MARK)
+
+    cells = board.cells
+    cells[0] = "X"
+
+    assert board.cells == ["", "", "O", "", "", "", "", "", ""]
+    assert board.x_bits == 0
+
+
+def test_assigning_cells_rebuilds_bitboards() -> None:
+    board = Board()
+
+    board.cells = ["X", "", "O", "", "", "", "", "", "X"]
+
+    assert board.x_bits == 0b100000001
+    assert board.o_bits == 0b000000100
+    assert board.legal_moves() == [1, 3, 4, 5, 6, 7]
+
+
+def test_winner_mark_detects_o_diagonal() -> None:
+    board = Board()
+    board.cells = ["X", "X", "O", "", "O", "", "O", "", "X"]
+
+    assert board.winner_mark() == Mark.O_MARK
+
+
+def test_is_draw_when_all_bits_set() -> None:
+    board = Board()
+    board.cells = ["X", "O", "X", "X", "O", "O", "O", "X", "X"]
+
+    assert board.is_draw() is True
+    assert board.legal_moves() == []
+
+
+def test_outcome_uses_bitboard_index() -> None:
+    board = Board()
+    board.cells = ["", "", "", "X", "X", "X", "O", "O", ""]
+
+    assert board.position_index() == 3**3 + 3**4 + 3**5 + 2 * 3**6 + 2 * 3**7
+    assert board.outcome().win_line == (3, 4, 5)
+
+
+def test_large_board_legal_moves_and_draw() -> None:
+    board = Board(size=15, win_length=5)
+    board.place_mark(0, Mark.X_MARK)
+    board.place_mark(224, Mark.O_MARK)
+
+    moves = board.legal_moves()
+
+    assert len(board.cells) == 225
+    assert len(moves) == 223
+    assert 0 not in moves and 224 not in moves
+    assert board.is_draw() is False
+
+
+def test_large_board_winner() -> None:
+    board = Board(size=7, win_length=5)
+    for idx in (8, 16, 24, 32, 40):
+        board.place_mark(idx, Mark.O_MARK)
+
+    assert board.winner_mark() == Mark.O_MARK
+
+
+def test_clear_keeps_geometry() -> None:
+    board = Board(size=4, win_length=4)
+    board.place_mark(5, Mark.X_MARK)
+
+    board.clear()
+
+    assert board.legal_moves() == list(range(16))
+    assert board.geometry.size == 4
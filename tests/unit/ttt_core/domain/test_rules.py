@@ -1,4 +1,22 @@
-from ttt_core.domain.rules import has_winner, is_draw
+import numpy as np
+import pytest
+
+from ttt_core.domain.rules import (
+    POSITION_COUNT,
+    WIN_LINES,
+    WIN_MASKS,
+    bits_index,
+    cells_to_bits,
+    evaluate_batch,
+    geometry,
+    has_winner,
+    index_cells,
+    is_draw,
+    outcome,
+    outcome_table,
+    position_index,
+    winning_mask,
+)
 
 
 def test_has_winner_detects_row_win() -> None:
@@ -55,3 +73,118 @@ def test_is_draw_returns_false_when_board_not_full() -> None:
     result = is_draw(cells)
 
     assert result is False
+
+
+def test_winning_mask_matches_line_bits() -> None:
+    x_bits, _ = cells_to_bits(["", "", "X", "", "X", "", "X", "", ""])
+
+    assert winning_mask(x_bits) == WIN_MASKS[WIN_LINES.index((2, 4, 6))]
+
+
+def test_winning_mask_none_without_full_line() -> None:
+    x_bits, o_bits = cells_to_bits(["X", "O", "X", "X", "O", "O", "O", "X", "X"])
+
+    assert winning_mask(x_bits) is None
+    assert winning_mask(o_bits) is None
+
+
+def test_position_index_is_base_three() -> None:
+    cells = ["X", "O", "", "", "", "", "", "", "O"]
+
+    assert position_index(cells) == 1 + 2 * 3 + 2 * 3**8
+    assert index_cells(position_index(cells)) == cells
+
+
+def test_position_index_treats_a_space_as_empty() -> None:
+    assert position_index("XO      O") == position_index(["X", "O", "", "", "", "", "", "", "O"])
+
+
+def test_position_index_round_trips_every_index() -> None:
+    assert all(position_index(index_cells(index)) == index for index in range(POSITION_COUNT))
+
+
+@pytest.mark.parametrize("cells", [["X"] * 8, [""] * 16, ["X", "Z", "", "", "", "", "", "", ""]])
+def test_position_index_rejects_invalid_boards(cells: list) -> None:
+    with pytest.raises(ValueError):
+        position_index(cells)
+
+
+def test_has_winner_rejects_invalid_boards() -> None:
+    with pytest.raises(ValueError):
+        has_winner(["X", "X", "X"])
+
+
+def test_bits_index_matches_position_index() -> None:
+    cells = ["X", "", "O", "", "X", "O", "", "", "X"]
+
+    assert bits_index(*cells_to_bits(cells)) == position_index(cells)
+
+
+def test_outcome_table_covers_every_position() -> None:
+    assert len(outcome_table()) == POSITION_COUNT
+
+
+def test_outcome_reports_winner_line_and_draw() -> None:
+    won = outcome(position_index(["O", "", "", "O", "X", "", "O", "X", "X"]))
+    drawn = outcome(position_index(["X", "O", "X", "X", "O", "O", "O", "X", "X"]))
+
+    assert won == ("O", (0, 3, 6), False)
+    assert drawn == (None, None, True)
+
+
+def test_is_draw_false_when_last_move_wins() -> None:
+    cells = ["X", "O", "X", "O", "X", "O", "O", "X", "X"]
+
+    assert has_winner(cells)[1] == "X"
+    assert is_draw(cells) is False
+
+
+def test_classic_geometry_matches_win_lines() -> None:
+    classic = geometry(3, 3)
+
+    assert classic.lines == tuple(WIN_LINES)
+    assert classic.line_masks == tuple(WIN_MASKS)
+    assert classic.lines_through[4] == (1, 4, 6, 7)
+    assert classic.lines_through[0] == (0, 3, 6)
+
+
+@pytest.mark.parametrize(
+    "size,win_length,line_total",
+    [(4, 4, 10), (7, 5, 60), (15, 5, 572)],
+)
+def test_geometry_counts_every_window(size: int, win_length: int, line_total: int) -> None:
+    shape = geometry(size, win_length)
+
+    assert len(shape.lines) == line_total
+    assert all(len(line) == win_length for line in shape.lines)
+    assert geometry(size, win_length) is shape
+
+
+def test_geometry_rejects_win_length_longer_than_side() -> None:
+    with pytest.raises(ValueError):
+        geometry(3, 4)
+
+
+def test_evaluate_batch_matches_scalar_api() -> None:
+    rows = [
+        ["X", "X", "X", "", "", "", "", "", ""],
+        ["X", "O", "X", "X", "O", "O", "O", "X", "X"],
+        ["O", "", "", "O", "X", "", "O", "X", "X"],
+        ["X", "O", "X", "O", "X", "O", "O", "X", "X"],
+        ["", "", "", "", "", "", "", "", ""],
+    ]
+    boards = np.array([[("", "X", "O").index(cell) for cell in row] for row in rows], np.int8)
+
+    batch = evaluate_batch(boards)
+
+    for i, cells in enumerate(rows):
+        _, winner, line = has_winner(cells)
+        assert batch.winner[i] == ("", "X", "O").index(winner or "")
+        assert batch.win_line[i] == (WIN_LINES.index(line) if line else -1)
+        assert batch.is_draw[i] == is_draw(cells)
+        assert batch.legal_mask[i] == sum(1 << idx for idx, cell in enumerate(cells) if not cell)
+
+
+def test_evaluate_batch_rejects_wrong_shape() -> None:
+    with pytest.raises(ValueError):
+        evaluate_batch(np.zeros((4, 16), dtype=np.int8))
@@ -0,0 +1,78 @@
+import pytest
+
+from ttt_core.domain import symmetry
+from ttt_core.domain.board import Board
+from ttt_core.domain.rules import POSITION_COUNT, WIN_LINES, bits_index
+
+
+def board_from(cells: str) -> Board:
+    board = Board()
+    board.cells = [cell.strip() for cell in cells]
+    return board
+
+
+def test_transforms_form_a_group() -> None:
+    transforms = set(symmetry.TRANSFORMS)
+
+    assert len(transforms) == 8
+    for first in symmetry.TRANSFORMS:
+        for then in symmetry.TRANSFORMS:
+            assert tuple(then[first[idx]] for idx in range(9)) in transforms
+
+
+def test_transforms_map_win_lines_to_win_lines() -> None:
+    lines = {frozenset(line) for line in WIN_LINES}
+
+    for perm in symmetry.TRANSFORMS:
+        assert {frozenset(perm[idx] for idx in line) for line in WIN_LINES} == lines
+
+
+def test_inverse_id_undoes_transform() -> None:
+    for transform, inverse in enumerate(symmetry.INVERSE_ID):
+        for mask in (0b1, 0b110, 0b100010001):
+            there = symmetry.transform_bits(mask, transform)
+            assert symmetry.transform_bits(there, inverse) == mask
+
+
+@pytest.mark.parametrize("cells", ["X   O    ", "  X   O X", "XO  X   O"])
+def test_every_symmetric_image_shares_canonical_form(cells: str) -> None:
+    board = board_from(cells)
+    expected = symmetry.canonicalize(board)
+
+    for transform in range(8):
+        image = Board(
+            x_bits=symmetry.transform_bits(board.x_bits, transform),
+            o_bits=symmetry.transform_bits(board.o_bits, transform),
+        )
+        canonical = symmetry.canonicalize(image)
+
+        assert canonical.index == expected.index
+        assert (canonical.x_bits, canonical.o_bits) == (expected.x_bits, expected.o_bits)
+
+
+def test_canonical_form_is_reached_by_reported_transform() -> None:
+    board = board_from("  X   O  ")
+
+    canonical = symmetry.canonicalize(board)
+
+    assert canonical.x_bits == symmetry.transform_bits(board.x_bits, canonical.transform)
+    assert bits_index(canonical.x_bits, canonical.o_bits) == canonical.index
+
+
+def test_moves_round_trip_through_canonical_space() -> None:
+    board = board_from("  X      ")
+    canonical = symmetry.canonicalize(board)
+
+    corner = symmetry.to_canonical_move(2, canonical.transform)
+
+    assert canonical.x_bits == 1 << corner
+    for move in range(9):
+        there = symmetry.to_canonical_move(move, canonical.transform)
+        assert symmetry.from_canonical_move(there, canonical.transform) == move
+
+
+def test_table_has_burnside_count_of_classes() -> None:
+    table = symmetry.canonical_table()
+
+    assert len(table) == POSITION_COUNT
+    assert len({index for index, _ in table}) == 2862
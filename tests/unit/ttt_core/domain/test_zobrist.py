@@ -0,0 +1,65 @@
+from ttt_core.domain.board import Board
+from ttt_core.domain.types import Mark
+from ttt_core.domain.zobrist import ZOBRIST_SEED, state_key, zobrist_table
+
+
+def test_table_is_seeded_and_prefix_stable() -> None:
+    small = zobrist_table(9)
+    large = zobrist_table(225)
+
+    assert ZOBRIST_SEED == 0x7A0B15
+    assert large[:9] == small
+    assert len({value for pair in large for value in pair}) == 450
+
+
+def test_state_key_treats_space_and_empty_string_alike() -> None:
+    assert state_key("X   O    ") == state_key(["X", "", "", "", "O", "", "", "", ""])
+    assert state_key(" " * 9) == 0
+
+
+def test_board_key_updates_incrementally() -> None:
+    board = Board()
+
+    board.place_mark(0, Mark.X_MARK)
+    board.place_mark(4, Mark.O_MARK)
+
+    assert board.zobrist_key == state_key("X   O    ")
+
+
+def test_remove_mark_restores_previous_key() -> None:
+    board = Board()
+    board.place_mark(0, Mark.X_MARK)
+    before = board.zobrist_key
+
+    board.place_mark(4, Mark.O_MARK)
+    board.remove_mark(4)
+
+    assert board.zobrist_key == before
+    assert board.cells[4] == ""
+
+
+def test_overwrite_and_assignment_keep_key_consistent() -> None:
+    board = Board()
+    board.place_mark(3, Mark.X_MARK)
+    board.place_mark(3, Mark.O_MARK)
+
+    assert board.zobrist_key == state_key("   O     ")
+
+    board.cells = ["O", "X", "", "", "", "", "", "", ""]
+
+    assert board.zobrist_key == state_key("OX       ")
+
+    board.clear()
+
+    assert board.zobrist_key == 0
+
+
+def test_assigning_bitboards_rebuilds_key() -> None:
+    board = Board()
+    board.place_mark(0, Mark.X_MARK)
+
+    board.x_bits |= 1 << 8
+    board.o_bits = 1 << 4
+
+    assert board.zobrist_key == state_key("X   O   X")
+    assert board == Board(x_bits=0b100000001, o_bits=1 << 4)
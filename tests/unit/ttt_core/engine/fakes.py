@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 from ttt_core.domain.board import Board
 from ttt_core.domain.types import Mark
@@ -15,23 +15,22 @@ class FakeMark:
 class FakeStatus:
     is_over: bool
     winner: Optional[FakeMark]
+    win_line: Optional[tuple[int, int, int]] = None
 
 
 @dataclass
 class FakeBoard:
-    winner: Optional[Mark] = None
-    draw: bool = False
+    cells: List[str] = field(default_factory=lambda: [""] * 9)
+    size: int = 3
+    win_length: int = 3
+
+    def clear(self) -> None:
+        self.cells = [""] * 9
 
     def place_mark(self, index: int, mark: Mark) -> None:
         self.last_index = index
         self.last_mark = mark
 
-    def winner_mark(self) -> Optional[Mark]:
-        return self.winner
-
-    def is_draw(self) -> bool:
-        return self.draw
-
 
 class FakeGame:
     def __init__(self, board: Board, stats: Stats) -> None:
@@ -1,6 +1,6 @@
 import pytest
 
-import ttt_core.engine.engine as engine_module
+from tests.unit.ttt_core.engine.fakes import FakeMark, FakeStatus
 
 
 def test_engine_initial_state(engine):
@@ -18,34 +18,44 @@ def test_current_mark_returns_game_mark(engine):
     assert engine.current_mark() == "X"
 
 
-def test_lock_selection_after_first_attempt(engine, monkeypatch):
-    monkeypatch.setattr(
-        engine_module,
-        "has_winner",
-        lambda cells: (False, None, None),
-    )
-
+def test_lock_selection_after_first_attempt(engine):
     engine.index_move_and_update_status(0)
 
     assert engine.lock_selection() is True
 
 
 @pytest.mark.parametrize("move_index", [0, 4, 8])
-def test_index_move_and_update_status_structure(engine, monkeypatch, move_index):
-    monkeypatch.setattr(
-        engine_module,
-        "has_winner",
-        lambda cells: (False, None, None),
-    )
-
+def test_index_move_and_update_status_structure(engine, move_index):
     result = engine.index_move_and_update_status(move_index)
 
-    assert result["placed_index"] == move_index
-    assert result["attempts"] == 1
-    assert result["game_over"] is False
-    assert result["winner"] == ""
-    assert result["win_line"] is None
+    assert result.placed_index == move_index
+    assert result.attempts == 1
+    assert result.game_over is False
+    assert result.winner == ""
+    assert result.win_line is None
 
 
 def test_load_stats_returns_injected_stats(engine, stats):
     assert engine.load_stats() is stats
+
+
+def test_win_line_comes_from_game_status(engine, monkeypatch):
+    monkeypatch.setattr(
+        engine._game,
+        "apply_move",
+        lambda index: FakeStatus(is_over=True, winner=FakeMark("O"), win_line=(2, 4, 6)),
+    )
+
+    result = engine.index_move_and_update_status(6)
+
+    assert result.winner == "O"
+    assert result.win_line == (2, 4, 6)
+
+
+def test_in_progress_results_are_shared(engine):
+    first = engine.index_move_and_update_status(3)
+    engine.reset_game()
+    again = engine.index_move_and_update_status(3)
+
+    assert first is again
+    assert not hasattr(first, "__dict__")
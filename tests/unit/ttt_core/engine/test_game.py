@@ -1,5 +1,7 @@
 import pytest
 
+from ttt_core.domain.board import Board
+from ttt_core.domain.rules import WIN_LINES
 from ttt_core.domain.types import Mark
 from ttt_core.engine.game import Game
 
@@ -24,47 +26,63 @@ def test_apply_move_toggles_mark_when_no_win_or_draw(game):
 
 
 @pytest.mark.parametrize(
-    "winner,expected_player_wins",
+    "moves,winner,win_line,expected_player_wins",
     [
-        (Mark.X_MARK, 1),
-        (Mark.O_MARK, 0),
+        ([0, 3, 1, 4, 2], Mark.X_MARK, (0, 1, 2), 1),
+        ([0, 3, 1, 4, 8, 5], Mark.O_MARK, (3, 4, 5), 0),
     ],
 )
 def test_apply_move_when_winner_ends_game_and_records_stats(
-    fake_board,
+    game,
     stats,
+    moves,
     winner,
+    win_line,
     expected_player_wins,
 ):
-    fake_board.winner = winner
-    game = Game(board=fake_board, stats=stats)
-
-    status = game.apply_move(1)
+    for move in moves:
+        status = game.apply_move(move)
 
     assert status.is_over is True
     assert status.winner == winner
+    assert status.win_line == win_line
+    assert status.is_draw is False
     assert stats.total_games == 1
     assert stats.player_wins == expected_player_wins
     assert game.game_over is True
 
 
-def test_apply_move_when_draw_ends_game_and_records_stats(
-    fake_board,
-    stats,
-):
-    fake_board.draw = True
-    game = Game(board=fake_board, stats=stats)
-
-    status = game.apply_move(5)
+def test_apply_move_when_draw_ends_game_and_records_stats(game, stats):
+    for move in [0, 1, 2, 4, 3, 5, 7, 6, 8]:
+        status = game.apply_move(move)
 
     assert status.is_over is True
     assert status.is_draw is True
     assert status.winner is None
+    assert status.win_line is None
     assert stats.total_games == 1
     assert stats.player_wins == 0
     assert game.game_over is True
 
 
+def test_move_count_tracks_applied_moves(game):
+    game.apply_move(0)
+    game.apply_move(4)
+
+    assert game.move_count == 2
+
+
+def test_counters_seeded_from_existing_board(fake_board, stats):
+    fake_board.cells = ["X", "X", "", "O", "O", "", "", "", ""]
+    game = Game(board=fake_board, stats=stats)
+
+    status = game.apply_move(2)
+
+    assert game.move_count == 5
+    assert status.winner == Mark.X_MARK
+    assert status.win_line == (0, 1, 2)
+
+
 def test_reset_game_resets_state(game, fake_board):
     game.apply_move(0)
 
@@ -72,3 +90,99 @@ def test_reset_game_resets_state(game, fake_board):
 
     assert game.current_move_mark == Mark.X_MARK
     assert game.game_over is False
+    assert game.move_count == 0
+
+
+def test_overwriting_a_cell_moves_its_line_counts(game):
+    game.apply_move(4)
+    status = game.apply_move(4)
+
+    assert game.move_count == 1
+    assert status.is_over is False
+    middle_column = WIN_LINES.index((1, 4, 7))
+    assert game._line_counts[Mark.X_MARK][middle_column] == 0
+    assert game._line_counts[Mark.O_MARK][middle_column] == 1
+
+
+def test_generalized_board_needs_k_in_a_row(stats):
+    game = Game(board=Board(size=4, win_length=4), stats=stats)
+
+    for move in [0, 4, 1, 5, 2, 6]:
+        assert game.apply_move(move).is_over is False
+
+    status = game.apply_move(3)
+
+    assert status.winner == Mark.X_MARK
+    assert status.win_line == (0, 1, 2, 3)
+
+
+def test_generalized_board_draws_when_full(stats):
+    board = Board(size=4, win_length=4)
+    board.cells = list("XXOOOOXXXXOOOOX") + [""]
+    game = Game(board=board, stats=stats)
+
+    status = game.apply_move(15)
+
+    assert game.move_count == 16
+    assert status.is_draw is True
+    assert status.winner is None
+
+
+@pytest.fixture
+def real_game(stats):
+    return Game(board=Board(), stats=stats)
+
+
+def test_unmake_move_restores_board_mark_and_key(real_game):
+    real_game.make_move(4)
+    key = real_game.board.zobrist_key
+
+    real_game.make_move(0)
+    real_game.unmake_move()
+
+    assert real_game.board.zobrist_key == key
+    assert real_game.board.cells[0] == ""
+    assert real_game.current_move_mark == Mark.O_MARK
+    assert real_game.move_count == 1
+
+
+def test_make_move_to_game_end_records_no_stats(real_game, stats):
+    for move in [0, 3, 1, 4]:
+        real_game.make_move(move)
+
+    status = real_game.make_move(2)
+
+    assert status.winner == Mark.X_MARK
+    assert real_game.game_over is True
+    assert stats.total_games == 0
+
+    real_game.unmake_move()
+
+    assert real_game.game_over is False
+    assert real_game.current_move_mark == Mark.X_MARK
+    assert real_game.make_move(8).is_over is False
+
+
+def test_unmake_overwrite_restores_previous_occupant(real_game):
+    real_game.make_move(4)
+    real_game.make_move(4)
+
+    real_game.unmake_move()
+
+    assert real_game.board.cells[4] == "X"
+    assert real_game.current_move_mark == Mark.O_MARK
+    middle_column = WIN_LINES.index((1, 4, 7))
+    assert real_game._line_counts[Mark.X_MARK][middle_column] == 1
+    assert real_game._line_counts[Mark.O_MARK][middle_column] == 0
+
+
+def test_unmake_all_moves_returns_to_empty_board(real_game):
+    for move in [0, 1, 2, 4, 3, 5, 7, 6, 8]:
+        real_game.make_move(move)
+    for _ in range(9):
+        real_game.unmake_move()
+
+    assert real_game.board.zobrist_key == 0
+    assert real_game.board.legal_moves() == list(range(9))
+    assert real_game.move_count == 0
+    assert all(count == 0 for counts in real_game._line_counts.values() for count in counts)
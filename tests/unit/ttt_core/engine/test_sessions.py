@@ -0,0 +1,105 @@
+import pytest
+
+from ttt_core.engine.sessions import EngineManager
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(clock: FakeClock) -> EngineManager:
+    return EngineManager(idle_timeout=60.0, clock=clock)
+
+
+def play_x_win(manager: EngineManager, session_id: str) -> None:
+    engine = manager.get(session_id)
+    for move in [0, 3, 1, 4, 2]:
+        engine.index_move_and_update_status(move)
+
+
+def test_create_and_get_sessions_by_id(manager: EngineManager) -> None:
+    first = manager.create_session()
+    second = manager.create_session("custom")
+
+    assert second == "custom"
+    assert len(manager) == 2
+    assert manager.get(first) is not manager.get(second)
+
+
+def test_duplicate_and_unknown_ids_raise(manager: EngineManager) -> None:
+    manager.create_session("dup")
+
+    with pytest.raises(ValueError):
+        manager.create_session("dup")
+    with pytest.raises(KeyError):
+        manager.get("missing")
+
+
+def test_closed_session_game_is_reused(manager: EngineManager) -> None:
+    first = manager.create_session()
+    manager.get(first).index_move_and_update_status(4)
+    board = manager.get(first).expose_board
+
+    manager.close_session(first)
+    second = manager.create_session()
+
+    assert manager.pooled == 0
+    assert manager.get(second).expose_board is board
+    assert board.legal_moves() == list(range(9))
+
+
+def test_session_stats_are_separate_from_aggregate(manager: EngineManager) -> None:
+    first = manager.create_session()
+    second = manager.create_session()
+
+    play_x_win(manager, first)
+    manager.reset_session(first)
+    play_x_win(manager, first)
+    play_x_win(manager, second)
+
+    assert manager.session_stats(first).total_games == 2
+    assert manager.session_stats(second).player_wins == 1
+    assert manager.aggregate_stats.total_games == 3
+
+
+def test_recycled_game_records_into_new_session_only(manager: EngineManager) -> None:
+    first = manager.create_session()
+    old_stats = manager.session_stats(first)
+    manager.close_session(first)
+
+    second = manager.create_session()
+    play_x_win(manager, second)
+
+    assert old_stats.total_games == 0
+    assert manager.session_stats(second).total_games == 1
+
+
+def test_expire_idle_closes_only_stale_sessions(manager: EngineManager, clock: FakeClock) -> None:
+    stale = manager.create_session()
+    clock.now = 50.0
+    fresh = manager.create_session()
+    clock.now = 100.0
+
+    assert manager.expire_idle() == 1
+    assert stale not in manager
+    assert fresh in manager
+    assert manager.pooled == 1
+
+
+def test_access_refreshes_idle_timer(manager: EngineManager, clock: FakeClock) -> None:
+    session = manager.create_session()
+    clock.now = 50.0
+    manager.get(session)
+    clock.now = 100.0
+
+    assert manager.expire_idle() == 0
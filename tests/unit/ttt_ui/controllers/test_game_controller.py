@@ -1,6 +1,10 @@
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
 import ttt_ui.controllers.game_controller as controller
+from ttt_core.engine.engine import MoveResult
 
 
 class FakeStats:
@@ -28,14 +32,14 @@ class FakeEngine:
     def lock_selection(self) -> bool:
         return self._lock
 
-    def index_move_and_update_status(self, index: int) -> dict:
-        return {
-            "placed_index": index,
-            "attempts": 1,
-            "game_over": False,
-            "winner": None,
-            "win_line": None,
-        }
+    def index_move_and_update_status(self, index: int) -> MoveResult:
+        return MoveResult(
+            placed_index=index,
+            attempts=1,
+            game_over=False,
+            winner="",
+            win_line=None,
+        )
 
 
 class FakeAgent:
@@ -43,6 +47,21 @@ class FakeAgent:
         return 4
 
 
+class FakeAgentCache:
+    def __init__(self) -> None:
+        self.agents: dict = {}
+        self.preloaded: list = []
+        self.hits = 3
+        self.misses = 1
+
+    def get(self, path: str) -> FakeAgent:
+        return self.agents.setdefault(path, FakeAgent())
+
+    def preload(self, paths: list) -> str:
+        self.preloaded.extend(paths)
+        return "thread"
+
+
 @pytest.fixture
 def mock_cells(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
@@ -67,9 +86,8 @@ def game_controller(monkeypatch: pytest.MonkeyPatch) -> controller.GameControlle
     monkeypatch.setattr(controller, "Stats", FakeStats)
     monkeypatch.setattr(controller, "Engine", FakeEngine)
     monkeypatch.setattr(controller, "RandomAgent", FakeAgent)
-    monkeypatch.setattr(controller, "QAgent", lambda path: FakeAgent())
 
-    return controller.GameController()
+    return controller.GameController(agent_cache=FakeAgentCache())
 
 
 def test_coord_to_index_finds_nearest_cell(mock_cells: None) -> None:
@@ -83,6 +101,8 @@ def test_coord_to_index_finds_nearest_cell(mock_cells: None) -> None:
         ("set_mode_multi", None),
         ("set_mode_easy", "agent"),
         ("set_challenge_mode", "agent"),
+        ("set_mode_impossible", "agent"),
+        ("set_search_mode", "agent"),
     ],
 )
 def test_mode_selection_assigns_agent_correctly(
@@ -101,6 +121,116 @@ def test_mode_selection_assigns_agent_correctly(
         assert game_controller._agent is not None
 
 
+def test_impossible_mode_reuses_one_perfect_play_agent(
+    game_controller: controller.GameController,
+) -> None:
+    game_controller.set_mode_impossible()
+    first = game_controller._agent
+    game_controller.set_mode_easy()
+    game_controller.set_mode_impossible()
+
+    assert game_controller._agent is first
+
+
+def test_challenge_mode_switching_reuses_cached_agents(
+    game_controller: controller.GameController,
+) -> None:
+    game_controller.set_challenge_mode("hard.qtab")
+    hard = game_controller._agent
+    game_controller.set_mode_impossible()
+    game_controller.set_challenge_mode("hard.qtab")
+
+    assert game_controller._agent is hard
+
+
+def test_preload_models_includes_solved_table(
+    game_controller: controller.GameController,
+) -> None:
+    assert game_controller.preload_models(["hard.qtab"]) == "thread"
+    assert game_controller._agent_cache.preloaded == [
+        "hard.qtab",
+        str(controller.perfect_play.DEFAULT_TABLE_PATH),
+    ]
+
+
+def test_hot_reload_mode_shares_one_watcher_per_model(
+    game_controller: controller.GameController,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    model = tmp_path / "hard.qtab"
+    model.write_bytes(b"model")
+    monkeypatch.setattr(
+        controller,
+        "ReloadingAgent",
+        lambda path, loader: SimpleNamespace(path=path, agent=loader(path), metrics=lambda: "m"),
+    )
+
+    game_controller.set_challenge_mode(str(model), hot_reload=True)
+    first = game_controller._agent
+    game_controller.set_mode_easy()
+    game_controller.set_challenge_mode(str(model), hot_reload=True)
+
+    assert game_controller._agent is first
+    assert first.agent is game_controller._agent_cache.get(str(model))
+    assert game_controller.hot_reload_metrics() == {str(model): "m"}
+
+
+def test_close_stops_every_hot_reload_watcher(
+    game_controller: controller.GameController,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closed = []
+    monkeypatch.setattr(
+        controller,
+        "ReloadingAgent",
+        lambda path, loader: SimpleNamespace(close=lambda: closed.append(path)),
+    )
+    game_controller.set_challenge_mode(str(tmp_path / "hard.qtab"), hot_reload=True)
+    game_controller.set_challenge_mode(str(tmp_path / "other.qtab"), hot_reload=True)
+
+    game_controller.close()
+    game_controller.close()
+
+    assert closed == [str(tmp_path / "hard.qtab"), str(tmp_path / "other.qtab")]
+    assert game_controller.hot_reload_metrics() == {}
+
+
+def test_close_joins_real_watcher_threads(
+    game_controller: controller.GameController, tmp_path: Path
+) -> None:
+    model = tmp_path / "hard.qtab"
+    model.write_bytes(b"model")
+    game_controller.set_challenge_mode(str(model), hot_reload=True)
+    watcher = game_controller._agent._watcher
+
+    game_controller.close()
+
+    assert not watcher.is_alive()
+
+
+def test_agent_cache_counters_come_from_cache(
+    game_controller: controller.GameController,
+) -> None:
+    assert game_controller.agent_cache_counters() == (3, 1)
+
+
+def test_controllers_share_the_process_wide_cache() -> None:
+    assert controller.GameController()._agent_cache is controller.GameController()._agent_cache
+
+
+def test_search_mode_passes_budget_to_mcts(
+    game_controller: controller.GameController,
+) -> None:
+    game_controller.set_search_mode(time_limit_ms=10, workers=4)
+
+    assert isinstance(game_controller._agent, controller.MCTSAgent)
+    assert game_controller._agent.playouts is None
+    assert game_controller._agent.time_limit_ms == 10
+    assert game_controller._agent.workers == 4
+
+
 def test_current_shape_returns_engine_mark(game_controller: controller.GameController) -> None:
     assert game_controller.current_shape() == "X"
 
@@ -148,3 +278,12 @@ def test_hold_stats_returns_expected_tuple(
     assert wins == 2
     assert games == 4
     assert percent == 50.0
+
+
+def test_move_result_is_passed_through_unchanged(
+    game_controller: controller.GameController,
+) -> None:
+    sentinel = MoveResult(placed_index=2, attempts=5, game_over=True, winner="O", win_line=None)
+    game_controller._engine.index_move_and_update_status = lambda index: sentinel
+
+    assert game_controller.register_click_and_move(0.0, 0.0) is sentinel
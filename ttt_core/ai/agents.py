@@ -1,42 +1,87 @@
 import pickle
 import random
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import DefaultDict, Tuple
+from dataclasses import dataclass, field
+from typing import DefaultDict, Dict, Hashable, Optional, Tuple
 
+import numpy as np
+
+from ttt_core.ai import batch, qtable
+from ttt_core.domain import rules, zobrist
 from ttt_core.domain.board import Board
 
 
 @dataclass
 class QAgent:
     q_path: str
-    q_values_load: DefaultDict[Tuple[str, int], float] = None
+    q_values_load: DefaultDict[Tuple[int, int], float] = None
+    q_rows: Optional[np.ndarray] = None
+    _dict_rows: Optional[np.ndarray] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Load Q-table into defaultdict."""
+        """Map a dense Q-table file, or load a pickled one into a defaultdict keyed by
+        (Zobrist key, action)."""
+
+        if qtable.is_qtable(self.q_path):
+            self.q_rows = qtable.load_qtable(self.q_path)
+            return
 
         with open(self.q_path, "rb") as handle:
             loaded = pickle.load(handle)
 
-        self.q_values_load = defaultdict(float, loaded)
+        self.q_values_load = defaultdict(float, rekey_q_table(loaded))
 
     def choose_best_move(self, board: Board) -> int:
         """Return best legal move using greedy Q-values."""
 
-        state = self._board_state(board)
         legal_moves = board.legal_moves()
 
-        q_values = [(idx, self.q_values_load[(state, idx)]) for idx in legal_moves]
+        if self.q_rows is not None:
+            row = self.q_rows[board.position_index()].tolist()
+            q_values = [(idx, row[idx]) for idx in legal_moves]
+        else:
+            state = self._board_state(board)
+            q_values = [(idx, self.q_values_load[(state, idx)]) for idx in legal_moves]
 
         max_value = max(q_val for _, q_val in q_values)
         best_move = [idx for idx, q_val in q_values if q_val == max_value]
 
         return random.choice(best_move)
 
-    def _board_state(self, board: Board) -> str:
-        state_cells = board.cells
-
-        return "".join(cell if cell else " " for cell in state_cells)
+    def choose_move(self, board: Board) -> int:
+        return self.choose_best_move(board)
+
+    def choose_moves(
+        self, boards: batch.Positions, rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Greedy moves for a batch: masked argmax over Q rows, ties broken uniformly."""
+        indices, legal = batch.position_arrays(boards)
+        return batch.masked_argmax(self._rows()[indices], legal, rng)
+
+    def _rows(self) -> np.ndarray:
+        if self.q_rows is not None:
+            return self.q_rows
+        if self._dict_rows is None:
+            # Pickled models become a dense float64 copy once, on the first batch.
+            index_by_state = zobrist.key_indices()
+            rows = np.zeros((rules.POSITION_COUNT, 9))
+            for (state, action), value in self.q_values_load.items():
+                index = index_by_state.get(state)
+                if index is not None:
+                    rows[index, action] = value
+            self._dict_rows = rows
+        return self._dict_rows
+
+    def _board_state(self, board: Board) -> int:
+        return board.zobrist_key
+
+
+def rekey_q_table(q_table: Dict[Tuple[Hashable, int], float]) -> Dict[Tuple[int, int], float]:
+    """Map legacy (state string, action) keys onto (Zobrist key, action)."""
+    return {
+        (zobrist.state_key(state) if isinstance(state, str) else state, action): value
+        for (state, action), value in q_table.items()
+    }
 
 
 @dataclass(frozen=True)
@@ -46,3 +91,12 @@ class RandomAgent:
         legal = board.legal_moves()
 
         return random.choice(legal)
+
+    def choose_move(self, board: Board) -> int:
+        return self.choose_random_move(board)
+
+    def choose_moves(
+        self, boards: batch.Positions, rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Uniformly random legal moves for a batch."""
+        return batch.choose_among(batch.position_arrays(boards)[1], rng)
@@ -0,0 +1,58 @@
+"""Helpers for agents that pick moves for a whole batch of 3 x 3 positions at once.
+
+A batch is either a sequence of Boards or an (N, 9) array of cell codes (0 empty,
+1 X, 2 O), the same layout rules.evaluate_batch takes.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ttt_core.domain.board import Board
+
+Positions = Union[Sequence[Board], np.ndarray]
+
+_POWERS = 3 ** np.arange(9, dtype=np.int64)
+_SHIFTS = np.arange(9, dtype=np.int64)
+
+_default_rng: Optional[np.random.Generator] = None
+
+
+def default_rng() -> np.random.Generator:
+    global _default_rng
+    if _default_rng is None:
+        _default_rng = np.random.default_rng()
+    return _default_rng
+
+
+def position_arrays(boards: Positions) -> Tuple[np.ndarray, np.ndarray]:
+    """(position indices of shape (N,), legal-move mask of shape (N, 9)) for a batch."""
+    if isinstance(boards, np.ndarray):
+        if boards.ndim != 2 or boards.shape[1] != 9:
+            raise ValueError(f"Expected an (N, 9) board array, got shape {boards.shape}")
+        return boards.astype(np.int64) @ _POWERS, boards == 0
+
+    count = len(boards)
+    indices = np.fromiter((board.position_index() for board in boards), np.int64, count)
+    occupied = np.fromiter((board.x_bits | board.o_bits for board in boards), np.int64, count)
+    return indices, (occupied[:, None] >> _SHIFTS & 1) == 0
+
+
+def choose_among(candidates: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Pick one True column per row, uniformly at random; raises ValueError on an empty row.
+
+    Argmax over independent uniform keys is uniform over the candidates, which is the
+    distribution random.choice gives on the scalar path.
+    """
+    if not candidates.any(axis=1).all():
+        raise ValueError("No legal moves left on a board in the batch")
+    keys = (rng or default_rng()).random(candidates.shape)
+    return np.where(candidates, keys, -1.0).argmax(axis=1)
+
+
+def masked_argmax(
+    values: np.ndarray, legal: np.ndarray, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Best legal column per row, breaking ties uniformly at random."""
+    masked = np.where(legal, values, -np.inf)
+    return choose_among(legal & (masked == masked.max(axis=1, keepdims=True)), rng)
@@ -0,0 +1,182 @@
+"""Micro-batching front end for agents that implement choose_moves.
+
+Callers from many sessions submit positions; one worker thread gathers them for up to
+max_wait_ms (or until max_batch_size are queued), evaluates the lot with a single
+choose_moves call and resolves each caller's future. Positions are copied at submit
+time, so a board may change once its request is queued.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ttt_core.domain.board import Board
+
+_STOP = object()
+_SHIFTS = np.arange(9, dtype=np.int64)
+
+# A request resolves either a concurrent Future or an asyncio future on its own loop.
+_Target = Union[Future, Tuple[asyncio.AbstractEventLoop, "asyncio.Future[int]"]]
+_Request = Tuple[int, int, _Target]
+
+
+@dataclass
+class BrokerMetrics:
+    requests: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class InferenceBroker:
+    """Batches choose_move requests for agent; usable wherever an agent is expected."""
+
+    def __init__(self, agent: object, max_batch_size: int = 256, max_wait_ms: float = 1.0) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._agent = agent
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._metrics = BrokerMetrics()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="inference-broker", daemon=True)
+        self._worker.start()
+
+    def submit(self, board: Board) -> Future:
+        """Queue board and return a future resolving to the chosen move."""
+        future: Future = Future()
+        self._put(board, future)
+        return future
+
+    def choose_move(self, board: Board, timeout: Optional[float] = None) -> int:
+        return self.submit(board).result(timeout)
+
+    async def choose_move_async(self, board: Board) -> int:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._put(board, (loop, future))
+        return await future
+
+    def metrics(self) -> BrokerMetrics:
+        """Snapshot of the counters with the current queue depth."""
+        with self._lock:
+            return replace(self._metrics, queue_depth=self._queue.qsize())
+
+    def close(self) -> None:
+        """Finish every queued request, then stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join()
+
+    def __enter__(self) -> "InferenceBroker":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _put(self, board: Board, target: _Target) -> None:
+        if (board.size, board.win_length) != (3, 3):
+            raise ValueError(
+                f"InferenceBroker serves 3 x 3 boards only, got {board.size} x {board.size} "
+                f"with {board.win_length} in a row"
+            )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Broker is closed")
+            self._queue.put((board.x_bits, board.o_bits, target))
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch: List[_Request] = [first]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    running = False
+                    break
+                batch.append(item)
+            self._record(len(batch))
+            self._evaluate(batch)
+
+    def _record(self, size: int) -> None:
+        with self._lock:
+            metrics = self._metrics
+            metrics.requests += size
+            metrics.batches += 1
+            metrics.largest_batch = max(metrics.largest_batch, size)
+            metrics.max_queue_depth = max(metrics.max_queue_depth, size + self._queue.qsize())
+
+    def _evaluate(self, batch: List[_Request]) -> None:
+        x_bits = np.fromiter((x for x, _, _ in batch), np.int64, len(batch))
+        o_bits = np.fromiter((o for _, o, _ in batch), np.int64, len(batch))
+        codes = (x_bits[:, None] >> _SHIFTS & 1) + 2 * (o_bits[:, None] >> _SHIFTS & 1)
+        try:
+            outcomes = self._agent.choose_moves(codes).tolist()
+        except Exception:
+            # One bad position must not fail its neighbours: retry each on its own.
+            outcomes = []
+            for row in codes:
+                try:
+                    outcomes.append(int(self._agent.choose_moves(row[None, :])[0]))
+                except Exception as error:
+                    outcomes.append(error)
+
+        by_loop: Dict[asyncio.AbstractEventLoop, list] = {}
+        for outcome, (_, _, target) in zip(outcomes, batch):
+            if isinstance(target, Future):
+                _settle(target, outcome)
+            else:
+                by_loop.setdefault(target[0], []).append((target[1], outcome))
+        # One wake-up per event loop per batch rather than one per request.
+        for loop, pending in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_settle_all, pending)
+            except RuntimeError:
+                # The caller's loop closed while it waited; nobody is left to answer.
+                pass
+
+
+def _settle(future: Union[Future, "asyncio.Future[int]"], outcome: Union[int, Exception]) -> None:
+    if future.done():
+        return
+    try:
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+    except InvalidStateError:
+        # Cancelled between the check and the set.
+        pass
+
+
+def _settle_all(pending: list) -> None:
+    for future, outcome in pending:
+        _settle(future, outcome)
@@ -0,0 +1,132 @@
+"""Process-wide cache of loaded model agents.
+
+Entries are keyed by (path, mtime, size), so a model rewritten on disk is loaded
+afresh while unchanged ones are shared. Loads run outside the lock; concurrent
+requests for a model that is already loading wait for that load instead of
+repeating it.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from ttt_core.ai import perfect_play
+from ttt_core.ai.agents import QAgent
+from ttt_core.ai.perfect_play import PerfectPlayAgent
+
+ModelKey = Tuple[str, int, int]
+
+
+def model_key(path: str) -> ModelKey:
+    """(absolute path, mtime in ns, size) of a model file; raises OSError if it is missing."""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def load_agent(path: str) -> object:
+    """Build the agent for a model file: a solved perfect-play table or a Q-table."""
+    with open(path, "rb") as handle:
+        magic = handle.read(len(perfect_play.MAGIC))
+    if magic == perfect_play.MAGIC:
+        return PerfectPlayAgent(perfect_play.load_table(path))
+    return QAgent(path)
+
+
+@dataclass
+class AgentCache:
+    """LRU cache of agents built by loader(path), with hit/miss counters.
+
+    Preloads do not count towards hits or misses; they only warm the cache.
+    """
+
+    max_entries: int = 8
+    loader: Callable[[str], object] = load_agent
+    hits: int = 0
+    misses: int = 0
+    _entries: "OrderedDict[ModelKey, object]" = field(default_factory=OrderedDict, repr=False)
+    _loading: Dict[ModelKey, Future] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def get(self, path: str) -> object:
+        """Return the agent for path, loading it on a miss."""
+        return self._fetch(path, count=True)
+
+    def preload(self, paths: Iterable[str]) -> threading.Thread:
+        """Load paths on a daemon thread; missing or unreadable files are skipped."""
+        paths = list(paths)
+
+        def warm() -> None:
+            for path in paths:
+                try:
+                    self._fetch(path, count=False)
+                except Exception:
+                    continue
+
+        thread = threading.Thread(target=warm, name="agent-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        try:
+            return model_key(path) in self._entries
+        except OSError:
+            return False
+
+    def _fetch(self, path: str, count: bool) -> object:
+        key = model_key(path)
+        with self._lock:
+            agent = self._entries.get(key)
+            if agent is not None:
+                self._entries.move_to_end(key)
+                self.hits += count
+                return agent
+            self.misses += count
+            pending = self._loading.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._loading[key] = Future()
+
+        if not owner:
+            return pending.result()
+
+        try:
+            agent = self.loader(path)
+        except BaseException as error:
+            with self._lock:
+                del self._loading[key]
+            pending.set_exception(error)
+            raise
+
+        with self._lock:
+            del self._loading[key]
+            for stale in [other for other in self._entries if other[0] == key[0]]:
+                del self._entries[stale]
+            self._entries[key] = agent
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        pending.set_result(agent)
+        return agent
+
+
+_SHARED: Optional[AgentCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_agent_cache() -> AgentCache:
+    """The process-wide cache, created on first use."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = AgentCache()
+        return _SHARED
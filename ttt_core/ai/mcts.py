@@ -0,0 +1,276 @@
+"""Anytime Monte Carlo Tree Search (UCT with uniformly random playouts).
+
+With workers > 1 the search is root-parallel: each worker process grows its own tree
+from the same position with its own seed, and the root visit counts are summed before
+the move is picked. Worker pools are shared per size and stay up between moves and
+games, so only the first parallel search pays for starting processes.
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from ttt_core.domain.board import Board
+from ttt_core.domain.rules import Geometry
+
+DEFAULT_PLAYOUTS = 1_000
+
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class _Node:
+    """A position in the tree, stored from the side to move's point of view.
+
+    me holds the marks of the side to move and opp those of the side that just moved.
+    reward accumulates results for opp (1 win, 0.5 draw, 0 loss), which is what the
+    parent's UCT selection maximises. terminal is opp's result once the game is over.
+    """
+
+    __slots__ = (
+        "me",
+        "opp",
+        "move",
+        "parent",
+        "children",
+        "untried",
+        "visits",
+        "reward",
+        "terminal",
+    )
+
+    def __init__(
+        self,
+        me: int,
+        opp: int,
+        move: int,
+        parent: Optional["_Node"],
+        untried: List[int],
+        terminal: Optional[float],
+    ) -> None:
+        self.me = me
+        self.opp = opp
+        self.move = move
+        self.parent = parent
+        self.children: List[_Node] = []
+        self.untried = untried
+        self.visits = 0
+        self.reward = 0.0
+        self.terminal = terminal
+
+
+@dataclass
+class MCTSAgent:
+    """UCT search bounded by a playout count, a wall-clock limit, or both.
+
+    Whichever budget runs out first stops the search and the most-visited move so far
+    is played, so strength is tuned through the budget. The tree is kept between calls
+    and the subtree for the position actually reached is reused on the next move.
+
+    workers > 1 splits the playout budget across that many process-pool trees (each
+    gets the full time limit); those trees are rebuilt on every move.
+    """
+
+    playouts: Optional[int] = None
+    time_limit_ms: Optional[float] = None
+    exploration: float = math.sqrt(2)
+    seed: Optional[int] = None
+    workers: int = 1
+    last_playouts: int = field(default=0, init=False)
+    _rng: random.Random = field(init=False, repr=False)
+    _root: Optional[_Node] = field(default=None, init=False, repr=False)
+    _geometry: Optional[Geometry] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.playouts is None and self.time_limit_ms is None:
+            self.playouts = DEFAULT_PLAYOUTS
+        self._rng = random.Random(self.seed)
+
+    def choose_move(self, board: Board) -> int:
+        if self.workers > 1:
+            return self._choose_parallel(board)
+
+        root = self.search(board)
+        if not root.children:
+            return self._rng.choice(board.legal_moves())
+        return max(root.children, key=lambda child: child.visits).move
+
+    def search(self, board: Board) -> _Node:
+        """Run playouts from board until the budget is spent; returns the root node."""
+        if board.geometry is not self._geometry:
+            self._bind(board.geometry)
+
+        root = self._reuse(board)
+        if root.terminal is not None or not (root.untried or root.children):
+            raise ValueError("No legal moves left on the board")
+
+        limit = self.playouts
+        deadline = None
+        if self.time_limit_ms is not None:
+            deadline = time.perf_counter() + self.time_limit_ms / 1000
+        done = 0
+        while (limit is None or done < limit) and (
+            deadline is None or time.perf_counter() < deadline
+        ):
+            self._playout(root)
+            done += 1
+
+        self.last_playouts = done
+        self._root = root
+        return root
+
+    def _choose_parallel(self, board: Board) -> int:
+        pool = shared_pool(self.workers)
+        futures = []
+        for worker in range(self.workers):
+            share = None
+            if self.playouts is not None:
+                share = self.playouts // self.workers + (worker < self.playouts % self.workers)
+            futures.append(
+                pool.submit(
+                    _root_visits,
+                    board.x_bits,
+                    board.o_bits,
+                    board.size,
+                    board.win_length,
+                    share,
+                    self.time_limit_ms,
+                    self.exploration,
+                    self._rng.getrandbits(32),
+                )
+            )
+
+        totals: Dict[int, int] = {}
+        for future in futures:
+            for move, visits in future.result().items():
+                totals[move] = totals.get(move, 0) + visits
+
+        self.last_playouts = sum(totals.values())
+        if not totals:
+            return self._rng.choice(board.legal_moves())
+        return max(totals, key=totals.get)
+
+    def _bind(self, shape: Geometry) -> None:
+        self._geometry = shape
+        self._root = None
+        self._full_mask = shape.full_mask
+        self._masks_through = [
+            tuple(shape.line_masks[line_id] for line_id in line_ids)
+            for line_ids in shape.lines_through
+        ]
+
+    def _reuse(self, board: Board) -> _Node:
+        x_bits, o_bits = board.x_bits, board.o_bits
+        me, opp = (x_bits, o_bits) if x_bits.bit_count() == o_bits.bit_count() else (o_bits, x_bits)
+
+        old = self._root
+        if old is not None:
+            # The position normally sits two plies below the last root (our move, their reply).
+            for node in [old, *old.children, *(g for c in old.children for g in c.children)]:
+                if node.me == me and node.opp == opp:
+                    node.parent = None
+                    return node
+        return self._new_node(me, opp, -1, None, 1.0 if board.winner_mark() else None)
+
+    def _new_node(
+        self, me: int, opp: int, move: int, parent: Optional[_Node], terminal: Optional[float]
+    ) -> _Node:
+        empty = ~(me | opp) & self._full_mask
+        untried = []
+        if terminal is None:
+            untried = [idx for idx in range(self._geometry.cell_count) if empty >> idx & 1]
+            if not untried:
+                terminal = 0.5
+            self._rng.shuffle(untried)
+        return _Node(me, opp, move, parent, untried, terminal)
+
+    def _expand(self, node: _Node) -> _Node:
+        idx = node.untried.pop()
+        placed = node.me | 1 << idx
+        terminal = None
+        for mask in self._masks_through[idx]:
+            if placed & mask == mask:
+                terminal = 1.0
+                break
+        child = self._new_node(node.opp, placed, idx, node, terminal)
+        node.children.append(child)
+        return child
+
+    def _playout(self, root: _Node) -> None:
+        node = root
+        c = self.exploration
+        while not node.untried and node.terminal is None:
+            log_visits = math.log(node.visits)
+            node = max(
+                node.children,
+                key=lambda child: (
+                    child.reward / child.visits + c * math.sqrt(log_visits / child.visits)
+                ),
+            )
+        if node.untried:
+            node = self._expand(node)
+
+        reward = node.terminal if node.terminal is not None else self._rollout(node)
+        while node is not None:
+            node.visits += 1
+            node.reward += reward
+            reward = 1.0 - reward
+            node = node.parent
+
+    def _rollout(self, node: _Node) -> float:
+        """Play uniformly random moves to the end; returns the result for node.opp."""
+        cells = list(node.untried) + [child.move for child in node.children]
+        self._rng.shuffle(cells)
+        bits = [node.me, node.opp]
+        turn = 0
+        for idx in cells:
+            placed = bits[turn] | 1 << idx
+            for mask in self._masks_through[idx]:
+                if placed & mask == mask:
+                    return 0.0 if turn == 0 else 1.0
+            bits[turn] = placed
+            turn ^= 1
+        return 0.5
+
+
+def _root_visits(
+    x_bits: int,
+    o_bits: int,
+    size: int,
+    win_length: int,
+    playouts: Optional[int],
+    time_limit_ms: Optional[float],
+    exploration: float,
+    seed: int,
+) -> Dict[int, int]:
+    """Worker entry point: one independent search, returning visits per root move."""
+    agent = MCTSAgent(playouts, time_limit_ms, exploration, seed)
+    root = agent.search(Board(x_bits=x_bits, o_bits=o_bits, size=size, win_length=win_length))
+    return {child.move: child.visits for child in root.children}
+
+
+def _ready() -> None:
+    pass
+
+
+def shared_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool with this many workers, started and warmed on first use, then reused."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            for future in [pool.submit(_ready) for _ in range(workers)]:
+                future.result()
+            _POOLS[workers] = pool
+        return pool
+
+
+def shutdown_pools() -> None:
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.shutdown()
+        _POOLS.clear()
@@ -0,0 +1,123 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ttt_core.domain import zobrist
+from ttt_core.domain.board import Board
+from ttt_core.domain.rules import Geometry
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+# Centre first, then corners, then edges: strong moves early means earlier cutoffs.
+_CLASSIC_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+
+@dataclass
+class MinimaxAgent:
+    """Perfect-play negamax with alpha-beta pruning and a Zobrist-keyed transposition table.
+
+    Scores are from the side to move: a win scores the number of cells that were
+    still empty when it was played (so faster wins score higher), a draw 0. The
+    table persists across games, so after the first search replies are lookups.
+    Both caches are dropped when the agent is handed a board of another shape.
+    """
+
+    nodes: int = 0
+    _geometry: Optional[Geometry] = field(default=None, repr=False)
+    _table: Dict[int, Tuple[int, int, int]] = field(default_factory=dict, repr=False)
+    _root_moves: Dict[int, int] = field(default_factory=dict, repr=False)
+
+    def choose_move(self, board: Board) -> int:
+        """Return an optimal move for whichever mark is to play on board."""
+        if board.geometry is not self._geometry:
+            self._bind(board.geometry)
+
+        key = board.zobrist_key
+        move = self._root_moves.get(key)
+        if move is not None:
+            return move
+
+        x_bits, o_bits = board.x_bits, board.o_bits
+        side = 0 if x_bits.bit_count() == o_bits.bit_count() else 1
+        me, opp = (x_bits, o_bits) if side == 0 else (o_bits, x_bits)
+
+        empty = ~(me | opp) & self._full_mask
+        if not empty:
+            raise ValueError("No legal moves left on the board")
+
+        best_move, best_score, alpha = -1, -self._infinity, -self._infinity
+        for idx in self._ordered_moves(empty, -1):
+            score = self._score_move(me, opp, key, side, idx, empty, alpha, self._infinity)
+            if score > best_score:
+                best_move, best_score = idx, score
+            alpha = max(alpha, score)
+
+        self._root_moves[key] = best_move
+        return best_move
+
+    def _bind(self, shape: Geometry) -> None:
+        self._geometry = shape
+        self._table.clear()
+        self._root_moves.clear()
+        self._full_mask = shape.full_mask
+        self._infinity = shape.cell_count + 1
+        self._zobrist = zobrist.zobrist_table(shape.cell_count)
+        self._masks_through = [
+            tuple(shape.line_masks[line_id] for line_id in line_ids)
+            for line_ids in shape.lines_through
+        ]
+        self._order = _CLASSIC_ORDER if shape.cell_count == 9 else tuple(range(shape.cell_count))
+
+    def _ordered_moves(self, empty: int, first: int) -> List[int]:
+        moves = [idx for idx in self._order if empty >> idx & 1]
+        if first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def _score_move(
+        self, me: int, opp: int, key: int, side: int, idx: int, empty: int, alpha: int, beta: int
+    ) -> int:
+        placed = me | 1 << idx
+        for mask in self._masks_through[idx]:
+            if placed & mask == mask:
+                return empty.bit_count()
+        child_key = key ^ self._zobrist[idx][side]
+        return -self._negamax(opp, placed, child_key, 1 - side, -beta, -alpha)
+
+    def _negamax(self, me: int, opp: int, key: int, side: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        empty = ~(me | opp) & self._full_mask
+        if not empty:
+            return 0
+
+        entry = self._table.get(key)
+        hint = -1
+        if entry is not None:
+            value, flag, hint = entry
+            if flag == _EXACT:
+                return value
+            if flag == _LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha = alpha
+        best_move, best_score = -1, -self._infinity
+        for idx in self._ordered_moves(empty, hint):
+            score = self._score_move(me, opp, key, side, idx, empty, alpha, beta)
+            if score > best_score:
+                best_move, best_score = idx, score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = _UPPER
+        elif best_score >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._table[key] = (best_score, flag, best_move)
+        return best_score
@@ -0,0 +1,186 @@
+"""Perfect play for the classic 3 x 3 game from a precomputed, retrograde-solved table.
+
+Every position reachable from the empty board is solved by backward induction, from
+full boards down to the empty one. Each position index (rules.position_index) gets a
+16-bit entry:
+
+    bits 0-8    mask of optimal moves for the side to move
+    bits 9-10   value for the side to move: 1 loss, 2 draw, 3 win (0 = unreachable)
+    bits 12-15  plies until the game ends under optimal play
+
+Optimal means the best value, winning as fast and losing as slowly as possible.
+
+File layout: MAGIC, then a little-endian uint16 format version and uint16 entry
+count, then the zlib-compressed entries as little-endian uint16. Regenerate the
+shipped file with ``python -m ttt_core.ai.perfect_play``.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from ttt_core.ai import batch
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+MAGIC = b"TTTP"
+FORMAT_VERSION = 1
+DEFAULT_TABLE_PATH = Path(__file__).parent / "data" / "perfect_play.bin"
+
+UNREACHABLE, LOSS, DRAW, WIN = 0, 1, 2, 3
+
+MOVE_MASK = 0x1FF
+_VALUE_SHIFT = 9
+_PLIES_SHIFT = 12
+
+_HEADER = struct.Struct("<4sHH")
+
+
+def entry_value(entry: int) -> int:
+    return entry >> _VALUE_SHIFT & 0b11
+
+
+def entry_plies(entry: int) -> int:
+    return entry >> _PLIES_SHIFT
+
+
+def _pack(value: int, plies: int, moves: int) -> int:
+    return plies << _PLIES_SHIFT | value << _VALUE_SHIFT | moves
+
+
+def _rank(value: int, plies: int) -> int:
+    """Order child results from the mover's side: quick wins first, slow losses before quick."""
+    if value == WIN:
+        return 100 - plies
+    if value == LOSS:
+        return plies - 100
+    return 0
+
+
+def solve() -> List[int]:
+    """Retrograde-solve every reachable position; returns one entry per position index."""
+    layers: List[Dict[int, tuple[int, int]]] = [{} for _ in range(10)]
+    layers[0][0] = (0, 0)
+    for depth in range(9):
+        for x_bits, o_bits in layers[depth].values():
+            if rules.winning_mask(x_bits) or rules.winning_mask(o_bits):
+                continue
+            empty = ~(x_bits | o_bits) & rules.FULL_MASK
+            for idx in range(9):
+                if empty >> idx & 1:
+                    child = (
+                        (x_bits | 1 << idx, o_bits)
+                        if depth % 2 == 0
+                        else (x_bits, o_bits | 1 << idx)
+                    )
+                    layers[depth + 1][rules.bits_index(*child)] = child
+
+    table = [0] * rules.POSITION_COUNT
+    for depth in range(9, -1, -1):
+        to_move_x = depth % 2 == 0
+        for index, (x_bits, o_bits) in layers[depth].items():
+            just_moved = o_bits if to_move_x else x_bits
+            if rules.winning_mask(just_moved):
+                table[index] = _pack(LOSS, 0, 0)
+                continue
+            empty = ~(x_bits | o_bits) & rules.FULL_MASK
+            if not empty:
+                table[index] = _pack(DRAW, 0, 0)
+                continue
+
+            best_rank, best = None, (UNREACHABLE, 0)
+            moves = 0
+            for idx in range(9):
+                if not empty >> idx & 1:
+                    continue
+                bit = 1 << idx
+                child = (
+                    rules.bits_index(x_bits | bit, o_bits)
+                    if to_move_x
+                    else rules.bits_index(x_bits, o_bits | bit)
+                )
+                entry = table[child]
+                value, plies = WIN + LOSS - entry_value(entry), entry_plies(entry) + 1
+                rank = _rank(value, plies)
+                if best_rank is None or rank > best_rank:
+                    best_rank, best, moves = rank, (value, plies), bit
+                elif rank == best_rank:
+                    moves |= bit
+            table[index] = _pack(best[0], best[1], moves)
+    return table
+
+
+def encode_table(table: Sequence[int]) -> bytes:
+    payload = array("H", table)
+    if sys.byteorder != "little":
+        payload.byteswap()
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(payload)) + zlib.compress(payload.tobytes(), 9)
+
+
+def decode_table(data: bytes) -> array:
+    """Validate the header and return the entries; raises ValueError on a bad file."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Perfect-play table is truncated")
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a perfect-play table")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported perfect-play table version {version}")
+
+    entries = array("H")
+    entries.frombytes(zlib.decompress(data[_HEADER.size :]))
+    if sys.byteorder != "little":
+        entries.byteswap()
+    if count != rules.POSITION_COUNT or len(entries) != count:
+        raise ValueError("Perfect-play table has the wrong number of entries")
+    return entries
+
+
+def write_table(path: Union[str, Path] = DEFAULT_TABLE_PATH) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_table(solve()))
+    return path
+
+
+def load_table(path: Union[str, Path] = DEFAULT_TABLE_PATH) -> array:
+    return decode_table(Path(path).read_bytes())
+
+
+@dataclass
+class PerfectPlayAgent:
+    """Answers choose_move with one lookup into the solved table (classic 3 x 3 only)."""
+
+    table: array = None
+
+    def __post_init__(self) -> None:
+        if self.table is None:
+            self.table = load_table()
+
+    def optimal_moves(self, board: Board) -> int:
+        """Bit mask of every optimal move for the side to move."""
+        return self.table[board.position_index()] & MOVE_MASK
+
+    def choose_move(self, board: Board) -> int:
+        moves = self.optimal_moves(board)
+        if not moves:
+            raise ValueError("No optimal move: the game is over or the position is unreachable")
+        return (moves & -moves).bit_length() - 1
+
+    def choose_moves(self, boards: batch.Positions) -> np.ndarray:
+        """choose_move for a batch: the lowest optimal move of each position."""
+        indices, _ = batch.position_arrays(boards)
+        moves = np.frombuffer(self.table, dtype=np.uint16)[indices] & MOVE_MASK
+        if not moves.all():
+            raise ValueError("No optimal move: the game is over or the position is unreachable")
+        return (moves[:, None] >> np.arange(9) & 1).argmax(axis=1)
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_table()}")
@@ -0,0 +1,247 @@
+"""Dense Q-table model files: one row of 9 action values per position index.
+
+Layout, little-endian:
+
+    0   4s   MAGIC
+    4   H    format version
+    6   H    state encoding (ENCODING_TERNARY: rules.position_index, X = 1, O = 2)
+    8   I    rows (3**9)
+    12  I    columns (9 actions)
+    16  I    CRC-32 of the value block
+    20  B    value type: 0 float32, 1 float16, 2 int8 (version 2; zero padding in version 1)
+    21  3x   padding
+    24  f    int8 scale: Q = stored value * scale (1.0 for float types)
+    28  ..   zero padding up to HEADER_SIZE
+    64  ..   rows x columns values, row-major
+
+States a model never visited keep the value 0, matching the defaultdict the pickled
+models were loaded into. Loading maps the file read-only, so every process that opens
+the same model shares one physical copy through the page cache. Quantized rows are
+returned as stored: scaling is monotonic, so greedy move choice needs no dequantizing.
+
+Convert pickled (or re-quantize dense) models with
+``python -m ttt_core.ai.qtable [--dtype float16|int8] [--no-verify] MODEL [...]``;
+each is written next to its source, float32 as NAME.qtab and others as NAME.DTYPE.qtab,
+and every reachable position whose greedy moves changed in the export is reported.
+Dense files are build products: ensure_export() regenerates one from its pickle.
+"""
+
+import argparse
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Hashable, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from ttt_core.ai import perfect_play
+from ttt_core.domain import rules, zobrist
+
+MAGIC = b"TTTQ"
+FORMAT_VERSION = 2
+ENCODING_TERNARY = 1
+QTABLE_SUFFIX = ".qtab"
+HEADER_SIZE = 64
+ACTIONS = 9
+
+VALUE_TYPES = {"float32": "<f4", "float16": "<f2", "int8": "i1"}
+_TYPE_CODES = ("float32", "float16", "int8")
+
+_HEADER = struct.Struct("<4sHHIIIB3xf")
+
+PathLike = Union[str, Path]
+
+
+class QTableHeader(NamedTuple):
+    version: int
+    encoding: int
+    rows: int
+    columns: int
+    checksum: int
+    value_type: str
+    scale: float
+
+
+def is_qtable(path: PathLike) -> bool:
+    """True if path starts with the dense Q-table magic."""
+    with open(path, "rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+def dense_from_dict(
+    q_table: Dict[Tuple[Hashable, int], float], dtype: np.dtype = np.float32
+) -> np.ndarray:
+    """Pack a (state, action) -> value mapping into a [POSITION_COUNT, 9] array.
+
+    States may be Zobrist keys, as the trainer saves them, legacy 9-character strings or
+    sequences of cell strings. Keys of no 3 x 3 position are skipped, as QAgent does.
+    """
+    values = np.zeros((rules.POSITION_COUNT, ACTIONS), dtype=dtype)
+    index_by_key = zobrist.key_indices()
+    for (state, action), value in q_table.items():
+        if isinstance(state, int):
+            index = index_by_key.get(state)
+            if index is None:
+                continue
+        else:
+            index = rules.position_index(state)
+        values[index, action] = value
+    return values
+
+
+def quantize(values: np.ndarray, value_type: str) -> Tuple[np.ndarray, float]:
+    """(stored array, scale) for value_type; int8 maps the largest |Q| to 127."""
+    if value_type not in VALUE_TYPES:
+        raise ValueError(f"Unknown value type {value_type!r}")
+    if value_type != "int8":
+        return np.asarray(values).astype(VALUE_TYPES[value_type]), 1.0
+
+    peak = float(np.abs(values).max())
+    scale = peak / 127 if peak else 1.0
+    return np.clip(np.rint(np.asarray(values) / scale), -127, 127).astype(np.int8), scale
+
+
+def dequantize(values: np.ndarray, scale: float) -> np.ndarray:
+    return np.asarray(values, dtype=np.float32) * np.float32(scale)
+
+
+def write_qtable(path: PathLike, values: np.ndarray, value_type: str = "float32") -> Path:
+    """Quantize and write values atomically: a temporary sibling file is renamed over path."""
+    if np.shape(values) != (rules.POSITION_COUNT, ACTIONS):
+        raise ValueError(
+            f"Expected shape {(rules.POSITION_COUNT, ACTIONS)}, got {np.shape(values)}"
+        )
+    stored, scale = quantize(values, value_type)
+
+    body = np.ascontiguousarray(stored).tobytes()
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        ENCODING_TERNARY,
+        stored.shape[0],
+        stored.shape[1],
+        zlib.crc32(body),
+        _TYPE_CODES.index(value_type),
+        scale,
+    )
+    path = Path(path)
+    scratch = path.with_name(path.name + ".tmp")
+    with open(scratch, "wb") as handle:
+        handle.write(header.ljust(HEADER_SIZE, b"\0"))
+        handle.write(body)
+    os.replace(scratch, path)
+    return path
+
+
+def read_header(path: PathLike) -> QTableHeader:
+    """Parse and validate the header; raises ValueError if it is not a usable Q-table."""
+    with open(path, "rb") as handle:
+        raw = handle.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("Q-table file is truncated")
+    magic, version, encoding, rows, columns, checksum, type_code, scale = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("Not a dense Q-table file")
+    if version not in (1, FORMAT_VERSION):
+        raise ValueError(f"Unsupported Q-table version {version}")
+    if encoding != ENCODING_TERNARY or (rows, columns) != (rules.POSITION_COUNT, ACTIONS):
+        raise ValueError("Unsupported Q-table state encoding")
+    if type_code >= len(_TYPE_CODES):
+        raise ValueError(f"Unknown Q-table value type {type_code}")
+    return QTableHeader(
+        version, encoding, rows, columns, checksum, _TYPE_CODES[type_code], scale or 1.0
+    )
+
+
+def load_qtable(path: PathLike, verify: bool = True) -> np.ndarray:
+    """Map a dense Q-table read-only, values as stored; raises ValueError on a bad file."""
+    header = read_header(path)
+    dtype = np.dtype(VALUE_TYPES[header.value_type])
+    if os.path.getsize(path) != HEADER_SIZE + header.rows * header.columns * dtype.itemsize:
+        raise ValueError("Q-table file is truncated")
+
+    values = np.memmap(
+        path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(header.rows, header.columns)
+    )
+    if verify and zlib.crc32(values) != header.checksum:
+        raise ValueError("Q-table checksum mismatch")
+    return values
+
+
+def greedy_sets(values: np.ndarray) -> np.ndarray:
+    """(POSITION_COUNT, 9) mask of the legal moves holding each row's greedy value."""
+    digits = np.arange(rules.POSITION_COUNT)[:, None] // 3 ** np.arange(ACTIONS) % 3
+    legal = digits == 0
+    masked = np.where(legal, np.asarray(values, dtype=np.float64), -np.inf)
+    return legal & (masked == masked.max(axis=1, keepdims=True))
+
+
+def policy_mismatches(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Position indices, over every reachable unfinished position, whose greedy move sets differ."""
+    table = np.frombuffer(perfect_play.load_table(), dtype=np.uint16)
+    reachable = (table & perfect_play.MOVE_MASK) != 0
+    differs = (greedy_sets(reference) != greedy_sets(candidate)).any(axis=1)
+    return np.flatnonzero(reachable & differs)
+
+
+def load_reference(path: PathLike) -> np.ndarray:
+    """Full-precision values of a pickled or dense model, for export and verification."""
+    if is_qtable(path):
+        header = read_header(path)
+        return dequantize(load_qtable(path), header.scale)
+    with open(path, "rb") as handle:
+        return dense_from_dict(pickle.load(handle), np.float64)
+
+
+def export_path(source: PathLike, value_type: str) -> Path:
+    stem = Path(source).name.split(".")[0]
+    suffix = QTABLE_SUFFIX if value_type == "float32" else f".{value_type}{QTABLE_SUFFIX}"
+    return Path(source).with_name(stem + suffix)
+
+
+def convert_pickle(
+    pickle_path: PathLike, out_path: PathLike = None, value_type: str = "float32"
+) -> Path:
+    """Convert a pickled (state, action) -> value model to the dense format."""
+    values = load_reference(pickle_path)
+    return write_qtable(out_path or export_path(pickle_path, value_type), values, value_type)
+
+
+def ensure_export(source: PathLike, value_type: str = "float32") -> Path:
+    """Path of source's dense copy, exporting it first when missing or older than source."""
+    target = export_path(source, value_type)
+    if not target.exists() or target.stat().st_mtime_ns < os.stat(source).st_mtime_ns:
+        convert_pickle(source, target, value_type)
+    return target
+
+
+def main(argv: Union[list, None] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export Q-table models to the dense format.")
+    parser.add_argument("models", nargs="+", help="pickled or dense models to convert")
+    parser.add_argument("--dtype", choices=_TYPE_CODES, default="float32")
+    parser.add_argument(
+        "--no-verify",
+        dest="verify",
+        action="store_false",
+        help="skip reporting states whose greedy moves changed",
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for source in args.models:
+        reference = load_reference(source)
+        target = write_qtable(export_path(source, args.dtype), reference, args.dtype)
+        print(f"{source} -> {target} ({os.path.getsize(target):,} bytes)")
+        if args.verify:
+            mismatches = policy_mismatches(reference, load_qtable(target))
+            failures += len(mismatches)
+            for index in mismatches.tolist():
+                print(f"  greedy moves differ at position {index}: {rules.index_cells(index)}")
+            print(f"  {len(mismatches)} reachable positions differ")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
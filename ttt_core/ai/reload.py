@@ -0,0 +1,116 @@
+"""Hot reload of model-backed agents when their file changes on disk.
+
+A watcher thread polls the model's (path, mtime, size) key. On a change it loads the
+new model and validates it on that thread, then publishes it with a single reference
+assignment. Each move reads the reference once, so a move runs entirely on the old
+model or entirely on the new one, and a model that fails to load or validate is never
+published: the previous one keeps serving and the failure is counted. A file that
+failed is not loaded again until its key changes.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Optional
+
+from ttt_core.ai.cache import ModelKey, load_agent, model_key
+from ttt_core.domain.board import Board
+
+
+@dataclass
+class ReloadMetrics:
+    reloads: int = 0
+    failures: int = 0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_error: Optional[str] = None
+
+
+def answers_empty_board(agent: object) -> None:
+    """Default validation: the agent must return a legal move for the opening position."""
+    board = Board()
+    move = agent.choose_move(board)
+    if move not in board.legal_moves():
+        raise ValueError(f"Model answered illegal move {move!r} on the empty board")
+
+
+class ReloadingAgent:
+    """Wraps the agent loaded from path and swaps in a new one when the file changes."""
+
+    def __init__(
+        self,
+        path: str,
+        loader: Callable[[str], object] = load_agent,
+        validate: Callable[[object], None] = answers_empty_board,
+        poll_interval: float = 1.0,
+        watch: bool = True,
+    ) -> None:
+        self.path = path
+        self._loader = loader
+        self._validate = validate
+        self._poll_interval = poll_interval
+        self._key: ModelKey = model_key(path)
+        self._failed_key: Optional[ModelKey] = None
+        self._agent = loader(path)
+        self._metrics = ReloadMetrics()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        if watch:
+            self._watcher = threading.Thread(target=self._watch, name="model-reload", daemon=True)
+            self._watcher.start()
+
+    @property
+    def agent(self) -> object:
+        return self._agent
+
+    def choose_move(self, board: Board) -> int:
+        return self._agent.choose_move(board)
+
+    def choose_moves(self, boards: object) -> object:
+        return self._agent.choose_moves(boards)
+
+    def metrics(self) -> ReloadMetrics:
+        with self._lock:
+            return replace(self._metrics)
+
+    def check_now(self) -> bool:
+        """Reload if the file changed since the last load attempt; True if a new model went live."""
+        try:
+            key = model_key(self.path)
+        except OSError:
+            # Mid-replace or deleted: keep serving and look again on the next poll.
+            return False
+        if key == self._key or key == self._failed_key:
+            return False
+
+        start = time.perf_counter()
+        try:
+            fresh = self._loader(self.path)
+            self._validate(fresh)
+        except Exception as error:
+            self._failed_key = key
+            with self._lock:
+                self._metrics.failures += 1
+                self._metrics.last_error = f"{type(error).__name__}: {error}"
+            return False
+
+        self._agent = fresh
+        self._key, self._failed_key = key, None
+        elapsed_ms = (time.perf_counter() - start) * 1e3
+        with self._lock:
+            metrics = self._metrics
+            metrics.reloads += 1
+            metrics.last_latency_ms = elapsed_ms
+            metrics.max_latency_ms = max(metrics.max_latency_ms, elapsed_ms)
+            metrics.last_error = None
+        return True
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            self.check_now()
@@ -1,23 +1,157 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from ttt_core.domain import rules
+from ttt_core.domain import rules, zobrist
 from ttt_core.domain.types import Mark
 
+_MOVES_BY_EMPTY_MASK: List[tuple[int, ...]] = [
+    tuple(idx for idx in range(9) if empty >> idx & 1) for empty in range(rules.FULL_MASK + 1)
+]
+
 
-@dataclass
 class Board:
-    cells: List[str] = field(default_factory=lambda: [""] * 9)
+    """Bitboard position: one integer per mark, bit i set when cell i is taken.
+
+    Defaults to classic 3 x 3 three-in-a-row; size and win_length select any
+    N x N board with k in a row (cells numbered row-major).
+    """
+
+    def __init__(self, x_bits: int = 0, o_bits: int = 0, size: int = 3, win_length: int = 3):
+        self.size = size
+        self.win_length = win_length
+        self._geometry = rules.geometry(size, win_length)
+        self._zobrist = zobrist.zobrist_table(self._geometry.cell_count)
+        self._x_bits = x_bits
+        self._o_bits = o_bits
+        self._key = self._rehash()
+
+    def __repr__(self) -> str:
+        return (
+            f"Board(x_bits={self._x_bits}, o_bits={self._o_bits}, "
+            f"size={self.size}, win_length={self.win_length})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Board):
+            return NotImplemented
+        return (self._x_bits, self._o_bits, self.size, self.win_length) == (
+            other._x_bits,
+            other._o_bits,
+            other.size,
+            other.win_length,
+        )
+
+    @property
+    def x_bits(self) -> int:
+        return self._x_bits
+
+    @x_bits.setter
+    def x_bits(self, bits: int) -> None:
+        """Replace X's bitboard wholesale; the Zobrist key is rebuilt to match."""
+        self._x_bits = bits
+        self._key = self._rehash()
+
+    @property
+    def o_bits(self) -> int:
+        return self._o_bits
+
+    @o_bits.setter
+    def o_bits(self, bits: int) -> None:
+        """Replace O's bitboard wholesale; the Zobrist key is rebuilt to match."""
+        self._o_bits = bits
+        self._key = self._rehash()
+
+    @property
+    def geometry(self) -> rules.Geometry:
+        return self._geometry
+
+    @property
+    def zobrist_key(self) -> int:
+        """Stable integer key of the position, kept in step by every mutating method."""
+        return self._key
+
+    @property
+    def cells(self) -> List[str]:
+        """Derived copy of the position as cell strings ("X", "O" or "")."""
+        x_bits, o_bits = self._x_bits, self._o_bits
+        return [
+            "X" if x_bits >> i & 1 else "O" if o_bits >> i & 1 else ""
+            for i in range(self._geometry.cell_count)
+        ]
+
+    @cells.setter
+    def cells(self, values: Sequence[str]) -> None:
+        self._x_bits, self._o_bits = rules.cells_to_bits(values)
+        self._key = self._rehash()
+
+    def clear(self) -> None:
+        self._x_bits = 0
+        self._o_bits = 0
+        self._key = 0
 
     def place_mark(self, idx: int, mark: Mark) -> None:
-        self.cells[idx] = mark.value
+        bit = 1 << idx
+        x_value, o_value = self._zobrist[idx]
+        if mark is Mark.X_MARK:
+            if self._o_bits & bit:
+                self._o_bits ^= bit
+                self._key ^= o_value
+            if not self._x_bits & bit:
+                self._x_bits |= bit
+                self._key ^= x_value
+        else:
+            if self._x_bits & bit:
+                self._x_bits ^= bit
+                self._key ^= x_value
+            if not self._o_bits & bit:
+                self._o_bits |= bit
+                self._key ^= o_value
+
+    def remove_mark(self, idx: int) -> None:
+        """Empty a cell (undo of place_mark); a no-op when it is already empty."""
+        bit = 1 << idx
+        if self._x_bits & bit:
+            self._x_bits ^= bit
+            self._key ^= self._zobrist[idx][0]
+        elif self._o_bits & bit:
+            self._o_bits ^= bit
+            self._key ^= self._zobrist[idx][1]
 
     def legal_moves(self) -> List[int]:
-        return [idx for idx, value in enumerate(self.cells) if value == ""]
+        empty = ~(self._x_bits | self._o_bits) & self._geometry.full_mask
+        if self.size == 3:
+            return list(_MOVES_BY_EMPTY_MASK[empty])
 
-    def winner_mark(self) -> Optional[str]:
-        won, mark, _ = rules.has_winner(self.cells)
-        return Mark(mark) if won and mark else None
+        moves = []
+        while empty:
+            lowest = empty & -empty
+            moves.append(lowest.bit_length() - 1)
+            empty ^= lowest
+        return moves
+
+    def winner_mark(self) -> Optional[Mark]:
+        masks = self._geometry.line_masks
+        if rules.winning_mask(self._x_bits, masks) is not None:
+            return Mark.X_MARK
+        if rules.winning_mask(self._o_bits, masks) is not None:
+            return Mark.O_MARK
+        return None
 
     def is_draw(self) -> bool:
-        return rules.is_draw(self.cells)
+        return self._x_bits | self._o_bits == self._geometry.full_mask
+
+    def position_index(self) -> int:
+        """Base-3 index into the outcome table (classic 3 x 3 boards only)."""
+        return rules.bits_index(self._x_bits, self._o_bits)
+
+    def outcome(self) -> rules.Outcome:
+        """Winner, win line and draw flag from one outcome-table lookup (classic 3 x 3 only)."""
+        return rules.outcome(rules.bits_index(self._x_bits, self._o_bits))
+
+    def _rehash(self) -> int:
+        key = 0
+        for idx, (x_value, o_value) in enumerate(self._zobrist):
+            if self._x_bits >> idx & 1:
+                key ^= x_value
+            elif self._o_bits >> idx & 1:
+                key ^= o_value
+        return key
@@ -1,4 +1,8 @@
-from typing import Optional, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
 
 WIN_LINES: Sequence[tuple[int, int, int]] = (
     (0, 1, 2),
@@ -11,13 +15,239 @@ WIN_LINES: Sequence[tuple[int, int, int]] = (
     (2, 4, 6),
 )
 
+FULL_MASK = 0x1FF
+
+WIN_MASKS: Sequence[int] = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in WIN_LINES)
+
+POSITION_COUNT = 3**9
+
+_DIGIT_CELLS = ("", "X", "O")
+# Legacy 9-character states mark empty cells with " ".
+_CELL_DIGITS = {"": 0, " ": 0, "X": 1, "O": 2}
+
+# Base-3 weight of every 9-bit occupancy mask, so a bitboard pair maps to an index in O(1).
+_TERNARY_BY_MASK: List[int] = [
+    sum(3**idx for idx in range(9) if mask >> idx & 1) for mask in range(FULL_MASK + 1)
+]
+
+
+class Outcome(NamedTuple):
+    winner: Optional[str]
+    win_line: Optional[tuple[int, int, int]]
+    is_draw: bool
+
+
+# Built together on first use by outcome_table().
+_OUTCOMES: Optional[List[Outcome]] = None
+_WINNER_RESULTS: List[tuple[bool, Optional[str], Optional[tuple[int, int, int]]]] = []
+# Cell tuples ("" for empty) and legacy 9-character strings (" " for empty) -> index.
+_INDEX_BY_CELLS: Dict[Union[tuple[str, ...], str], int] = {}
+
 
 def has_winner(cells: Sequence[str]) -> tuple[bool, Optional[str], Optional[tuple[int, int, int]]]:
+    if _OUTCOMES is None:
+        outcome_table()
+    try:
+        return _WINNER_RESULTS[_INDEX_BY_CELLS[tuple(cells)]]
+    except (KeyError, TypeError):
+        return _WINNER_RESULTS[position_index(cells)]
+
+
+def is_draw(cells: Sequence[str]) -> bool:
+    if _OUTCOMES is None:
+        outcome_table()
+    try:
+        return _OUTCOMES[_INDEX_BY_CELLS[tuple(cells)]].is_draw
+    except (KeyError, TypeError):
+        return _OUTCOMES[position_index(cells)].is_draw
+
+
+def position_index(cells: Sequence[str]) -> int:
+    """Base-3 index of a board: cell i contributes 3**i times 0 (empty), 1 (X) or 2 (O).
+
+    Empty cells may be "" or " "; raises ValueError unless given nine valid cells.
+    """
+    if _OUTCOMES is None:
+        outcome_table()
+    try:
+        return _INDEX_BY_CELLS[cells if isinstance(cells, str) else tuple(cells)]
+    except (KeyError, TypeError):
+        return _fold_cells(cells)
+
+
+def _fold_cells(cells: Sequence[str]) -> int:
+    """Slow path of position_index for mixed empty markers; validates the board."""
+    if len(cells) != 9:
+        raise ValueError(f"Expected 9 cells, got {len(cells)}")
+    index = 0
+    try:
+        for cell in reversed(cells):
+            index = index * 3 + _CELL_DIGITS[cell]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid cell value in {list(cells)!r}") from None
+    return index
+
+
+def bits_index(x_bits: int, o_bits: int) -> int:
+    """Base-3 index of a board given as (X, O) bitboards."""
+    return _TERNARY_BY_MASK[x_bits] + 2 * _TERNARY_BY_MASK[o_bits]
+
+
+def index_cells(index: int) -> List[str]:
+    """Inverse of position_index."""
+    cells = []
+    for _ in range(9):
+        index, digit = divmod(index, 3)
+        cells.append(_DIGIT_CELLS[digit])
+    return cells
+
+
+def outcome(index: int) -> Outcome:
+    """Look up (winner, win_line, is_draw) for a base-3 position index."""
+    return (_OUTCOMES or outcome_table())[index]
+
+
+def outcome_table() -> List[Outcome]:
+    """Return the 3**9 outcome table, building it on first use."""
+    global _OUTCOMES, _WINNER_RESULTS, _INDEX_BY_CELLS
+    if _OUTCOMES is None:
+        outcomes, winner_results, index_by_cells = [], [], {}
+        for index in range(POSITION_COUNT):
+            cells = index_cells(index)
+            result = _scan_outcome(cells)
+            outcomes.append(result)
+            winner_results.append((result.winner is not None, result.winner, result.win_line))
+            index_by_cells[tuple(cells)] = index
+            index_by_cells["".join(cell or " " for cell in cells)] = index
+        # Publish the outcome list last: the other lookups are guarded on it.
+        _WINNER_RESULTS, _INDEX_BY_CELLS = winner_results, index_by_cells
+        _OUTCOMES = outcomes
+    return _OUTCOMES
+
+
+def _scan_outcome(cells: Sequence[str]) -> Outcome:
     for a, b, c in WIN_LINES:
         if cells[a] and cells[a] == cells[b] == cells[c]:
-            return True, cells[a], (a, b, c)
-    return False, None, None
+            return Outcome(cells[a], (a, b, c), False)
+    return Outcome(None, None, all(cells))
 
 
-def is_draw(cells: Sequence[str]) -> bool:
-    return all(bool(cell) for cell in cells)
+def winning_mask(bits: int, masks: Sequence[int] = WIN_MASKS) -> Optional[int]:
+    """Return the first line mask fully covered by one mark's bitboard."""
+    for mask in masks:
+        if bits & mask == mask:
+            return mask
+    return None
+
+
+def cells_to_bits(cells: Sequence[str]) -> tuple[int, int]:
+    """Split nine cell strings into (X, O) bitboards, bit i set when cell i is taken."""
+    x_bits = o_bits = 0
+    for idx, value in enumerate(cells):
+        if value == "X":
+            x_bits |= 1 << idx
+        elif value == "O":
+            o_bits |= 1 << idx
+    return x_bits, o_bits
+
+
+class BatchOutcome(NamedTuple):
+    """Per-board results of evaluate_batch, all arrays of length N.
+
+    winner: 0 none, 1 X, 2 O. win_line: index into WIN_LINES, -1 when there is no
+    winner. is_draw: full board without a winner. legal_mask: bit i set when cell i
+    is empty.
+    """
+
+    winner: np.ndarray
+    win_line: np.ndarray
+    is_draw: np.ndarray
+    legal_mask: np.ndarray
+
+
+_CELL_BITS = (1 << np.arange(9)).astype(np.uint16)
+_WIN_MASK_ARRAY = np.array(WIN_MASKS, dtype=np.uint16)
+
+
+def evaluate_batch(boards: np.ndarray) -> BatchOutcome:
+    """Evaluate an (N, 9) array of boards (0 empty, 1 X, 2 O) with line-mask operations.
+
+    Matches has_winner/is_draw per row, including which line is reported when a
+    position has more than one.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 2 or boards.shape[1] != 9:
+        raise ValueError(f"Expected an (N, 9) board array, got shape {boards.shape}")
+
+    x_bits = (boards == 1) @ _CELL_BITS
+    o_bits = (boards == 2) @ _CELL_BITS
+    legal_mask = (boards == 0) @ _CELL_BITS
+
+    x_lines = (x_bits[:, None] & _WIN_MASK_ARRAY) == _WIN_MASK_ARRAY
+    o_lines = (o_bits[:, None] & _WIN_MASK_ARRAY) == _WIN_MASK_ARRAY
+    any_lines = x_lines | o_lines
+
+    first_line = any_lines.argmax(axis=1)
+    has_line = any_lines[np.arange(len(boards)), first_line]
+    x_first = x_lines[np.arange(len(boards)), first_line]
+
+    winner = np.where(has_line, np.where(x_first, 1, 2), 0).astype(np.int8)
+    win_line = np.where(has_line, first_line, -1).astype(np.int8)
+    is_draw = (legal_mask == 0) & ~has_line
+
+    return BatchOutcome(winner, win_line, is_draw, legal_mask)
+
+
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@dataclass(frozen=True)
+class Geometry:
+    """Winning lines of an N x N board with k in a row, cells numbered row-major."""
+
+    size: int
+    win_length: int
+    lines: tuple[tuple[int, ...], ...]
+    line_masks: tuple[int, ...]
+    lines_through: tuple[tuple[int, ...], ...]
+    full_mask: int
+
+    @property
+    def cell_count(self) -> int:
+        return self.size * self.size
+
+
+@lru_cache(maxsize=None)
+def geometry(size: int = 3, win_length: int = 3) -> Geometry:
+    """Build (once per size and win_length) every k-cell window as a line.
+
+    Lines are ordered rows, columns, diagonals, anti-diagonals, so the 3 x 3
+    geometry reproduces WIN_LINES exactly.
+    """
+    if size < 1 or not 1 <= win_length <= size:
+        raise ValueError(f"Invalid board geometry: size={size}, win_length={win_length}")
+
+    lines = []
+    for dr, dc in _DIRECTIONS:
+        for row in range(size):
+            for col in range(size):
+                end_row = row + dr * (win_length - 1)
+                end_col = col + dc * (win_length - 1)
+                if 0 <= end_row < size and 0 <= end_col < size:
+                    lines.append(
+                        tuple((row + dr * i) * size + col + dc * i for i in range(win_length))
+                    )
+
+    lines_through = [[] for _ in range(size * size)]
+    for line_id, line in enumerate(lines):
+        for idx in line:
+            lines_through[idx].append(line_id)
+
+    return Geometry(
+        size=size,
+        win_length=win_length,
+        lines=tuple(lines),
+        line_masks=tuple(sum(1 << idx for idx in line) for line in lines),
+        lines_through=tuple(tuple(ids) for ids in lines_through),
+        full_mask=(1 << size * size) - 1,
+    )
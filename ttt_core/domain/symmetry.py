@@ -0,0 +1,108 @@
+"""D4 symmetries of the 3 x 3 board: four rotations and four reflections.
+
+Transform t sends the mark on cell i to cell TRANSFORMS[t][i]. The canonical form of a
+position is the image with the smallest base-3 index (rules.position_index), taking
+the lowest transform id on ties. Everything is precomputed so canonicalising a board
+or mapping a move costs a few table lookups.
+"""
+
+from typing import List, NamedTuple, Optional, Sequence
+
+from ttt_core.domain import rules
+from ttt_core.domain.board import Board
+
+
+def _rotate(idx: int) -> int:
+    row, col = divmod(idx, 3)
+    return col * 3 + (2 - row)
+
+
+def _mirror(idx: int) -> int:
+    row, col = divmod(idx, 3)
+    return row * 3 + (2 - col)
+
+
+def _compose(first: Sequence[int], then: Sequence[int]) -> tuple[int, ...]:
+    return tuple(then[first[idx]] for idx in range(9))
+
+
+_IDENTITY = tuple(range(9))
+_ROT90 = tuple(_rotate(idx) for idx in range(9))
+_ROT180 = _compose(_ROT90, _ROT90)
+_ROT270 = _compose(_ROT180, _ROT90)
+_MIRROR = tuple(_mirror(idx) for idx in range(9))
+
+TRANSFORMS: Sequence[tuple[int, ...]] = (
+    _IDENTITY,
+    _ROT90,
+    _ROT180,
+    _ROT270,
+    _MIRROR,
+    _compose(_MIRROR, _ROT90),
+    _compose(_MIRROR, _ROT180),
+    _compose(_MIRROR, _ROT270),
+)
+
+INVERSE_TRANSFORMS: Sequence[tuple[int, ...]] = tuple(
+    tuple(perm.index(idx) for idx in range(9)) for perm in TRANSFORMS
+)
+
+# INVERSE_ID[t] is the transform that undoes t.
+INVERSE_ID: Sequence[int] = tuple(TRANSFORMS.index(inverse) for inverse in INVERSE_TRANSFORMS)
+
+_BITS_BY_TRANSFORM: List[List[int]] = [
+    [sum(1 << perm[idx] for idx in range(9) if mask >> idx & 1) for mask in range(512)]
+    for perm in TRANSFORMS
+]
+
+
+class Canonical(NamedTuple):
+    x_bits: int
+    o_bits: int
+    index: int
+    transform: int
+
+
+# (canonical index, transform id) per position index, built on first use.
+_CANONICAL: Optional[List[tuple[int, int]]] = None
+
+
+def transform_bits(bits: int, transform: int) -> int:
+    return _BITS_BY_TRANSFORM[transform][bits]
+
+
+def canonical_index(index: int) -> tuple[int, int]:
+    """Return (canonical position index, transform id taking index to it)."""
+    return (_CANONICAL or canonical_table())[index]
+
+
+def canonicalize(board: Board) -> Canonical:
+    """Canonical representative of a 3 x 3 board and the transform that produces it."""
+    index, transform = (_CANONICAL or canonical_table())[board.position_index()]
+    bits = _BITS_BY_TRANSFORM[transform]
+    return Canonical(bits[board.x_bits], bits[board.o_bits], index, transform)
+
+
+def to_canonical_move(idx: int, transform: int) -> int:
+    return TRANSFORMS[transform][idx]
+
+
+def from_canonical_move(idx: int, transform: int) -> int:
+    return INVERSE_TRANSFORMS[transform][idx]
+
+
+def canonical_table() -> List[tuple[int, int]]:
+    """Return the 3**9 canonicalisation table, building it on first use."""
+    global _CANONICAL
+    if _CANONICAL is None:
+        table = []
+        for index in range(rules.POSITION_COUNT):
+            x_bits, o_bits = rules.cells_to_bits(rules.index_cells(index))
+            table.append(
+                min(
+                    (rules.bits_index(bits[x_bits], bits[o_bits]), transform)
+                    for transform, bits in enumerate(_BITS_BY_TRANSFORM)
+                )
+            )
+        _CANONICAL = table
+    return _CANONICAL
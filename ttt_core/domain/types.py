@@ -13,3 +13,4 @@ class GameStatus:
     winner: Optional[Mark]
     is_draw: bool
     is_over: bool
+    win_line: Optional[tuple[int, ...]] = None
@@ -0,0 +1,53 @@
+"""Zobrist keys: a stable integer per position, XOR-updated one cell at a time.
+
+The key of a position is the XOR of one 64-bit value per occupied cell. Values come
+from random.Random(ZOBRIST_SEED).getrandbits(64), drawn cell by cell in row-major
+order, X value first then O value. The empty board is key 0. Because the sequence is
+seeded, keys are identical across processes and runs, so they can be persisted.
+
+Legacy models are keyed by 9-character state strings ("X", "O" or " " per cell);
+state_key() maps such a string to the key of the same position.
+"""
+
+import random
+from functools import lru_cache
+from typing import Dict, Sequence
+
+import numpy as np
+
+ZOBRIST_SEED = 0x7A0B15
+
+ZobristTable = tuple[tuple[int, int], ...]
+
+
+@lru_cache(maxsize=None)
+def zobrist_table(cell_count: int = 9) -> ZobristTable:
+    """(X value, O value) for each cell; tables for larger boards extend smaller ones."""
+    rng = random.Random(ZOBRIST_SEED)
+    return tuple((rng.getrandbits(64), rng.getrandbits(64)) for _ in range(cell_count))
+
+
+def state_key(cells: Sequence[str]) -> int:
+    """Key of a position given as cell strings or a legacy state string."""
+    table = zobrist_table(len(cells))
+    key = 0
+    for idx, value in enumerate(cells):
+        if value == "X":
+            key ^= table[idx][0]
+        elif value == "O":
+            key ^= table[idx][1]
+    return key
+
+
+def position_keys() -> np.ndarray:
+    """Key of every 3 x 3 base-3 position index (see rules.position_index), as uint64."""
+    table = np.array(zobrist_table(9), dtype=np.uint64)
+    digits = np.arange(3**9)[:, None] // 3 ** np.arange(9) % 3
+    cell_keys = np.where(digits == 1, table[:, 0], np.where(digits == 2, table[:, 1], 0))
+    return np.bitwise_xor.reduce(cell_keys.astype(np.uint64), axis=1)
+
+
+@lru_cache(maxsize=1)
+def key_indices() -> Dict[int, int]:
+    """Inverse of position_keys: 3 x 3 key -> base-3 position index."""
+    return {key: index for index, key in enumerate(position_keys().tolist())}
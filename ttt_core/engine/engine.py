@@ -1,15 +1,34 @@
-from typing import Any, Dict
+from typing import List, NamedTuple, Optional
 
 from ttt_core.domain.board import Board
-from ttt_core.domain.rules import has_winner
 from ttt_core.engine.game import Game
 from ttt_core.engine.stats import Stats
 
 
+class MoveResult(NamedTuple):
+    """Immutable outcome of one move, handed straight through to the UI."""
+
+    placed_index: Optional[int]
+    attempts: int
+    game_over: bool
+    winner: str
+    win_line: Optional[tuple[int, ...]]
+
+
+# Shared results for every non-final move on a classic board, indexed [attempts][index].
+_IN_PROGRESS_RESULTS: List[List[MoveResult]] = [
+    [MoveResult(index, attempts, False, "", None) for index in range(9)] for attempts in range(10)
+]
+
+
 class Engine:
-    def __init__(self, stats: Stats) -> None:
+    def __init__(
+        self, stats: Stats, board: Optional[Board] = None, game: Optional[Game] = None
+    ) -> None:
         self.stats = stats
-        self._game = Game(board=Board(), stats=stats)
+        if game is None:
+            game = Game(board=board if board is not None else Board(), stats=stats)
+        self._game = game
         self._attempts = 0
 
     @property
@@ -26,20 +45,20 @@ class Engine:
         self._game.reset_game()
         self._attempts = 0
 
-    def index_move_and_update_status(self, index: int) -> Dict[str, Any]:
+    def index_move_and_update_status(self, index: int) -> MoveResult:
         status = self._game.apply_move(index)
         self._attempts += 1
 
-        cells = self._game.board.cells
-        _, _, win_triple = has_winner(cells)
+        if not status.is_over and index < 9 and self._attempts < 10:
+            return _IN_PROGRESS_RESULTS[self._attempts][index]
 
-        return {
-            "placed_index": index,
-            "attempts": self._attempts,
-            "game_over": status.is_over,
-            "winner": status.winner.value if status.winner else "",
-            "win_line": win_triple,
-        }
+        return MoveResult(
+            placed_index=index,
+            attempts=self._attempts,
+            game_over=status.is_over,
+            winner=status.winner.value if status.winner else "",
+            win_line=status.win_line,
+        )
 
     def load_stats(self) -> Stats:
         return self.stats
@@ -1,37 +1,130 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
+from ttt_core.domain import rules
 from ttt_core.domain.board import Board
 from ttt_core.domain.types import GameStatus, Mark
 from ttt_core.engine.stats import Stats
 
+_IN_PROGRESS = GameStatus(winner=None, is_draw=False, is_over=False)
+_DRAWN = GameStatus(winner=None, is_draw=True, is_over=True)
+
+# Move stack entries pack (index, previous occupant, game_over before) into one int.
+_MARK_CODES = {None: 0, Mark.X_MARK: 1, Mark.O_MARK: 2}
+_CODE_MARKS = (None, Mark.X_MARK, Mark.O_MARK)
+
 
 @dataclass
 class Game:
-    """Runs turns and evaluates game outcome."""
+    """Runs turns and evaluates game outcome.
+
+    Keeps per-line occupancy counters for each mark, so a move only checks the
+    lines through the placed cell instead of rescanning the board. make_move and
+    unmake_move let search walk the tree in place without copying the board or
+    recording stats.
+    """
 
     board: Board
     stats: Stats
     current_move_mark: Mark = Mark.X_MARK
     game_over: bool = False
+    move_count: int = field(default=0, init=False)
+    _line_counts: Dict[Mark, List[int]] = field(default_factory=dict, init=False, repr=False)
+    _cell_marks: List[Optional[Mark]] = field(default_factory=list, init=False, repr=False)
+    _geometry: rules.Geometry = field(init=False, repr=False)
+    _move_stack: List[int] = field(default_factory=list, init=False, repr=False)
 
-    def apply_move(self, index: int) -> GameStatus:
-        self.board.place_mark(index, self.current_move_mark)
-        winner = self.board.winner_mark()
-        draw = self.board.is_draw()
+    def __post_init__(self) -> None:
+        self._sync_counters()
 
-        if winner or draw:
-            self.game_over = True
+    def apply_move(self, index: int) -> GameStatus:
+        status = self.make_move(index)
+        if status.is_over:
             self.stats.record_game()
-            if winner == Mark.X_MARK:
+            if status.winner is Mark.X_MARK:
                 self.stats.record_player_win()
-            return GameStatus(winner=winner, is_draw=draw, is_over=True)
+        return status
+
+    def make_move(self, index: int) -> GameStatus:
+        """Play a move without recording stats; undo it with unmake_move."""
+        mark = self.current_move_mark
+        previous = self._cell_marks[index]
+        self._move_stack.append(index << 3 | _MARK_CODES[previous] << 1 | self.game_over)
+        self.board.place_mark(index, mark)
+
+        win_line = None
+        if previous is not mark:
+            self._cell_marks[index] = mark
+            lines_through = self._geometry.lines_through[index]
+            if previous is None:
+                self.move_count += 1
+            else:
+                # Board.place_mark overwrites, so drop the replaced mark from its lines.
+                replaced = self._line_counts[previous]
+                for line_id in lines_through:
+                    replaced[line_id] -= 1
+
+            counts = self._line_counts[mark]
+            win_length = self._geometry.win_length
+            for line_id in lines_through:
+                counts[line_id] += 1
+                if counts[line_id] == win_length:
+                    win_line = self._geometry.lines[line_id]
 
-        self.current_move_mark = (
-            Mark.O_MARK if self.current_move_mark == Mark.X_MARK else Mark.X_MARK
-        )
-        return GameStatus(winner=None, is_draw=False, is_over=False)
+        if win_line:
+            self.game_over = True
+            return GameStatus(winner=mark, is_draw=False, is_over=True, win_line=win_line)
+
+        if self.move_count == self._geometry.cell_count:
+            self.game_over = True
+            return _DRAWN
+
+        self.current_move_mark = Mark.O_MARK if mark is Mark.X_MARK else Mark.X_MARK
+        return _IN_PROGRESS
+
+    def unmake_move(self) -> None:
+        """Undo the latest move: board, counters, current mark and game-over flag."""
+        entry = self._move_stack.pop()
+        index = entry >> 3
+        previous = _CODE_MARKS[entry >> 1 & 3]
+        mark = self._cell_marks[index]
+
+        if previous is not mark:
+            lines_through = self._geometry.lines_through[index]
+            counts = self._line_counts[mark]
+            for line_id in lines_through:
+                counts[line_id] -= 1
+
+            self._cell_marks[index] = previous
+            if previous is None:
+                self.move_count -= 1
+                self.board.remove_mark(index)
+            else:
+                restored = self._line_counts[previous]
+                for line_id in lines_through:
+                    restored[line_id] += 1
+                self.board.place_mark(index, previous)
+
+        self.current_move_mark = mark
+        self.game_over = bool(entry & 1)
 
     def reset_game(self) -> None:
-        self.board.cells = [""] * 9
+        self.board.clear()
         self.current_move_mark = Mark.X_MARK
         self.game_over = False
+        self.move_count = 0
+        line_total = len(self._geometry.lines)
+        self._line_counts = {mark: [0] * line_total for mark in Mark}
+        self._cell_marks = [None] * self._geometry.cell_count
+        self._move_stack = []
+
+    def _sync_counters(self) -> None:
+        self._geometry = rules.geometry(self.board.size, self.board.win_length)
+        cells = self.board.cells
+        self._cell_marks = [Mark(cell) if cell else None for cell in cells]
+        self.move_count = sum(1 for cell in cells if cell)
+        self._line_counts = {
+            mark: [sum(cells[idx] == mark.value for idx in line) for line in self._geometry.lines]
+            for mark in Mark
+        }
+        self._move_stack = []
@@ -0,0 +1,137 @@
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from ttt_core.domain.board import Board
+from ttt_core.engine.engine import Engine
+from ttt_core.engine.game import Game
+from ttt_core.engine.stats import Stats
+
+
+@dataclass
+class SessionStats(Stats):
+    """Stats for one session that also feed a shared aggregate."""
+
+    aggregate: Optional[Stats] = field(default=None, repr=False, compare=False)
+
+    def record_player_win(self) -> None:
+        super().record_player_win()
+        if self.aggregate is not None:
+            self.aggregate.record_player_win()
+
+    def record_game(self) -> None:
+        super().record_game()
+        if self.aggregate is not None:
+            self.aggregate.record_game()
+
+
+class _Session:
+    __slots__ = ("engine", "game", "stats", "last_seen")
+
+    def __init__(self, engine: Engine, game: Game, stats: SessionStats, last_seen: float) -> None:
+        self.engine = engine
+        self.game = game
+        self.stats = stats
+        self.last_seen = last_seen
+
+
+class EngineManager:
+    """Hosts many engine sessions by id, recycling Game/Board objects through a free-list.
+
+    Sessions are kept in least-recently-used order, so expiring idle ones only
+    walks the sessions that actually expire. An Engine returned by get() must not
+    be used after its session is closed or expired: its Game goes back to the pool.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: Optional[float] = None,
+        max_pool_size: int = 10_000,
+        size: int = 3,
+        win_length: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.aggregate_stats = Stats()
+        self._idle_timeout = idle_timeout
+        self._max_pool_size = max_pool_size
+        self._size = size
+        self._win_length = win_length
+        self._clock = clock
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._free_games: List[Game] = []
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    @property
+    def pooled(self) -> int:
+        return len(self._free_games)
+
+    def create_session(self, session_id: Optional[str] = None) -> str:
+        if session_id is None:
+            session_id = f"session-{next(self._ids)}"
+        if session_id in self._sessions:
+            raise ValueError(f"Session already exists: {session_id}")
+
+        stats = SessionStats(aggregate=self.aggregate_stats)
+        if self._free_games:
+            game = self._free_games.pop()
+            game.stats = stats
+            game.reset_game()
+        else:
+            board = Board(size=self._size, win_length=self._win_length)
+            game = Game(board=board, stats=stats)
+
+        engine = Engine(stats=stats, game=game)
+        self._sessions[session_id] = _Session(engine, game, stats, self._clock())
+        return session_id
+
+    def get(self, session_id: str) -> Engine:
+        return self._touch(session_id).engine
+
+    def session_stats(self, session_id: str) -> Stats:
+        return self._touch(session_id).stats
+
+    def reset_session(self, session_id: str) -> None:
+        self._touch(session_id).engine.reset_game()
+
+    def close_session(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise KeyError(f"Unknown session: {session_id}")
+        self._release(session)
+
+    def expire_idle(self, now: Optional[float] = None) -> int:
+        """Close sessions idle for longer than idle_timeout; return how many closed."""
+        if self._idle_timeout is None:
+            return 0
+
+        cutoff = (self._clock() if now is None else now) - self._idle_timeout
+        expired = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_seen > cutoff:
+                break
+            del self._sessions[session_id]
+            self._release(session)
+            expired += 1
+        return expired
+
+    def _touch(self, session_id: str) -> _Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise KeyError(f"Unknown session: {session_id}")
+        session.last_seen = self._clock()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _release(self, session: _Session) -> None:
+        session.stats.aggregate = None
+        if len(self._free_games) < self._max_pool_size:
+            self._free_games.append(session.game)
@@ -12,6 +12,9 @@ from .views.sidebar import SidebarView
 from .views.stats import StatsView
 from .views.title_bar import TitleBar
 
+# The file `ai-training/main.py --save hard_agent` writes, so a retrained model goes live.
+HARD_MODEL_PATH = "ai-training/models/hard_agent.pkl"
+
 
 class TicTacToeUI(CTk):
     """Main Tk application composing views and controller."""
@@ -23,10 +26,12 @@ class TicTacToeUI(CTk):
         self.geometry("600x600")
         self.resizable(False, False)
         self.config(bg="white")
+        self.protocol("WM_DELETE_WINDOW", self._shutdown)
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
         self._controller = GameController()
+        self._controller.preload_models([HARD_MODEL_PATH])
 
         self._assets = self._load_assets()
 
@@ -77,6 +82,10 @@ class TicTacToeUI(CTk):
             arrow_path=paths.arrow_left,
         )
 
+    def _shutdown(self) -> None:
+        self._controller.close()
+        self.destroy()
+
     def _open_stats(self) -> None:
         wins, _games, percent = self._controller.hold_stats()
         self._stats.show_stats(wins=wins, win_percent=percent)
@@ -95,12 +104,12 @@ class TicTacToeUI(CTk):
         self._restart_game()
 
     def _hard_choice(self) -> None:
-        self._controller.set_challenge_mode("ai-training/models/hard_agent.pkl")
+        self._controller.set_challenge_mode(HARD_MODEL_PATH, hot_reload=True)
         self._sidebar.highlight_mode_button(self._sidebar.hard_button)
         self._restart_game()
 
     def _impossible_choice(self) -> None:
-        self._controller.set_challenge_mode("ai-training/models/imp_agent.pkl")
+        self._controller.set_mode_impossible()
         self._sidebar.highlight_mode_button(self._sidebar.imp_button)
         self._restart_game()
 
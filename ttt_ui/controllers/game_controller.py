@@ -1,37 +1,35 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple
-
-from ttt_core.ai.agents import QAgent, RandomAgent
-from ttt_core.engine.engine import Engine
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from ttt_core.ai import perfect_play
+from ttt_core.ai.agents import RandomAgent
+from ttt_core.ai.cache import AgentCache, shared_agent_cache
+from ttt_core.ai.mcts import MCTSAgent
+from ttt_core.ai.reload import ReloadingAgent, ReloadMetrics
+from ttt_core.engine.engine import Engine, MoveResult
 from ttt_core.engine.stats import Stats
 from ttt_ui.services.layout import CELLS
 
 
-@dataclass(frozen=True)
-class MoveResult:
-    placed_index: Optional[int]
-    attempts: int
-    game_over: bool
-    winner: str
-    win_line: Optional[Tuple[int, int, int]]
-
-
 def coord_to_index(click_x: float, click_y: float) -> int:
     """Uses Squared Euclidean Distance"""
-    distances = [
-        (idx, (cell_x - click_x) ** 2 + (cell_y - click_y) ** 2)
-        for idx, (cell_x, cell_y) in enumerate(CELLS)
-    ]
-    return min(distances, key=lambda t: t[1])[0]
+    best_index, best_distance = 0, float("inf")
+    for idx, (cell_x, cell_y) in enumerate(CELLS):
+        distance = (cell_x - click_x) ** 2 + (cell_y - click_y) ** 2
+        if distance < best_distance:
+            best_index, best_distance = idx, distance
+    return best_index
 
 
 class GameController:
     """Handles mode selection and delegates to engine facade."""
 
-    def __init__(self) -> None:
+    def __init__(self, agent_cache: Optional[AgentCache] = None) -> None:
         self._stats = Stats()
         self._engine = Engine(stats=self._stats)
         self._agent: Optional[object] = RandomAgent()
+        self._agent_cache = agent_cache or shared_agent_cache()
+        self._watched: Dict[str, ReloadingAgent] = {}
 
     def set_mode_multi(self) -> None:
         self._agent = None
@@ -39,8 +37,45 @@ class GameController:
     def set_mode_easy(self) -> None:
         self._agent = RandomAgent()
 
-    def set_challenge_mode(self, model_path: str) -> None:
-        self._agent = QAgent(model_path)
+    def set_challenge_mode(self, model_path: str, hot_reload: bool = False) -> None:
+        """Q-agent opponent; with hot_reload a retrained model file goes live between moves."""
+        if not hot_reload:
+            self._agent = self._agent_cache.get(model_path)
+            return
+        watched = self._watched.get(model_path)
+        if watched is None:
+            watched = ReloadingAgent(model_path, loader=self._agent_cache.get)
+            self._watched[model_path] = watched
+        self._agent = watched
+
+    def set_search_mode(
+        self,
+        playouts: Optional[int] = None,
+        time_limit_ms: Optional[float] = None,
+        workers: int = 1,
+    ) -> None:
+        """MCTS opponent whose strength is set by its playout or time budget."""
+        self._agent = MCTSAgent(playouts=playouts, time_limit_ms=time_limit_ms, workers=workers)
+
+    def set_mode_impossible(self) -> None:
+        """Perfect play from the solved table."""
+        self._agent = self._agent_cache.get(str(perfect_play.DEFAULT_TABLE_PATH))
+
+    def preload_models(self, model_paths: Iterable[str]) -> threading.Thread:
+        """Warm the agent cache off the UI thread with these models and the solved table."""
+        return self._agent_cache.preload([*model_paths, str(perfect_play.DEFAULT_TABLE_PATH)])
+
+    def hot_reload_metrics(self) -> Dict[str, ReloadMetrics]:
+        return {path: watched.metrics() for path, watched in self._watched.items()}
+
+    def close(self) -> None:
+        """Stop the hot-reload watchers; a watched model keeps serving its last version."""
+        for watched in self._watched.values():
+            watched.close()
+        self._watched.clear()
+
+    def agent_cache_counters(self) -> Tuple[int, int]:
+        return self._agent_cache.hits, self._agent_cache.misses
 
     def reset_game_engine(self) -> None:
         self._engine.reset_game()
@@ -51,16 +86,12 @@ class GameController:
     def register_click_and_move(self, x: float, y: float) -> MoveResult:
         index = coord_to_index(x, y)
 
-        raw_move_status = self._engine.index_move_and_update_status(index)
-
-        return self._produce_move_result(raw_move_status)
+        return self._engine.index_move_and_update_status(index)
 
     def register_ai_click_and_move(self) -> MoveResult:
         index = self._agent.choose_move(self._engine.expose_board)
 
-        raw_move_status = self._engine.index_move_and_update_status(index)
-
-        return self._produce_move_result(raw_move_status)
+        return self._engine.index_move_and_update_status(index)
 
     def ai_should_move(self) -> bool:
         return self._agent is not None and self.current_shape() == "O"
@@ -73,12 +104,3 @@ class GameController:
         games = self._stats.total_games
 
         return wins, games, self._stats.percent_wins()
-
-    def _produce_move_result(self, raw: dict) -> dict:
-        return MoveResult(
-            placed_index=raw.get("placed_index"),
-            attempts=int(raw.get("attempts", 0)),
-            game_over=bool(raw.get("game_over", False)),
-            winner=str(raw.get("winner") or ""),
-            win_line=raw.get("win_line"),
-        )